@@ -1,154 +1,742 @@
+import math
 import os
 import platform
 import subprocess
+import sys
 import threading
 import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 
-from PyQt5.QtCore import (QTimer, QTime, Qt, QPoint, QPropertyAnimation,
-                          QEasingCurve, QPointF, QParallelAnimationGroup, pyqtSignal, QDateTime)
-from PyQt5.QtGui import (QPainter, QColor, QPen, QPolygonF, QRadialGradient,
-                         QConicalGradient, QPalette, QIcon, QGuiApplication, QCursor)
-from PyQt5.QtWidgets import (QApplication, QWidget, QFrame, QLCDNumber,
+_IMPORT_START = time.perf_counter()
+
+if __name__ == "__main__":
+    # 已有实例在运行时把命令交给它后立即退出，不加载界面相关的模块
+    import single_instance
+    INSTANCE_LOCK = single_instance.claim_or_forward(sys.argv)
+
+from PyQt5.QtCore import (QTimer, QTime, Qt, QPoint, QPropertyAnimation, QVariantAnimation, QAbstractAnimation,
+                          QEasingCurve, QPointF, QParallelAnimationGroup, pyqtSignal, QDateTime, QTimeZone,
+                          QRect, QRectF, QSize, QEvent)
+from PyQt5.QtGui import (QPainter, QColor, QPen, QBrush, QRegion, QTransform, QPolygonF, QRadialGradient,
+                         QConicalGradient, QPalette, QIcon, QGuiApplication, QCursor, QPixmap, QImage, QFont,
+                         QFontMetricsF)
+from PyQt5.QtWidgets import (QApplication, QWidget, QFrame,
                              QGridLayout, QHBoxLayout, QAction, QStyleFactory, qApp, QMenu, QSystemTrayIcon, QLabel,
                              QDialogButtonBox, QLineEdit, QSpinBox, QVBoxLayout, QGroupBox, QCheckBox, QWidgetAction,
-                             QSlider)
+                             QSlider, QStyle, QStyleOption, QActionGroup, QSizePolicy, QMessageBox,
+                             QFileDialog, QDoubleSpinBox)
+from PyQt5 import sip
 import images
-
-
-class DrawClock(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Mac特定样式
-        if platform.system() == 'Darwin':
-            # 调整为更小的尺寸
-            self.setMinimumSize(60, 60)
-            self.setMaximumSize(60, 60)
-            self.bg_color = QColor(230, 230, 230, 220)
-
-            # 调整指针尺寸
-            self.hourHand = [
-                QPointF(3, 0),
-                QPointF(-3, 0),
-                QPointF(-3, -30),  # 缩短长度
-                QPointF(3, -30)
-            ]
-            self.minuteHand = [
-                QPointF(2, 0),
-                QPointF(-2, 0),
-                QPointF(-2, -45),
-                QPointF(2, -45)
-            ]
-            self.secondHand = [
-                QPointF(1, 0),
-                QPointF(-1, 0),
-                QPointF(-1, -50),
-                QPointF(1, -50)
-            ]
+from popup_schedule import PopupSchedule, rules_from_settings, week_seconds
+from settings_store import SettingsStore
+from display_latency import LatencyRecorder
+from perf_counters import PERF, rss_kb
+from event_trace import TRACE, TRACE_ENV, TracingApplication
+import session_state
+import popup_state
+from popup_state import PopupStateMachine
+from time_source import SystemTimeSource
+
+
+class StartupTimeline:
+    """启动时间线：设置 POPUPCLOCK_STARTUP_TIMELINE=1 后，首帧和延迟构建都完成时输出各阶段耗时"""
+    ENV = "POPUPCLOCK_STARTUP_TIMELINE"
+    # 全部到齐后才输出
+    REQUIRED = ('first paint', 'deferred ui')
+
+    def __init__(self, origin, enabled):
+        self.origin = origin
+        self.enabled = enabled
+        self.marks = []
+        self.reported = False
+
+    def mark(self, name):
+        """记录一个阶段，同名阶段只记第一次"""
+        if not self.enabled or self.reported or any(n == name for n, _ in self.marks):
+            return
+        self.marks.append((name, time.perf_counter()))
+        names = [n for n, _ in self.marks]
+        if all(n in names for n in self.REQUIRED):
+            self.report()
+
+    def report(self):
+        self.reported = True
+        previous = self.origin
+        print("启动时间线（毫秒，自模块导入开始）:", file=sys.stderr)
+        for name, stamp in self.marks:
+            print("  %-16s %8.1f  (+%.1f)" % (name, (stamp - self.origin) * 1000, (stamp - previous) * 1000),
+                  file=sys.stderr)
+            previous = stamp
+
+
+STARTUP = StartupTimeline(_IMPORT_START, os.environ.get(StartupTimeline.ENV) == '1')
+
+# 隐藏时最长休眠时间，防止系统时间被调整后错过弹窗
+MAX_IDLE_WAIT_MS = 5 * 60 * 1000
+
+# 走时模式：basic（默认）在整秒时醒来并按常规排队重绘；corrected 按测得的定时器迟到量
+# 提前醒来，忙等到整秒后立即重绘（每秒在界面线程上忙等几毫秒，需要时才打开）
+TIMING_MODES = ('basic', 'corrected')
+TIMING_MODE_ENV = "POPUPCLOCK_TIMING_MODE"
+MIN_TICK_LEAD_MS = 1.0
+MAX_TICK_LEAD_MS = 8.0
+# 两次节拍之间墙上时间和单调时钟走过的时间相差超过这个值，认为系统时间被调整过
+CLOCK_JUMP_MS = 1000
+# 设置后退出时把显示延迟统计导出到这个路径
+LATENCY_EXPORT_ENV = "POPUPCLOCK_LATENCY_EXPORT"
+
+
+def msecs_to_next_second(now):
+    """距离下一个整秒的毫秒数"""
+    return 1000 - now.msec()
+
+
+# 拖动释放后窗口顶部至少离开可用区域顶边的距离（保持低于菜单栏）
+DRAG_TOP_INSET = 40
+
+
+def constrain_to_area(pos, size, area, snap_distance=0, top_inset=0):
+    """把窗口左上角限制在可用区域内，离边缘不超过 snap_distance 时吸附到边缘"""
+    left, top = area.left(), area.top() + top_inset
+    right = area.left() + area.width() - size.width()
+    bottom = area.top() + area.height() - size.height()
+    x, y = pos.x(), pos.y()
+    if snap_distance:
+        if abs(x - left) <= snap_distance:
+            x = left
+        elif abs(x - right) <= snap_distance:
+            x = right
+        if abs(y - top) <= snap_distance:
+            y = top
+        elif abs(y - bottom) <= snap_distance:
+            y = bottom
+    # 窗口比可用区域还大时贴左上角
+    x = max(left, min(x, right))
+    y = max(top, min(y, bottom))
+    return QPoint(x, y)
+
+
+def week_position(now):
+    """QDateTime 在一周内的秒数（本地时间，周一 00:00:00 为 0）"""
+    time = now.time()
+    return week_seconds(now.date().dayOfWeek(), time.hour(), time.minute(), time.second())
+
+
+def msecs_to_next_popup_edge(schedule, now):
+    """距离下一个弹窗开始时刻的毫秒数，没有弹窗时段时返回 None"""
+    edge = schedule.next_edge(week_position(now), 'show')
+    if edge is None:
+        return None
+    # 正好处于边界的这一秒已经处理过，next_edge 返回的是之后的边界
+    return edge[0] * 1000 - now.time().msec()
+
+
+# 弹窗样式表，两个平台只有数字面板的字体不同
+POPUP_STYLESHEET = """
+    QFrame#frame1 {
+        background: qradialgradient(
+            cx:0.5, cy:0.5, radius: 2,
+            fx:0.5, fy:0.5,
+            stop:0 rgba(189, 189, 189, 255),
+            stop:1 rgba(150, 150, 150, 200)
+        );
+        border-radius:22px;
+        border: 1px solid rgba(255,255,255,100);
+    }
+    QFrame#frame_3 {
+        background-color:rgba(230, 230, 230, 220);
+        border-radius:22px;
+        border: 1px solid rgba(0,0,0,30);
+    }
+    GlyphTimeDisplay {
+        background:transparent;
+        color: #111;
+        min-width: 120px;
+        font: %(lcd_font)s;
+    }
+"""
+
+
+@dataclass(frozen=True)
+class PlatformProfile:
+    """启动时解析一次的平台配置，所有尺寸、指针形状、颜色和样式表都从这里读取"""
+    name: str
+    window_size: tuple  # 弹窗尺寸 (宽, 高)
+    window_margin: int  # 主布局边距
+    frame_margin: int  # 背景框架内边距
+    clock_size: int  # 表盘控件边长
+    dial_scale_divisor: float  # 表盘坐标系的参考直径
+    dial_gradient_radius: float
+    dial_radius: float
+    dial_color: tuple  # RGBA
+    bg_color: tuple  # RGBA
+    hour_hand: tuple  # 指针多边形顶点 ((x, y), ...)
+    minute_hand: tuple
+    second_hand: tuple
+    lcd_font: str  # 数字面板字体（QSS font 简写）
+    lcd_font_override: bool  # 是否在数字面板上单独设置字体
+    show_offset: tuple  # 显示位置相对可用区域左上角的偏移，None 表示屏幕原点
+    tray_icon_path: str
+    tray_submenu: bool  # 托盘菜单是否放在子菜单里（Mac需要）
+    mac_tool_window: bool  # 使用 macOS 的工具窗口标志和属性
+
+    @property
+    def window_width(self):
+        return self.window_size[0]
+
+    @property
+    def stylesheet(self):
+        return POPUP_STYLESHEET % {'lcd_font': self.lcd_font}
+
+
+def hand_polygon(half_width, length):
+    return (half_width, 0), (-half_width, 0), (-half_width, -length), (half_width, -length)
+
+
+PROFILES = {
+    'windows': PlatformProfile(
+        name='windows',
+        window_size=(450, 150),
+        window_margin=20,
+        frame_margin=20,
+        clock_size=90,
+        dial_scale_divisor=220.0,  # 调整缩放比例
+        dial_gradient_radius=110,
+        dial_radius=110,
+        dial_color=(230, 230, 230, 255),
+        bg_color=(230, 230, 230, 220),
+        hour_hand=hand_polygon(4, 50),
+        minute_hand=hand_polygon(3, 80),
+        second_hand=hand_polygon(1, 100),
+        lcd_font="bold 18px 'Arial Black'",
+        lcd_font_override=False,
+        show_offset=None,
+        tray_icon_path=":/touxiang.ico",
+        tray_submenu=False,
+        mac_tool_window=False,
+    ),
+    # Mac特定样式：更紧凑的尺寸、缩短的指针
+    'darwin': PlatformProfile(
+        name='darwin',
+        window_size=(300, 80),
+        window_margin=10,
+        frame_margin=10,
+        clock_size=60,
+        dial_scale_divisor=150.0,
+        dial_gradient_radius=70,
+        dial_radius=75,  # 减小背景圆尺寸
+        dial_color=(230, 230, 230, 255),
+        bg_color=(230, 230, 230, 220),
+        hour_hand=hand_polygon(3, 30),
+        minute_hand=hand_polygon(2, 45),
+        second_hand=hand_polygon(1, 50),
+        lcd_font="bold 18px 'Helvetica'",
+        lcd_font_override=True,
+        show_offset=(20, 40),  # 留出 20px 边距和菜单栏下方空间
+        tray_icon_path=":/touxiang.icns",  # 需要准备icns格式的图标
+        tray_submenu=True,
+        mac_tool_window=True,
+    ),
+}
+
+PROFILE_ENV = "POPUPCLOCK_PROFILE"
+_current_profile = None
+
+
+def option_value(argv, flag):
+    """读取形如 --flag value 或 --flag=value 的命令行参数，没有时返回 None"""
+    value = None
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith(flag + '='):
+            value = arg.split('=', 1)[1]
+    return value
+
+
+def resolve_profile(argv=None, environ=None):
+    """按 命令行 --profile > 环境变量 POPUPCLOCK_PROFILE > 当前系统 的顺序选择配置"""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    name = option_value(argv, '--profile')
+    if name is None:
+        name = environ.get(PROFILE_ENV)
+    if name is None:
+        name = 'darwin' if platform.system() == 'Darwin' else 'windows'
+    name = name.lower()
+    if name not in PROFILES:
+        raise ValueError("未知的平台配置 %r，可选：%s" % (name, ', '.join(sorted(PROFILES))))
+    return PROFILES[name]
+
+
+# 这些设置项变化时需要重新编译弹窗规则
+SCHEDULE_KEYS = ('schedule_rules', 'time_second', 'time_minute', 'time_hour', 'time_week')
+
+# 进入/退出动画的模式：
+#   classic  - 同时移动位置和改变窗口透明度（原有效果）
+#   snapshot - 效果同 classic，但过渡期间只显示一张快照，子控件全部冻结
+#   geometry - 只移动位置，透明度在过渡前后一次性切换
+#   opacity  - 只改变透明度，窗口原地淡入淡出
+ANIMATION_MODES = ('classic', 'snapshot', 'geometry', 'opacity')
+ANIMATION_MODE_ENV = "POPUPCLOCK_ANIMATION_MODE"
+
+
+# 指针的绘制方式：
+#   vector - 每帧抗锯齿绘制指针多边形
+#   sprite - 每个离散角度的指针预先栅格化成精灵，每帧只做贴图（见 HandAtlas）
+HAND_RENDER_MODES = ('vector', 'sprite')
+HAND_RENDER_ENV = "POPUPCLOCK_HAND_RENDER"
+
+
+def resolve_animation_mode(argv=None, environ=None, default='classic'):
+    """按 命令行 --animation-mode > 环境变量 POPUPCLOCK_ANIMATION_MODE > default 的顺序选择动画模式"""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    mode = option_value(argv, '--animation-mode') or environ.get(ANIMATION_MODE_ENV) or default
+    mode = mode.lower()
+    if mode not in ANIMATION_MODES:
+        raise ValueError("未知的动画模式 %r，可选：%s" % (mode, ', '.join(ANIMATION_MODES)))
+    return mode
+
+
+def resolve_hand_render(argv=None, environ=None, default='vector'):
+    """按 命令行 --hand-render > 环境变量 POPUPCLOCK_HAND_RENDER > default 的顺序选择指针绘制方式"""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    mode = option_value(argv, '--hand-render') or environ.get(HAND_RENDER_ENV) or default
+    mode = mode.lower()
+    if mode not in HAND_RENDER_MODES:
+        raise ValueError("未知的指针绘制方式 %r，可选：%s" % (mode, ', '.join(HAND_RENDER_MODES)))
+    return mode
+
+
+def resolve_timing_mode(argv=None, environ=None, default='basic'):
+    """按 命令行 --timing-mode > 环境变量 POPUPCLOCK_TIMING_MODE > default 的顺序选择走时模式"""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    mode = option_value(argv, '--timing-mode') or environ.get(TIMING_MODE_ENV) or default
+    mode = mode.lower()
+    if mode not in TIMING_MODES:
+        raise ValueError("未知的走时模式 %r，可选：%s" % (mode, ', '.join(TIMING_MODES)))
+    return mode
+
+
+def resolve_trace_path(argv=None, environ=None):
+    """按 命令行 --trace > 环境变量 POPUPCLOCK_TRACE 的顺序取跟踪文件路径，没有时不跟踪"""
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    return option_value(argv, '--trace') or environ.get(TRACE_ENV) or None
+
+
+def current_profile():
+    global _current_profile
+    if _current_profile is None:
+        _current_profile = resolve_profile()
+    return _current_profile
+
+
+def set_profile(profile):
+    """强制使用指定配置（名称或 PlatformProfile），之后创建的控件都会使用它"""
+    global _current_profile
+    _current_profile = PROFILES[profile] if isinstance(profile, str) else profile
+
+
+def hand_angles(time):
+    """时、分、秒针的角度"""
+    hour, minute, second = time.hour(), time.minute(), time.second()
+    # 时针包含分钟的影响，分针包含秒的影响；时针按 12 小时取模，下午与上午共用同样的角度（和按角度的缓存）
+    return 30.0 * (hour % 12 + minute / 60.0), 6.0 * (minute + second / 60.0), 6.0 * second
+
+
+def region_area(region):
+    return sum(rect.width() * rect.height() for rect in region.rects())
+
+
+class DialCache:
+    """按 (尺寸, DPR, 平台配置) 共享的表盘栅格缓存，同尺寸的表盘只栅格化一次"""
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.builds = 0  # 栅格化次数，供基准统计
+
+    def get(self, key, build):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = build()
+            self.builds += 1
+            self.entries[key] = entry
+            # 尺寸/DPR变化后旧条目不再使用，按最近使用顺序淘汰
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
         else:
-            self.setMinimumSize(90, 90)
-            self.setMaximumSize(90, 90)
-            # 背景色
-            self.bg_color = QColor(230, 230, 230, 220)
-
-            # 指针形状定义
-            self.hourHand = [
-                QPointF(4, 0),
-                QPointF(-4, 0),
-                QPointF(-4, -50),
-                QPointF(4, -50)
-            ]
-            self.minuteHand = [
-                QPointF(3, 0),
-                QPointF(-3, 0),
-                QPointF(-3, -80),
-                QPointF(3, -80)
-            ]
-            self.secondHand = [
-                QPointF(1, 0),
-                QPointF(-1, 0),
-                QPointF(-1, -100),
-                QPointF(1, -100)
-            ]
-
-        self.time = QTime.currentTime()
-
-    def set_time(self, time):
-        self.time = time
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+            self.entries.move_to_end(key)
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+
+
+DIAL_CACHE = DialCache()
+
+# 各指针能取到的角度间隔：时针按分钟（0.5 度）、分针按秒（0.1 度）、秒针按秒（6 度）
+HAND_ANGLE_STEPS = (0.5, 0.1, 6.0)
+HAND_NAMES = ("时针", "分针", "秒针")
+# 图集容量不够时优先放哪根指针的整套精灵：秒针最小、每秒都动，其次时针
+HAND_SPRITE_PRIORITY = (2, 0, 1)
+
+
+class HandAtlas:
+    """预先栅格化的指针精灵，按总字节数设上限、最近最少使用淘汰
+
+    每张精灵只裁到指针在该角度下的包围盒，一个尺寸的全部角度是秒针 60 张、
+    时针 720 张、分针 3600 张。精灵先画到透明底再合成，和直接绘制的结果
+    不完全相同，每个通道最多差 2/255（合成时的舍入），比较图像时要留出容差。
+    旋转贴图比直接画指针还慢，所以四个象限都单独栅格化，而不是共用一张再旋转。
+
+    指针按固定的顺序循环经过所有角度，一整套装不下时 LRU 总是恰好淘汰下一张
+    要用的精灵，每帧都要重新栅格化。所以按尺寸和 DPR 先算出每根指针整套精灵
+    的字节数（plan），按 HAND_SPRITE_PRIORITY 整套放入容量，放不下的那根指针
+    改为矢量绘制，并在统计里注明。
+    """
+
+    def __init__(self, capacity_bytes=8 * 1024 * 1024):
+        self.capacity_bytes = capacity_bytes
+        self.entries = OrderedDict()  # 键 -> (精灵, 左上角, 字节数)
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.plans = {}  # (宽, 高, DPR, 配置名) -> 每根指针是否使用精灵
+        self.vector_hands = ()  # 最近一次规划里因容量不足改为矢量绘制的指针名
+
+    def get(self, key, build):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        sprite, top_left = build()
+        entry = (sprite, top_left, sprite.width() * sprite.height() * sprite.depth() // 8)
+        self.entries[key] = entry
+        self.bytes += entry[2]
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        self.trim()
+        return entry
+
+    def trim(self):
+        # 至少保留刚放进去的一张
+        while self.bytes > self.capacity_bytes and len(self.entries) > 1:
+            _, entry = self.entries.popitem(last=False)
+            self.bytes -= entry[2]
+            self.evictions += 1
+
+    def plan(self, set_key, set_bytes):
+        """set_key 这个尺寸下哪些指针使用精灵，返回按指针序号排列的布尔元组
+
+        set_bytes(index) 给出该指针全部角度精灵的字节数，每个尺寸只算一次。
+        """
+        plan = self.plans.get(set_key)
+        if plan is None:
+            budget = self.capacity_bytes
+            use = [False] * len(HAND_NAMES)
+            for index in HAND_SPRITE_PRIORITY:
+                size = set_bytes(index)
+                if size <= budget:
+                    use[index] = True
+                    budget -= size
+            plan = self.plans[set_key] = tuple(use)
+            self.vector_hands = tuple(HAND_NAMES[i] for i, used in enumerate(plan) if not used)
+            if self.vector_hands:
+                print("指针图集容量 %.1f MB 放不下整套精灵，%s改为矢量绘制（可调大设置项 hand_atlas_mb）"
+                      % (self.capacity_bytes / 1048576.0, "、".join(self.vector_hands)))
+        return plan
+
+    def set_capacity(self, capacity_bytes):
+        if capacity_bytes != self.capacity_bytes:
+            self.plans.clear()
+        self.capacity_bytes = capacity_bytes
+        self.trim()
+
+    def clear(self):
+        self.entries.clear()
+        self.plans.clear()
+        self.vector_hands = ()
+        self.bytes = 0
+
+    def summary(self):
+        return {'sprites': len(self.entries), 'bytes': self.bytes, 'peak_bytes': self.peak_bytes,
+                'capacity_bytes': self.capacity_bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'vector_hands': list(self.vector_hands)}
+
+    def report_text(self):
+        text = ("指针图集：%(sprites)d 张精灵，%(bytes)d / %(capacity_bytes)d 字节（峰值 %(peak_bytes)d），"
+                "命中 %(hits)d，栅格化 %(misses)d，淘汰 %(evictions)d" % self.summary())
+        if self.vector_hands:
+            text += "；容量不足，%s按矢量绘制" % "、".join(self.vector_hands)
+        return text
+
+
+HAND_ATLAS = HandAtlas()
+
+
+class ClockFace:
+    """表盘的绘制逻辑，不依赖控件；DrawClock 和多表盘容器共用"""
+
+    def __init__(self, profile):
+        self.profile = profile
+        # 指针多边形只构造一次
+        self.hourHand = QPolygonF([QPointF(x, y) for x, y in profile.hour_hand])
+        self.minuteHand = QPolygonF([QPointF(x, y) for x, y in profile.minute_hand])
+        self.secondHand = QPolygonF([QPointF(x, y) for x, y in profile.second_hand])
+        # 画笔和画刷同样复用，避免每帧从全局颜色构造
+        self.hand_pen, self.hand_brush = QPen(Qt.black), QBrush(Qt.black)
+        self.second_pen, self.second_brush = QPen(Qt.red), QBrush(Qt.red)
+        self._hand_rects = {}
+        self._sprite_keys = {}
+        self.hand_render = 'vector'  # 见 HAND_RENDER_MODES
+
+    def scale_for(self, width, height):
+        """表盘坐标系到像素的缩放比例"""
+        return min(width, height) / self.profile.dial_scale_divisor
+
+    def hand_polygons(self):
+        return self.hourHand, self.minuteHand, self.secondHand
+
+    def dirty_region(self, width, height, old_angles, new_angles, margin=2):
+        """指针从 old_angles 转到 new_angles 需要重绘的区域（控件坐标）
+
+        只包含真正转动了的指针，每根指针取新旧两个位置经过平移/缩放/旋转后的
+        包围盒并集，外扩 margin 像素覆盖抗锯齿边缘；中心点画在指针之上，一并重绘。
+        """
+        scale = self.scale_for(width, height)
+        region = QRegion()
+        for index, (old, new) in enumerate(zip(old_angles, new_angles)):
+            if old == new:
+                continue
+            rect = self.hand_rect(index, old, width, height, margin).united(
+                self.hand_rect(index, new, width, height, margin))
+            region += rect
+        if not region.isEmpty():
+            cap_radius = 5 * scale + margin
+            region += QRectF(width / 2 - cap_radius, height / 2 - cap_radius,
+                             cap_radius * 2, cap_radius * 2).toAlignedRect()
+        return region
+
+    def hand_rect(self, index, angle, width, height, margin):
+        """某根指针在某个角度下的像素包围盒，按角度缓存（秒针60个、分针3600个、时针720个）"""
+        key = (index, angle, width, height, margin)
+        rect = self._hand_rects.get(key)
+        if rect is None:
+            if len(self._hand_rects) > 8192:
+                self._hand_rects.clear()
+            rect = self._hand_rects[key] = self.compute_hand_rect(index, angle, width, height, margin)
+        return rect
+
+    def compute_hand_rect(self, index, angle, width, height, margin):
+        scale = self.scale_for(width, height)
+        transform = QTransform()
+        transform.translate(width / 2, height / 2)
+        transform.scale(scale, scale)
+        transform.rotate(angle)
+        bounds = transform.map(self.hand_polygons()[index]).boundingRect()
+        return bounds.adjusted(-margin, -margin, margin, margin).toAlignedRect()
+
+    def dial_layers(self, width, height, dpr):
+        """从共享缓存取 (表盘层, 中心点层, 中心点层偏移)，缓存里没有时才栅格化"""
+        key = (width, height, dpr, self.profile.name)
+        return DIAL_CACHE.get(key, lambda: self.render_dial_layers(width, height, dpr))
+
+    def render_dial_layers(self, width, height, dpr, image=False):
+        """把背景和中心点栅格化到离屏位图，之后每帧只做合成
+
+        image=True 时生成 QImage 而不是 QPixmap，可以在非 GUI 线程里使用（离线导出）。
+        """
+        scale = self.scale_for(width, height)
+
+        def surface(w, h):
+            if image:
+                return QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+            return QPixmap(w, h)
+
+        dial = surface(max(1, int(round(width * dpr))), max(1, int(round(height * dpr))))
+        dial.setDevicePixelRatio(dpr)
+        dial.fill(Qt.transparent)
+        painter = QPainter(dial)
         painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
-
-        # 居中坐标系
-        painter.translate(self.width() / 2, self.height() / 2)
-        # Mac特定样式
-        if platform.system() == 'Darwin':
-            scale = min(self.width(), self.height()) / 150.0
-        else:
-            scale = min(self.width(), self.height()) / 220.0  # 调整缩放比例
+        painter.translate(width / 2, height / 2)
         painter.scale(scale, scale)
-
-        # 绘制背景
         self.draw_background(painter)
+        painter.end()
+
+        # 中心点画在指针之上，单独缓存一块只覆盖中心点的小位图
+        cap_radius = 5 * scale + 1
+        cap_side = int(cap_radius * 2) + 2
+        cap = surface(max(1, int(round(cap_side * dpr))), max(1, int(round(cap_side * dpr))))
+        cap.setDevicePixelRatio(dpr)
+        cap.fill(Qt.transparent)
+        painter = QPainter(cap)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.translate(cap_side / 2, cap_side / 2)
+        painter.scale(scale, scale)
+        self.draw_centre(painter)
+        painter.end()
+        cap_offset = QPointF(width / 2 - cap_side / 2, height / 2 - cap_side / 2)
 
-        # 获取当前时间
-        time = QTime.currentTime()
+        return dial, cap, cap_offset
 
-        # 绘制指针
-        self.draw_hour_hand(painter, time)
-        self.draw_minute_hand(painter, time)
-        self.draw_second_hand(painter, time)
+    def paint(self, painter, origin, width, height, angles, layers):
+        """在 origin 处合成一个表盘：缓存背景 + 三根指针 + 缓存中心点"""
+        dial, cap, cap_offset = layers
+        draw_layer = painter.drawImage if isinstance(dial, QImage) else painter.drawPixmap
+        draw_layer(origin, dial)
 
-        # 绘制中心点
-        self.draw_centre(painter)
+        if self.hand_render == 'sprite':
+            self.blit_hands(painter, origin, width, height, angles)
+        else:
+            # 居中坐标系
+            painter.save()
+            painter.translate(origin.x() + width / 2, origin.y() + height / 2)
+            scale = self.scale_for(width, height)
+            painter.scale(scale, scale)
+
+            # 绘制指针
+            hour_angle, minute_angle, second_angle = angles
+            self.draw_hour_hand(painter, hour_angle)
+            self.draw_minute_hand(painter, minute_angle)
+            self.draw_second_hand(painter, second_angle)
+            painter.restore()
+
+        # 绘制缓存的中心点
+        draw_layer(origin + cap_offset, cap)
+
+    def sprite_key(self, index, angle):
+        """角度在该指针离散角度中的序号；不在离散角度上（如平滑秒针）时返回 None"""
+        cache_key = (index, angle)
+        key = self._sprite_keys.get(cache_key, -1)
+        if key == -1:
+            if len(self._sprite_keys) > 8192:
+                self._sprite_keys.clear()
+            step = HAND_ANGLE_STEPS[index]
+            steps = (angle % 360.0) / step
+            key = int(round(steps))
+            if abs(steps - key) > 1e-6:
+                key = None
+            else:
+                key %= int(round(360.0 / step))
+            self._sprite_keys[cache_key] = key
+        return key
+
+    def sprite_set_bytes(self, index, width, height, dpr):
+        """一根指针全部离散角度精灵的字节数（与 render_hand_sprite 的尺寸一致，32 位像素）
+
+        不经过 hand_rect 的缓存，免得几千个只用一次的包围盒把它挤满。
+        """
+        step = HAND_ANGLE_STEPS[index]
+        total = 0
+        for key in range(int(round(360.0 / step))):
+            rect = self.compute_hand_rect(index, key * step, width, height, 1)
+            total += max(1, int(round(rect.width() * dpr))) * max(1, int(round(rect.height() * dpr))) * 4
+        return total
+
+    def sprite_plan(self, width, height, dpr):
+        return HAND_ATLAS.plan((width, height, dpr, self.profile.name),
+                               lambda index: self.sprite_set_bytes(index, width, height, dpr))
+
+    def hand_sprite(self, index, key, width, height, dpr):
+        return HAND_ATLAS.get((width, height, dpr, self.profile.name, index, key),
+                              lambda: self.render_hand_sprite(index, key * HAND_ANGLE_STEPS[index],
+                                                              width, height, dpr))
+
+    def render_hand_sprite(self, index, angle, width, height, dpr):
+        """把一根指针按 angle 栅格化到只包住它的小位图，返回 (位图, 在表盘中的左上角)"""
+        rect = self.hand_rect(index, angle, width, height, 1)
+        sprite = QPixmap(max(1, int(round(rect.width() * dpr))), max(1, int(round(rect.height() * dpr))))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        # 包围盒左上角是整数像素，抗锯齿的采样位置与直接绘制时相同
+        painter.translate(width / 2 - rect.x(), height / 2 - rect.y())
+        scale = self.scale_for(width, height)
+        painter.scale(scale, scale)
+        (self.draw_hour_hand, self.draw_minute_hand, self.draw_second_hand)[index](painter, angle)
+        painter.end()
+        return sprite, QPointF(rect.topLeft())
+
+    def blit_hands(self, painter, origin, width, height, angles):
+        """sprite 模式：三根指针各贴一张精灵；非整数 DPR 或不在离散角度上的指针仍按矢量绘制"""
+        dpr = painter.device().devicePixelRatioF()
+        draw = (self.draw_hour_hand, self.draw_minute_hand, self.draw_second_hand)
+        plan = self.sprite_plan(width, height, dpr) if dpr == int(dpr) else (False,) * 3
+        for index, angle in enumerate(angles):
+            key = self.sprite_key(index, angle) if plan[index] else None
+            if key is None:
+                painter.save()
+                painter.translate(origin.x() + width / 2, origin.y() + height / 2)
+                scale = self.scale_for(width, height)
+                painter.scale(scale, scale)
+                draw[index](painter, angle)
+                painter.restore()
+            else:
+                sprite, top_left, _ = self.hand_sprite(index, key, width, height, dpr)
+                painter.drawPixmap(origin + top_left, sprite)
+
+    def prewarm_sprites(self, width, height, dpr):
+        """逐张栅格化所有离散角度的精灵（生成器，每产出一次完成一张，便于分批执行）
+
+        只预热 sprite_plan 里使用精灵的指针；其他尺寸的精灵占着容量时，一旦开始
+        淘汰就停止，不把已经预热的挤出去。
+        """
+        plan = self.sprite_plan(width, height, dpr)
+        evictions = HAND_ATLAS.evictions
+        for index in HAND_SPRITE_PRIORITY:
+            if not plan[index]:
+                continue
+            for key in range(int(round(360.0 / HAND_ANGLE_STEPS[index]))):
+                self.hand_sprite(index, key, width, height, dpr)
+                if HAND_ATLAS.evictions != evictions:
+                    return
+                yield
 
     def draw_background(self, painter):
-        if platform.system() == 'Darwin':
-            # # 径向渐变背景
-            radial = QRadialGradient(QPointF(0, 0), 70, QPointF(0, 0))
-        else:
-            radial = QRadialGradient(QPointF(0, 0), 110, QPointF(0, 0))
-        radial.setColorAt(1, QColor(230, 230, 230, 255))
-        radial.setColorAt(0.9, QColor(230, 230, 230, 255))
+        # 径向渐变背景
+        radial = QRadialGradient(QPointF(0, 0), self.profile.dial_gradient_radius, QPointF(0, 0))
+        dial_color = QColor(*self.profile.dial_color)
+        radial.setColorAt(1, dial_color)
+        radial.setColorAt(0.9, dial_color)
 
         painter.setPen(Qt.NoPen)
         painter.setBrush(radial)
-        if platform.system() == 'Darwin':
-            painter.drawEllipse(QPointF(0, 0), 75, 75)  # 减小背景圆尺寸
-        else:
-            painter.drawEllipse(QPointF(0, 0), 110, 110)
+        radius = self.profile.dial_radius
+        painter.drawEllipse(QPointF(0, 0), radius, radius)
 
-    def draw_hour_hand(self, painter, time):
+    def draw_hour_hand(self, painter, angle):
         painter.save()
-        # 计算时针角度（包含分钟的影响）
-        angle = 30.0 * (time.hour() + time.minute() / 60.0)
         painter.rotate(angle)
 
-        painter.setPen(Qt.black)
-        painter.setBrush(Qt.black)
-        painter.drawConvexPolygon(QPolygonF(self.hourHand))
+        painter.setPen(self.hand_pen)
+        painter.setBrush(self.hand_brush)
+        painter.drawConvexPolygon(self.hourHand)
         painter.restore()
 
-    def draw_minute_hand(self, painter, time):
+    def draw_minute_hand(self, painter, angle):
         painter.save()
-        # 计算分针角度（包含秒的影响）
-        angle = 6.0 * (time.minute() + time.second() / 60.0)
         painter.rotate(angle)
 
-        painter.setPen(Qt.black)
-        painter.setBrush(Qt.black)
-        painter.drawConvexPolygon(QPolygonF(self.minuteHand))
+        painter.setPen(self.hand_pen)
+        painter.setBrush(self.hand_brush)
+        painter.drawConvexPolygon(self.minuteHand)
         painter.restore()
 
-    def draw_second_hand(self, painter, time):
+    def draw_second_hand(self, painter, angle):
         painter.save()
-        angle = 6.0 * time.second()
         painter.rotate(angle)
 
-        painter.setPen(Qt.red)
-        painter.setBrush(Qt.red)
-        painter.drawConvexPolygon(QPolygonF(self.secondHand))
+        painter.setPen(self.second_pen)
+        painter.setBrush(self.second_brush)
+        painter.drawConvexPolygon(self.secondHand)
         painter.restore()
 
     def draw_centre(self, painter):
@@ -164,6 +752,521 @@ class DrawClock(QWidget):
         painter.drawEllipse(-5, -5, 10, 10)
 
 
+class DrawClock(QWidget):
+    def __init__(self, parent=None, profile=None):
+        super().__init__(parent)
+        self.profile = profile or current_profile()
+        self.setMinimumSize(self.profile.clock_size, self.profile.clock_size)
+        self.setMaximumSize(self.profile.clock_size, self.profile.clock_size)
+        # 背景色
+        self.bg_color = QColor(*self.profile.bg_color)
+
+        self.face = ClockFace(self.profile)
+        self.time = QTime.currentTime()
+        self.angles = hand_angles(self.time)
+
+        # 当前使用的表盘缓存：(缓存键, 表盘层, 中心点层, 中心点层偏移)
+        self._dial_cache = None
+        self._screen_hooked = False
+
+        self.last_dirty_region = QRegion()
+        self._prewarm = None  # sprite 模式下分批预热指针图集的生成器
+        self.reset_paint_stats()
+
+    def reset_paint_stats(self):
+        """重绘面积计数：请求重绘的面积、按整控件重绘应有的面积、实际绘制的面积"""
+        self.paint_stats = {
+            'updates': 0,  # set_time 触发的重绘请求次数
+            'requested_area': 0,  # 脏区域面积之和（像素）
+            'full_area': 0,  # 同样次数整控件重绘的面积之和
+            'paints': 0,  # paintEvent 次数
+            'painted_area': 0,  # paintEvent 实际区域面积之和
+        }
+
+    def set_time(self, time):
+        self.time = time
+        self.set_angles(hand_angles(time))
+
+    def set_angles(self, angles):
+        """直接设置指针角度，只重绘转动了的指针覆盖的区域"""
+        if angles == self.angles:
+            return
+        old_angles, self.angles = self.angles, angles
+        region = self.face.dirty_region(self.width(), self.height(), old_angles, angles)
+        region &= QRegion(self.rect())
+        self.last_dirty_region = region
+
+        stats = self.paint_stats
+        stats['updates'] += 1
+        stats['requested_area'] += region_area(region)
+        stats['full_area'] += self.width() * self.height()
+        self.update(region)
+
+    def set_hand_render(self, mode):
+        """切换指针绘制方式；sprite 时在空闲时分批预先栅格化所有角度"""
+        if mode not in HAND_RENDER_MODES:
+            raise ValueError("未知的指针绘制方式 %r" % (mode,))
+        self.face.hand_render = mode
+        self._prewarm = None
+        if mode == 'sprite':
+            QTimer.singleShot(0, self.prewarm_step)
+        self.update()
+
+    def prewarm_step(self, batch=64):
+        # 非整数 DPR 下 sprite 模式退回矢量绘制，不需要预热
+        if self.face.hand_render != 'sprite' or self.devicePixelRatioF() != int(self.devicePixelRatioF()):
+            return
+        if self._prewarm is None:
+            self._prewarm = self.face.prewarm_sprites(self.width(), self.height(), self.devicePixelRatioF())
+        for _ in range(batch):
+            if next(self._prewarm, StopIteration) is StopIteration:
+                self._prewarm = None
+                return
+        QTimer.singleShot(0, self.prewarm_step)
+
+    def dial_scale(self):
+        """表盘坐标系到控件像素的缩放比例"""
+        return self.face.scale_for(self.width(), self.height())
+
+    def dial_cache_key(self):
+        """缓存键：尺寸、设备像素比和平台配置任一变化都需要重新栅格化"""
+        return self.width(), self.height(), self.devicePixelRatioF(), self.profile.name
+
+    def invalidate_dial_cache(self, *args):
+        self._dial_cache = None
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._dial_cache = None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 窗口换屏（DPR可能变化）时丢弃缓存
+        handle = self.window().windowHandle()
+        if handle is not None and not self._screen_hooked:
+            handle.screenChanged.connect(self.invalidate_dial_cache)
+            self._screen_hooked = True
+
+    def ensure_dial_cache(self):
+        key = self.dial_cache_key()
+        if self._dial_cache is None or self._dial_cache[0] != key:
+            self._dial_cache = (key,) + self.face.dial_layers(*key[:3])
+        return self._dial_cache
+
+    def paintEvent(self, event):
+        if STARTUP.enabled and not STARTUP.reported:
+            STARTUP.mark('first paint')
+        started = time.perf_counter() if PERF.enabled else None
+        self.paint_stats['paints'] += 1
+        self.paint_stats['painted_area'] += region_area(event.region())
+        layers = self.ensure_dial_cache()[1:]
+
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        # 角度在 set_time/set_angles 时已算好
+        self.face.paint(painter, QPointF(0, 0), self.width(), self.height(), self.angles, layers)
+        if started is not None:
+            painter.end()
+            PERF.paint('clock', time.perf_counter() - started)
+
+
+class MultiClockWidget(QWidget):
+    """多表盘容器（如一排世界时钟）：一个时间源驱动 N 个表盘
+
+    zones 为时区列表，元素是 IANA 时区名（如 "Asia/Tokyo"）或 None（本地时间）。
+    每次 set_time 每个时区只换算一次时间，所有指针角度一次算完；
+    所有表盘在同一次 paintEvent 里合成，共享同一张表盘位图，
+    只有指针角度变化的格子才会被重绘。
+
+    表盘位图共享之后，每个格子的开销主要是三根指针：vector 模式下每格都要
+    画三个抗锯齿多边形，N 个表盘的一次节拍大约是单个表盘的 N 倍；sprite 模式
+    从共享的 HAND_ATLAS 贴图，每格只剩一次表盘贴图加三次小图贴图（容量放不下
+    的指针仍按矢量绘制，见 HandAtlas）。
+    """
+
+    def __init__(self, zones, parent=None, profile=None, columns=0, spacing=6, hand_render='vector'):
+        super().__init__(parent)
+        self.profile = profile or current_profile()
+        self.face = ClockFace(self.profile)
+        self.set_hand_render(hand_render)
+        self.zones = list(zones)
+        self.columns = columns or max(1, len(self.zones))
+        self.spacing = spacing
+        # 不同时区对象只构造一次
+        self._time_zones = {zone: QTimeZone(zone.encode()) for zone in set(self.zones) if zone}
+        self.times = [QTime.currentTime()] * len(self.zones)
+        self.angles = [hand_angles(t) for t in self.times]
+
+    def sizeHint(self):
+        size = self.profile.clock_size
+        rows = (len(self.zones) + self.columns - 1) // self.columns
+        columns = min(self.columns, len(self.zones))
+        return QSize(columns * size + max(0, columns - 1) * self.spacing,
+                     rows * size + max(0, rows - 1) * self.spacing)
+
+    def set_hand_render(self, mode):
+        """切换指针绘制方式（见 HAND_RENDER_MODES）；所有格子共用同一份指针精灵"""
+        if mode not in HAND_RENDER_MODES:
+            raise ValueError("未知的指针绘制方式 %r" % (mode,))
+        self.face.hand_render = mode
+        self.update()
+
+    def prewarm_sprites(self):
+        """sprite 模式下一次栅格化所有离散角度的指针（生成器，见 ClockFace.prewarm_sprites）"""
+        size = self.profile.clock_size
+        return self.face.prewarm_sprites(size, size, self.devicePixelRatioF())
+
+    def cell_rect(self, index):
+        size = self.profile.clock_size
+        row, column = divmod(index, self.columns)
+        return QRect(column * (size + self.spacing), row * (size + self.spacing), size, size)
+
+    def set_time(self, now):
+        """now 为本地 QDateTime，按各时区换算后分发给所有表盘"""
+        zone_times = {None: now.time()}
+        for zone, time_zone in self._time_zones.items():
+            zone_times[zone] = now.toTimeZone(time_zone).time()
+        zone_angles = self.batch_angles(zone_times)
+
+        for index, zone in enumerate(self.zones):
+            self.times[index] = zone_times[zone]
+            angles = zone_angles[zone]
+            if angles != self.angles[index]:
+                self.angles[index] = angles
+                self.update(self.cell_rect(index))
+
+    @staticmethod
+    def batch_angles(zone_times):
+        """一个节拍内所有时区的指针角度一次算完"""
+        return {zone: hand_angles(time) for zone, time in zone_times.items()}
+
+    def paintEvent(self, event):
+        size = self.profile.clock_size
+        layers = self.face.dial_layers(size, size, self.devicePixelRatioF())
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        region = event.region()
+        for index in range(len(self.zones)):
+            rect = self.cell_rect(index)
+            if region.intersects(rect):
+                self.face.paint(painter, QPointF(rect.topLeft()), size, size, self.angles[index], layers)
+
+
+class GlyphTimeDisplay(QWidget):
+    """数字时间面板，代替 QLCDNumber
+
+    字形 0-9、':'、' '、'-' 按当前 DPR 和样式表里的字体预先渲染到一张图集里，
+    字号按控件大小自动缩放（和 QLCDNumber 一样撑满面板）。display() 只重绘
+    字符发生变化的格子，通常每秒只有最后一位。
+    """
+    GLYPHS = "0123456789: -"
+    NARROW = ":"  # 窄格字符
+
+    def __init__(self, digit_count=8, parent=None):
+        super().__init__(parent)
+        self.digit_count = digit_count
+        self.text = " " * digit_count
+        self._atlas = None  # (缓存键, 图集, {字符: 源矩形}, [格子矩形])
+        self.last_dirty_region = QRegion()
+        self.glyph_stats = {'displays': 0, 'cells_changed': 0, 'atlas_builds': 0}
+        self.paint_observer = None  # 每次绘制完成后调用（用于统计显示延迟）
+
+    def sizeHint(self):
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance("0") * self.digit_count, metrics.height())
+
+    def display(self, text):
+        text = text.rjust(self.digit_count)[-self.digit_count:]
+        if text == self.text:
+            return
+        old, self.text = self.text, text
+        self.glyph_stats['displays'] += 1
+        # 图集还没建好，或字符宽窄类型变了（格子布局会变）时整体重绘
+        if self._atlas is None or [c in self.NARROW for c in old] != [c in self.NARROW for c in text]:
+            self.glyph_stats['cells_changed'] += self.digit_count
+            self.last_dirty_region = QRegion(self.rect())
+            self.update()
+            return
+        cells = self._atlas[3]
+        region = QRegion()
+        for index, (before, after) in enumerate(zip(old, text)):
+            if before != after:
+                region += cells[index]
+                self.glyph_stats['cells_changed'] += 1
+        self.last_dirty_region = region
+        self.update(region)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange, QEvent.PaletteChange):
+            self._atlas = None
+            self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._atlas = None
+
+    def fitted_font(self):
+        """样式表字体的字族和字重，字号缩放到正好放下全部字符"""
+        font = QFont(self.font())
+        font.setPixelSize(100)
+        metrics = QFontMetricsF(font)
+        digit_width = max(metrics.horizontalAdvance(c) for c in "0123456789")
+        narrow_width = metrics.horizontalAdvance(self.NARROW)
+        narrow_count = sum(1 for c in self.text if c in self.NARROW)
+        total_width = digit_width * (self.digit_count - narrow_count) + narrow_width * narrow_count
+        ratio = min(self.width() * 0.92 / total_width, self.height() * 0.8 / metrics.capHeight() / 1.25)
+        font.setPixelSize(max(6, int(100 * ratio)))
+        return font
+
+    def ensure_atlas(self):
+        dpr = self.devicePixelRatioF()
+        colour = self.palette().color(QPalette.WindowText)
+        narrow_mask = tuple(c in self.NARROW for c in self.text)
+        key = (self.width(), self.height(), dpr, self.font().key(), colour.rgba(), narrow_mask)
+        if self._atlas is not None and self._atlas[0] == key:
+            return self._atlas
+
+        font = self.fitted_font()
+        metrics = QFontMetricsF(font)
+        cell_width = math.ceil(max(metrics.horizontalAdvance(c) for c in "0123456789"))
+        narrow_width = math.ceil(metrics.horizontalAdvance(self.NARROW))
+        cell_height = math.ceil(metrics.height())
+
+        # 图集：所有字形排成一行，每个字形占一个格子
+        widths = {c: (narrow_width if c in self.NARROW else cell_width) for c in self.GLYPHS}
+        atlas = QPixmap(max(1, int(math.ceil(sum(widths.values()) * dpr))), max(1, int(math.ceil(cell_height * dpr))))
+        atlas.setDevicePixelRatio(dpr)
+        atlas.fill(Qt.transparent)
+        painter = QPainter(atlas)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(colour)
+        sources = {}
+        x = 0
+        for c in self.GLYPHS:
+            rect = QRectF(x, 0, widths[c], cell_height)
+            painter.drawText(rect, Qt.AlignCenter, c)
+            sources[c] = rect
+            x += widths[c]
+        painter.end()
+
+        # 控件上的格子：整体居中
+        total_width = sum(widths[c] for c in self.text)
+        x = (self.width() - total_width) / 2
+        y = (self.height() - cell_height) / 2
+        cells = []
+        for c in self.text:
+            cells.append(QRectF(x, y, widths[c], cell_height).toAlignedRect())
+            x += widths[c]
+
+        self.glyph_stats['atlas_builds'] += 1
+        self._atlas = (key, atlas, sources, cells)
+        return self._atlas
+
+    def paintEvent(self, event):
+        started = time.perf_counter() if PERF.enabled else None
+        _, atlas, sources, cells = self.ensure_atlas()
+        painter = QPainter(self)
+        region = event.region()
+        for c, cell in zip(self.text, cells):
+            if not region.intersects(cell):
+                continue
+            source = sources.get(c)
+            if source is not None:
+                painter.drawPixmap(QRectF(cell.x(), cell.y(), source.width(), source.height()), atlas, source)
+        painter.end()
+        if started is not None:
+            PERF.paint('lcd', time.perf_counter() - started)
+        if self.paint_observer is not None:
+            self.paint_observer()
+
+
+class PanelFrame(QFrame):
+    """背景框架：样式表里的圆角渐变背景和边框按尺寸和DPR栅格化一次后复用
+
+    外观仍由样式表描述，栅格化时走和样式引擎完全相同的绘制路径
+    （PE_Widget 背景 + CE_ShapedFrame 边框）。嵌套的 PanelFrame 由最外层
+    一并画进同一张位图，混合顺序与直接绘制一致，贴到透明窗口上逐像素相同；
+    之后每次重绘（包括动画的每一帧）只贴一张位图，不再解析样式规则。
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.setObjectName(name)
+        self._styled_background = False
+        self._background = None  # (缓存键, 位图)
+        self.panel_stats = {'paints': 0, 'rasterizations': 0, 'style_draws': 0}
+
+    def event(self, event):
+        result = super().event(event)
+        if event.type() in (QEvent.Polish, QEvent.StyleChange):
+            # 样式引擎在 polish 时给有背景规则的控件打开 WA_StyledBackground，
+            # 每次重绘都会再画一遍；记下来改由缓存负责
+            if self.testAttribute(Qt.WA_StyledBackground):
+                self._styled_background = True
+                self.setAttribute(Qt.WA_StyledBackground, False)
+            self.invalidate_background()
+        return result
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.invalidate_background()
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        if self.owner() is not self:
+            self.invalidate_background()
+
+    def owner(self):
+        """负责绘制本面板的最外层 PanelFrame"""
+        owner = self
+        parent = self.parentWidget()
+        while parent is not None:
+            if isinstance(parent, PanelFrame):
+                owner = parent
+            parent = parent.parentWidget()
+        return owner
+
+    def invalidate_background(self):
+        owner = self.owner()
+        owner._background = None
+        owner.update()
+
+    def nested_panels(self):
+        return [panel for panel in self.findChildren(PanelFrame) if panel.isVisibleTo(self)]
+
+    def draw_styled(self, painter):
+        """按样式表画出本面板的背景和边框"""
+        if self._styled_background:
+            option = QStyleOption()
+            option.initFrom(self)
+            self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+            self.panel_stats['style_draws'] += 1
+        self.drawFrame(painter)
+        self.panel_stats['style_draws'] += 1
+
+    def background_key(self, dpr):
+        return (self.width(), self.height(), dpr,
+                tuple((panel.objectName(), panel.geometry().getRect()) for panel in self.nested_panels()))
+
+    def render_background(self, dpr):
+        pixmap = QPixmap(max(1, int(round(self.width() * dpr))), max(1, int(round(self.height() * dpr))))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        self.draw_styled(painter)
+        for panel in self.nested_panels():
+            painter.save()
+            painter.translate(panel.mapTo(self, QPoint(0, 0)))
+            panel.draw_styled(painter)
+            painter.restore()
+        painter.end()
+        self.panel_stats['rasterizations'] += 1
+        return pixmap
+
+    def paintEvent(self, event):
+        # 嵌套面板已经画在外层面板的位图里
+        if self.owner() is not self:
+            return
+        self.panel_stats['paints'] += 1
+        dpr = self.devicePixelRatioF()
+        key = self.background_key(dpr)
+        if self._background is None or self._background[0] != key:
+            self._background = (key, self.render_background(dpr))
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background[1])
+
+
+class TransitionMeter:
+    """统计一次进入/退出过渡实际跑出的帧数
+
+    帧以动画驱动的节拍计：事件循环被绘制或合成拖慢时节拍间隔会变长，
+    按屏幕刷新间隔折算出丢掉的帧数。
+    """
+
+    def __init__(self, history=32, clock=time.perf_counter):
+        self.reports = deque(maxlen=history)
+        self.active = None
+        self.clock = clock  # 单调时钟（秒）
+
+    def begin(self, name, mode, refresh_rate):
+        self.active = {'name': name, 'mode': mode, 'interval': 1.0 / max(1.0, refresh_rate),
+                       'start': self.clock(), 'last': None, 'frames': 0, 'dropped': 0}
+
+    def frame(self):
+        active = self.active
+        if active is None:
+            return
+        now = self.clock()
+        if active['last'] is not None:
+            # 间隔超过 1.5 个刷新周期即认为中间漏掉了帧
+            missed = int((now - active['last']) / active['interval'] + 0.5) - 1
+            if missed > 0:
+                active['dropped'] += missed
+        active['last'] = now
+        active['frames'] += 1
+
+    def skip_gap(self):
+        """过渡暂停后恢复：暂停期间的间隔不算丢帧"""
+        if self.active is not None:
+            self.active['last'] = None
+
+    def end(self):
+        """结束当前过渡，返回报告；没有进行中的过渡时返回 None"""
+        active, self.active = self.active, None
+        if active is None:
+            return None
+        elapsed = self.clock() - active['start']
+        report = {
+            'name': active['name'],
+            'mode': active['mode'],
+            'frames': active['frames'],
+            'duration_ms': elapsed * 1000,
+            'fps': active['frames'] / elapsed if elapsed > 0 else 0.0,
+            'dropped': active['dropped'],
+        }
+        self.reports.append(report)
+        return report
+
+
+class PerfHud(QWidget):
+    """调试模式叠在弹窗左上角的性能读数
+
+    只显示 set_lines() 给的几行文本，由窗口每秒刷新一次；自己的绘制不计入
+    PERF，也不接收鼠标事件（拖动和双击照常落到弹窗上）。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        font = QFont("monospace")
+        font.setStyleHint(QFont.Monospace)
+        font.setPixelSize(10)
+        self.setFont(font)
+        self.lines = []
+
+    def set_lines(self, lines):
+        if lines == self.lines:
+            return
+        self.lines = lines
+        metrics = self.fontMetrics()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 8
+        self.resize(width, metrics.height() * len(lines) + 6)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 170))
+        painter.setPen(QColor(230, 230, 230))
+        metrics = self.fontMetrics()
+        y = 3 + metrics.ascent()
+        for line in self.lines:
+            painter.drawText(4, y, line)
+            y += metrics.height()
+
+
 class SettingsWindow(QWidget):
     settings_saved = pyqtSignal(dict)  # 新增信号
 
@@ -175,6 +1278,7 @@ class SettingsWindow(QWidget):
 
         # 界面初始化
         self.setup_ui()
+        self.setup_connections()
         self.load_initial_settings()
 
     def setup_ui(self):
@@ -198,7 +1302,8 @@ class SettingsWindow(QWidget):
         self.BtnAutoStart.setChecked(self.settings.get('auto_start', False))
         self.checkBox.setChecked(self.settings.get('drawer_animation', True))
         self.mspeed.setValue(self.settings.get('animation_duration', 2000))
-        self.ktime.setValue(self.settings.get('stay_duration', 1500))
+        # 设置里以毫秒保存，界面上按秒显示
+        self.ktime.setValue(self.settings.get('stay_duration', 1500) / 1000.0)
 
     def setup_connections(self):
         self.buttonBox.accepted.connect(self.save_settings)
@@ -216,9 +1321,9 @@ class SettingsWindow(QWidget):
         # 这里添加保存设置的逻辑
         settings = {
             'auto_start': self.BtnAutoStart.isChecked(),
-            'animation_enabled': self.checkBox.isChecked(),
-            'move_speed': self.mspeed.value(),
-            'stay_time': self.ktime.value(),
+            'drawer_animation': self.checkBox.isChecked(),
+            'animation_duration': self.mspeed.value(),
+            'stay_duration': int(round(self.ktime.value() * 1000)),
             'time_second': self.findChild(QLineEdit, "Second").text(),
             'time_minute': self.findChild(QLineEdit, "Minute").text(),
             'time_hour': self.findChild(QLineEdit, "Hour").text(),
@@ -268,7 +1373,9 @@ class SettingsWindow(QWidget):
         self.verticalLayout_2 = QVBoxLayout()
         self.mspeed = QSpinBox()
         self.mspeed.setMaximum(9999)
-        self.ktime = QSpinBox()
+        self.ktime = QDoubleSpinBox()  # 停留时间（秒），保存时换算成毫秒
+        self.ktime.setDecimals(1)
+        self.ktime.setSingleStep(0.5)
         self.ktime.setMaximum(120)
         self.verticalLayout_2.addWidget(self.mspeed)
         self.verticalLayout_2.addWidget(self.ktime)
@@ -309,22 +1416,31 @@ class SettingsWindow(QWidget):
 
 class PopupClockClass(QWidget):
 
-    def __init__(self):
+    def __init__(self, profile=None, settings=None, session=None, time_source=None):
         super().__init__()
+        self.profile = profile or current_profile()
+        # 读取时间、定时器和动画推进都经过时间源，模拟时换成 time_source.VirtualClock
+        self.time_source = time_source if time_source is not None else SystemTimeSource()
+        self.settings = settings if settings is not None else SettingsStore()
+        # 会话状态：锁屏或空闲时暂停一切计时和绘制
+        self.session = session if session is not None else session_state.create_provider(parent=self)
+        self.session_paused = False
 
         # self.registry_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
         # 修改设置窗口实例化方式
         self.settings_window = None  # 延迟初始化设置窗口
-        self.current_settings = {
-            'animation_duration': 2000,
-            'stay_duration': 1500,
-            'drawer_animation': True
-        }
-
-        self.suppressed_period = None  # 抑制的时间段类型：'hour'或'half'
-        self.dragged_pos = None  # 新增：存储拖动后的位置
+        self.schedule_reload_pending = False
+        self.schedule_checked = None  # 上次检查时的周秒数，用来判断是否跨过了弹窗边界
+        self.suppressed_until = None  # 双击关闭后，本次弹窗时段结束前不再弹出
         self.debug_mode = False  # 默认关闭调试模式
         self.first_run = True  # 添加首次启动标志
+        self.dormant = False  # 休眠状态：隐藏时不刷新、不绘制
+        self.quitting = False  # 正在退出：收起后直接结束程序
+        self.pending_pop = None  # 弹出一次：(停留毫秒, 停留结束后的回调)，进入 shown 时开始计时
+        self.transition_meter = TransitionMeter(clock=self.time_source.monotonic)  # 每次过渡的帧率和丢帧统计
+        self.latency = LatencyRecorder()  # 每个显示秒从整秒边界到绘制完成的延迟
+        self.perf_hud = None  # 调试模式的性能读数，第一次打开调试模式时创建
+        self.snapshot_layer = None  # snapshot 模式下过渡期间显示的快照
 
         self.load_settings()
 
@@ -334,92 +1450,36 @@ class PopupClockClass(QWidget):
 
         # 初始化UI
         self.setup_ui()
+        self.lcdNumber.paint_observer = lambda: self.latency.painted(self.time_source.wall_ms())
         self.setup_timer()
         self.setup_animation()
-        self.update_display()
-
-        # Mac特定样式
-        if platform.system() == 'Darwin':
-            self.setStyleSheet("""
-                   QFrame#frame1 {
-                       background: qradialgradient(
-                           cx:0.5, cy:0.5, radius: 2,
-                           fx:0.5, fy:0.5,
-                         stop:0 rgba(189, 189, 189, 255),
-                               stop:1 rgba(150, 150, 150, 200)
-                       );
-                          border-radius:22px;
-                           border: 1px solid rgba(255,255,255,100);
-                   }
-                   QFrame#frame_3 {
-                       background-color:rgba(230, 230, 230, 220);
-                       border-radius:22px;
-                       border: 1px solid rgba(0,0,0,30);
-                   }
-                   QLCDNumber {
-                       background:transparent;
-                       color: #111;
-                       min-width: 120px;
-                       qproperty-segmentStyle: Flat;
-                       font: bold 18px 'Helvetica'; 
-                   }
-               """)
-        else:
-            # 样式调整
-            self.setStyleSheet("""
-                       QFrame#frame1 {
-                           background: qradialgradient(
-                               cx:0.5, cy:0.5, radius: 2,
-                               fx:0.5, fy:0.5,
-                               stop:0 rgba(189, 189, 189, 255),
-                               stop:1 rgba(150, 150, 150, 200)
-
-                           );
-                           border-radius:22px;
-                           border: 1px solid rgba(255,255,255,100);
-                       }
-                       QFrame#frame_3 {
-                           background-color:rgba(230, 230, 230, 220);
-                           border-radius:22px;
-                           border: 1px solid rgba(0,0,0,30);
-                       }
-                       QLCDNumber {
-                           background:transparent;
-                           color: #111;
-                           min-width: 120px;
-                           qproperty-segmentStyle: Flat;
-                           font: bold 18px 'Arial Black'; 
-                       }
-                   """)
+        self.on_tick()
+        self.session.state_changed.connect(self.on_session_state)
+        if self.session.state() != session_state.ACTIVE:
+            self.on_session_state(self.session.state())
+
+        # 样式调整
+        self.setStyleSheet(self.profile.stylesheet)
 
         # 窗口初始位置（左侧屏幕外）
         self.screen_geo = QApplication.primaryScreen().availableGeometry()
-        if platform.system() == 'Darwin':
-            self.window_width = 300  # 与resize保持一致
-        else:
-            self.window_width = 450  # 与resize保持一致
+        self.window_width = self.profile.window_width  # 与resize保持一致
         self.init_pos = QPoint(-self.window_width, 0)  # 初始隐藏在左侧外
         self.show_pos = QPoint(0, 0)  # 显示在左上角
         self.move(self.init_pos)  # 初始位置
         self.setWindowOpacity(0)  # 初始完全显示
 
-        # 添加上下文菜单
-        self.setContextMenuPolicy(Qt.ActionsContextMenu)
-        debug_action = QAction("调试模式（常显）", self, checkable=True)
-        debug_action.toggled.connect(self.toggle_debug_mode)
-        self.addAction(debug_action)
-
-        self.setup_tray_icon()  # 添加系统托盘
-
-        # 添加双击检测计时器
-        self.last_click_time = QTime.currentTime()  # 记录上次点击时间
+        # 双击检测状态
+        self.last_click_time = self.time_source.now().time()  # 记录上次点击时间
         self.click_count = 0  # 点击计数器
 
-        self.double_click_timer = QTimer(self)
-        self.double_click_timer.setSingleShot(True)
-        self.double_click_timer.timeout.connect(self.check_double_click)
-
         self.adjust_for_macos()  # 新增方法
+
+        # 托盘、菜单、动画等非首帧必需的部分在首帧绘制之后再构建，
+        # 窗口迟迟没有绘制时也会在半秒后兜底构建
+        self.deferred_ready = False
+        self.deferred_scheduled = False
+        self.time_source.single_shot(500, self.finish_startup)
         # macOS 特殊处理
         # if platform.system() == 'Darwin':
         #     # 统一设置窗口标志（关键修改）
@@ -440,18 +1500,58 @@ class PopupClockClass(QWidget):
         #         Qt.Tool  # 最重要的标志，隐藏任务栏图标
         #     )
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.deferred_scheduled:
+            self.deferred_scheduled = True
+            self.time_source.single_shot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """首帧之后构建的部分：上下文菜单、系统托盘、双击计时器和动画组"""
+        if self.deferred_ready:
+            return
+        self.deferred_ready = True
+
+        # 添加上下文菜单
+        self.setContextMenuPolicy(Qt.ActionsContextMenu)
+        debug_action = QAction("调试模式（常显）", self, checkable=True)
+        debug_action.toggled.connect(self.toggle_debug_mode)
+        self.addAction(debug_action)
+        # 走时模式：勾选为 corrected（提前醒来忙等到整秒），保存到设置
+        corrected_action = QAction("精确走时（忙等）", self, checkable=True)
+        corrected_action.setChecked(self.timing_mode == 'corrected')
+        corrected_action.toggled.connect(lambda checked: self.set_timing_mode('corrected' if checked else 'basic'))
+        self.addAction(corrected_action)
+        latency_action = QAction("显示延迟统计", self)
+        latency_action.triggered.connect(self.show_latency_report)
+        self.addAction(latency_action)
+        export_action = QAction("导出显示延迟…", self)
+        export_action.triggered.connect(self.export_latency)
+        self.addAction(export_action)
+
+        self.setup_tray_icon()  # 添加系统托盘
+
+        # 添加双击检测计时器
+        self.double_click_timer = self.time_source.create_timer(self)
+        self.double_click_timer.setSingleShot(True)
+        self.double_click_timer.timeout.connect(self.check_double_click)
+
+        self.ensure_animations()
+        STARTUP.mark('deferred ui')
+
     def adjust_for_macos(self):
         """处理 macOS 的屏幕坐标系问题"""
-        if platform.system() != 'Darwin':
+        if self.profile.show_offset is None:
             return
 
         screen = QApplication.primaryScreen()
         screen_geo = screen.availableGeometry()
 
         # 修正显示位置为屏幕左上角可用区域
+        offset_x, offset_y = self.profile.show_offset
         self.show_pos = QPoint(
-            screen_geo.x() + 20,  # 留出 20px 边距
-            screen_geo.y() + 40  # 留出菜单栏下方空间
+            screen_geo.x() + offset_x,
+            screen_geo.y() + offset_y
         )
 
         # 修正初始位置计算
@@ -486,17 +1586,98 @@ class PopupClockClass(QWidget):
     #             except FileNotFoundError:
     #                 pass
     def load_settings(self):
-        # 示例加载设置
+        """从设置存储取出启动时需要的值，之后的修改通过 changed 信号逐项生效"""
         self.debug_mode = False
-        self.animation_duration = 2000  # 默认值
+        self.animation_duration = self.settings.get('animation_duration', 2000)
+        stored_mode = self.settings.get('animation_mode')
+        self.animation_mode = resolve_animation_mode(
+            default=stored_mode if stored_mode in ANIMATION_MODES else 'classic')
+        try:
+            self.schedule = PopupSchedule(rules_from_settings(self.settings.values()))
+        except ValueError as e:
+            print("时间规则无效，使用默认规则：%s" % e)
+            self.schedule = PopupSchedule()
+        self.dragged_pos = self.restore_position(self.settings.get('dragged_pos'))  # 拖动后的位置
+        stored_timing = self.settings.get('timing_mode')
+        self.timing_mode = resolve_timing_mode(
+            default=stored_timing if stored_timing in TIMING_MODES else 'basic')
+        stored_render = self.settings.get('hand_render')
+        self.hand_render = resolve_hand_render(
+            default=stored_render if stored_render in HAND_RENDER_MODES else 'vector')
+        HAND_ATLAS.set_capacity(int(self.settings.get('hand_atlas_mb', 8) * 1024 * 1024))
+        self.settings.changed.connect(self.on_setting_changed)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.settings.flush)
+            if os.environ.get(LATENCY_EXPORT_ENV):
+                app.aboutToQuit.connect(lambda: self.export_latency(os.environ[LATENCY_EXPORT_ENV]))
+
+    @staticmethod
+    def restore_position(value):
+        """保存的位置仍落在某个屏幕的可用区域内时才使用"""
+        if not value:
+            return None
+        pos = QPoint(int(value[0]), int(value[1]))
+        for screen in QApplication.screens():
+            if screen.availableGeometry().contains(pos):
+                return pos
+        return None
+
+    def on_setting_changed(self, key, value):
+        """只重新配置变化的那一项"""
+        if key == 'animation_duration':
+            self.update_animation_duration(value)
+        elif key == 'animation_mode':
+            if value in ANIMATION_MODES and value != self.animation_mode:
+                self.set_animation_mode(value)
+        elif key == 'hand_render':
+            if value in HAND_RENDER_MODES and value != self.hand_render:
+                self.set_hand_render(value)
+        elif key == 'hand_atlas_mb':
+            HAND_ATLAS.set_capacity(int(value * 1024 * 1024))
+        elif key == 'timing_mode':
+            if value in TIMING_MODES:
+                self.set_timing_mode(value)
+        elif key in SCHEDULE_KEYS:
+            # 一次保存可能改多个字段，合并成一次重新编译
+            if not self.schedule_reload_pending:
+                self.schedule_reload_pending = True
+                self.time_source.single_shot(0, self.reload_schedule)
+
+    def reload_schedule(self):
+        self.schedule_reload_pending = False
+        try:
+            self.set_schedule(rules_from_settings(self.settings.values()))
+        except ValueError as e:
+            print("时间规则无效，沿用原规则：%s" % e)
 
     def update_animation_duration(self, duration):
         self.animation_duration = duration
-        # 更新现有动画
-        self.enter_pos_anim.setDuration(duration)
-        self.enter_opacity_anim.setDuration(duration)
-        self.exit_pos_anim.setDuration(duration)
-        self.exit_opacity_anim.setDuration(duration)
+        if self.anim_state == 2:
+            return  # 过渡进行中不改时长，结束后由 on_transition_state 补上
+        self.ensure_animations()
+        # 更新现有动画（各模式包含的动画不同，统一按组遍历）
+        for group in (self.enter_anim_group, self.exit_anim_group):
+            for i in range(group.animationCount()):
+                group.animationAt(i).setDuration(duration)
+        self.animations_duration = duration
+
+    def set_animation_mode(self, mode):
+        """切换动画模式，过渡进行中时等这次过渡结束后生效"""
+        if mode not in ANIMATION_MODES:
+            raise ValueError("未知的动画模式 %r" % (mode,))
+        self.animation_mode = mode
+        if self.anim_state != 2:
+            self.ensure_animations()
+        self.settings.set('animation_mode', mode)
+
+    def set_hand_render(self, mode):
+        """切换指针绘制方式（vector / sprite）"""
+        if mode not in HAND_RENDER_MODES:
+            raise ValueError("未知的指针绘制方式 %r" % (mode,))
+        self.hand_render = mode
+        self.clock_widget.set_hand_render(mode)
+        self.settings.set('hand_render', mode)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -521,66 +1702,47 @@ class PopupClockClass(QWidget):
         print("双击事件debug状态：" + str(self.debug_mode) + "显示状态：" + str(self.anim_state))
 
         if not self.debug_mode and self.anim_state == 1:  # 只在显示状态下且非调试模式时响应
-            self.start_exit_animation()
-            current_time = QTime.currentTime()
-            current_min = current_time.minute()
-            current_sec = current_time.second()
-            # 判断当前时间段类型
-            if (current_min == 59 and current_sec >= 30) or (current_min == 0 and current_sec < 30):
-                self.suppressed_period = 'hour'
-            elif (current_min == 29 and current_sec >= 30) or (current_min == 30 and current_sec < 30):
-                self.suppressed_period = 'half'
+            self.popup_state.request(popup_state.HIDE)
+            # 抑制到当前弹窗时段结束
+            now = self.time_source.now()
+            position = week_position(now)
+            end = self.schedule.window_end(position)
+            if end is not None:
+                self.suppressed_until = now.addMSecs((end - position) * 1000 - now.time().msec())
 
     def showEvent(self, event):
         """重写showEvent处理首次显示逻辑"""
         super().showEvent(event)
         if self.first_run:
             self.first_run = False
-            # 启动首次显示序列
-            self.start_initial_sequence()
+            STARTUP.mark('first show')
+            # 启动首次显示序列（排在首帧绘制之后）
+            self.time_source.single_shot(0, self.start_initial_sequence)
 
     def start_initial_sequence(self):
-        """首次启动时的隐藏动画"""
+        """首次启动时弹出，停留1.5秒后收起"""
+        self.ensure_animations()
         # 确保当前不是调试模式
         if not self.debug_mode:
-            # 第一步：播放进入动画
-            # 确保之前的连接被断开
-            try:
-                self.enter_anim_group.finished.disconnect()
-            except:
-                pass
-            self.start_enter_animation()
+            self.pop(1500, lambda: self.popup_state.request(popup_state.HIDE))
 
-            # 确保之前的连接被断开
-            try:
-                self.exit_anim_group.finished.disconnect()
-            except:
-                pass
-            # 第二步：动画完成后启动1.5秒定时器
-            self.enter_anim_group.finished.connect(
-                lambda: QTimer.singleShot(1500, self.start_exit_animation)
-            )
-
-            # 第三步：退出动画完成后设置正常状态
-            # self.exit_anim_group.finished.connect(
-            #     lambda: setattr(self, 'anim_state', 0)
-            # )
-            self.exit_anim_group.finished.connect(
-                lambda: self.set_anim_state(0)
-            )
+    def pop(self, stay_ms, then):
+        """弹出一次：进入完成后停留 stay_ms，再调用 then 决定是否收起"""
+        if self.anim_state != 0 or self.debug_mode:
+            return
+        self.pending_pop = (stay_ms, then)
+        self.popup_state.request(popup_state.SHOW)
 
     def setup_tray_icon(self):
-        # 创建系统托盘图标
+        # 创建系统托盘图标（图标资源在这里才首次注册）
         self.tray_icon = QSystemTrayIcon(self)
+        QApplication.setWindowIcon(images.icon(":/touxiang.ico"))  # 关键：设置应用全局图标
 
         # Mac上使用.icns格式图标
-        if platform.system() == 'Darwin':
-            icon_path = ":/touxiang.icns"  # 需要准备icns格式的图标
-        else:
-            icon_path = ":/touxiang.ico"
+        icon_path = self.profile.tray_icon_path
 
         # self.tray_icon.setIcon(QIcon(":/touxiang.ico"))  # 准备一个ico图标文件
-        self.tray_icon.setIcon(QIcon(icon_path))  # 准备一个ico图标文件
+        self.tray_icon.setIcon(images.icon(icon_path))  # 准备一个ico图标文件
         self.tray_icon.setToolTip("我的时钟")
 
         # 创建右键菜单
@@ -595,6 +1757,18 @@ class PopupClockClass(QWidget):
         # 添加始终显示动作
         always_show_action = QAction("始终显示", self, checkable=True)
         always_show_action.toggled.connect(self.toggle_always_show)
+        self.always_show_action = always_show_action  # 控制通道切换常显时与菜单保持一致
+        # 动画模式子菜单
+        self.animation_mode_menu = self.build_animation_mode_menu()
+        # 指针绘制方式：勾选为预渲染精灵，否则矢量绘制
+        hand_sprite_action = QAction("预渲染指针", self, checkable=True)
+        hand_sprite_action.setChecked(self.hand_render == 'sprite')
+        hand_sprite_action.toggled.connect(lambda checked: self.set_hand_render('sprite' if checked else 'vector'))
+        # 只有打开了跟踪（--trace / POPUPCLOCK_TRACE）时才有导出项
+        trace_action = None
+        if TRACE.enabled:
+            trace_action = QAction("导出性能跟踪…", self)
+            trace_action.triggered.connect(lambda: self.export_trace())
 
         # 添加自启动菜单项
         # self.auto_start_action = QAction("开机自启动", self, checkable=True)
@@ -631,7 +1805,7 @@ class PopupClockClass(QWidget):
         #     cpu_menu.addAction(action)
 
         # Mac特殊处理：需要显式显示菜单
-        if platform.system() == 'Darwin':
+        if self.profile.tray_submenu:
             # 创建父级菜单项
             main_action = QAction("操作菜单", self)
             tray_menu.addAction(main_action)
@@ -640,6 +1814,10 @@ class PopupClockClass(QWidget):
             sub_menu = QMenu()
             sub_menu.addAction(setting_action)
             sub_menu.addAction(always_show_action)
+            sub_menu.addMenu(self.animation_mode_menu)
+            sub_menu.addAction(hand_sprite_action)
+            if trace_action is not None:
+                sub_menu.addAction(trace_action)
             # sub_menu.addSeparator()
             sub_menu.addAction(exit_action)
 
@@ -653,6 +1831,10 @@ class PopupClockClass(QWidget):
             # Windows/Linux的正常菜单
             tray_menu.addAction(setting_action)
             tray_menu.addAction(always_show_action)  # 插入到退出按钮前
+            tray_menu.addMenu(self.animation_mode_menu)
+            tray_menu.addAction(hand_sprite_action)
+            if trace_action is not None:
+                tray_menu.addAction(trace_action)
             tray_menu.addAction(exit_action)
             # tray_menu.addSeparator()
 
@@ -665,6 +1847,85 @@ class PopupClockClass(QWidget):
         # self.tray_icon.activated.connect(lambda reason:
         #                                  self.on_tray_activated(reason) if reason == QSystemTrayIcon.Trigger else None)
 
+    def build_animation_mode_menu(self):
+        menu = QMenu("动画模式", self)
+        group = QActionGroup(menu)
+        group.setExclusive(True)
+        labels = {'classic': "经典（位置+透明度）", 'snapshot': "快照（过渡期间冻结内容）",
+                  'geometry': "仅位置", 'opacity': "仅透明度"}
+        for mode in ANIMATION_MODES:
+            action = QAction(labels[mode], menu, checkable=True)
+            action.setChecked(mode == self.animation_mode)
+            action.triggered.connect(lambda checked, m=mode: self.set_animation_mode(m))
+            group.addAction(action)
+            menu.addAction(action)
+        return menu
+
+    def show_latency_report(self):
+        text = self.latency.report_text() + "\n\n" + self.tick_report_text() + "\n" + self.popup_state.report_text()
+        if self.hand_render == 'sprite':
+            text += "\n" + HAND_ATLAS.report_text()
+        QMessageBox.information(self, "显示延迟（%s）" % self.timing_mode, text)
+
+    def tick_report_text(self):
+        stats = self.tick_stats
+        return ("节拍 %(ticks)d，忙等 %(spins)d 次共 %(spin_ms).1f ms，系统时间跳变 %(clock_jumps)d" % stats
+                + "，当前提前量 %.2f ms" % self.tick_lead_ms)
+
+    def export_latency(self, path=None):
+        """导出显示延迟统计；不指定路径时弹出保存对话框"""
+        if not path:
+            path, _ = QFileDialog.getSaveFileName(self, "导出显示延迟", "popupclock-latency.json", "JSON (*.json)")
+            if not path:
+                return
+        self.latency.export(path, {'timing_mode': self.timing_mode, 'ticks': dict(self.tick_stats)})
+        print("显示延迟统计已导出到 %s" % path)
+
+    def export_trace(self, path=None):
+        """写出性能跟踪（Chrome trace JSON）；不指定路径时弹出保存对话框"""
+        if not path:
+            path, _ = QFileDialog.getSaveFileName(self, "导出性能跟踪", "popupclock-trace.json", "JSON (*.json)")
+            if not path:
+                return
+        TRACE.dump(path)
+        print("性能跟踪已导出到 %s（%d 条，丢弃 %d 条）" % (path, len(TRACE.events), TRACE.dropped()))
+
+    def move(self, *args):
+        """和 QWidget.move 相同；跟踪时记一段耗时（动画经属性直接移动窗口，不经过这里）"""
+        if not TRACE.enabled:
+            return super().move(*args)
+        started = TRACE.begin()
+        super().move(*args)
+        TRACE.end("move", 'window', started)
+
+    def handle_command(self, command):
+        """执行控制通道收到的命令（见 single_instance.COMMANDS），返回回复文本"""
+        self.finish_startup()
+        if command == 'show':
+            self.leave_dormant()
+            self.show()
+            self.popup_state.request(popup_state.SHOW)
+        elif command == 'hide':
+            self.popup_state.request(popup_state.HIDE)
+        elif command == 'toggle-always-show':
+            self.always_show_action.toggle()
+        elif command == 'pop':
+            # 进入、停留 stay_duration 后自动收起
+            self.pop(self.settings.get('stay_duration', 1500), self.end_pop)
+        elif command == 'quit':
+            self.clean_exit()
+        else:
+            return "error 未知命令 %s" % command
+        return "ok"
+
+    def end_pop(self):
+        """pop 命令的停留结束；期间进入了弹窗时段或切到常显时保持显示"""
+        if self.anim_state != 1 or self.debug_mode:
+            return
+        if self.schedule.contains(week_position(self.time_source.now())):
+            return
+        self.popup_state.request(popup_state.HIDE)
+
     def set_cpu_load(self, percent):
         """设置CPU占用百分比"""
         self.cpu_slider.setValue(percent)
@@ -673,20 +1934,14 @@ class PopupClockClass(QWidget):
 
     def show_settings(self):
         if not self.settings_window:
-            self.settings_window = SettingsWindow(self.current_settings)
+            self.settings_window = SettingsWindow(self.settings.values())
             self.settings_window.settings_saved.connect(self.apply_settings)
         self.settings_window.show()
         self.settings_window.raise_()
 
     def apply_settings(self, settings):
-        # 动画期间不更新参数
-        if self.anim_state == 2:
-            QTimer.singleShot(300, lambda: self.apply_settings(settings))
-            return
-            # 安全更新动画参数
-        self.current_settings.update(settings)
-        self.animation_duration = settings.get('animation_duration', 2000)
-        self.update_animation_duration()
+        # 写入存储；只有值确实变化的项会通过 on_setting_changed 重新配置（动画时长等过渡结束后才生效）
+        self.settings.update(settings)
 
     def on_tray_activated(self, reason):
         """处理托盘图标点击事件"""
@@ -694,6 +1949,7 @@ class PopupClockClass(QWidget):
             if self.isVisible():
                 self.hide()
             else:
+                self.leave_dormant()
                 self.show()
                 self.raise_()
 
@@ -706,111 +1962,130 @@ class PopupClockClass(QWidget):
         self.activateWindow()
 
     def toggle_always_show(self, checked):
-        """切换始终显示模式"""
+        """切换始终显示模式；动画进行中时由状态机排队，这次过渡结束后生效"""
         self.debug_mode = checked
-
-        # 如果当前正在动画中，延迟处理直到动画完成
-        if self.anim_state == 2:
-            # 先断开之前的连接
-            try:
-                self.enter_anim_group.finished.disconnect()
-                self.exit_anim_group.finished.disconnect()
-            except:
-                pass
-
-            # 根据当前动画类型设置回调
-            if checked:
-                # 如果是进入动画，完成后保持显示
-                self.enter_anim_group.finished.connect(
-                    lambda: [self.set_anim_state(1), self.ensure_visible_state()]
-                )
-            else:
-                # 如果是退出动画，完成后保持隐藏
-                self.exit_anim_group.finished.connect(
-                    lambda: [self.set_anim_state(0), self.ensure_visible_state()]
-                )
+        self.ensure_animations()
+        if checked:
+            self.popup_state.request(popup_state.PIN)
         else:
-            # 不在动画中，立即处理
-            self.ensure_visible_state()
-
-    def ensure_visible_state(self):
-        """确保窗口状态与debug_mode一致"""
-        if self.debug_mode and self.anim_state != 1:
-            self.start_enter_animation()
-        elif not self.debug_mode and self.anim_state != 0:
-            self.start_exit_animation()
+            self.popup_state.request(popup_state.UNPIN)
+            self.popup_state.request(popup_state.HIDE)
 
     def clean_exit(self):
         """安全退出程序"""
-        try:
-            self.screen.screenLocked.disconnect()
-            self.screen.screenUnlocked.disconnect()
-        except:
-            pass
+        self.session.stop()
         self.tray_icon.hide()  # 隐藏托盘图标
-        self.exit_anim_group.start()  # 如果需要退出动画
-        self.exit_anim_group.finished.connect(qApp.quit)  # 动画完成后退出
+        self.settings.flush()
+        self.ensure_animations()
+        # 收起后退出（on_popup_state）；之后的显示请求一律忽略
+        self.quitting = True
+        self.popup_state.close()
+        if self.popup_state.state == popup_state.ENTERING:
+            self.enter_anim_group.stop()  # 不等进入播完，立即转为退出
+        elif self.popup_state.state == popup_state.HIDDEN:
+            qApp.quit()
+
+    def set_timing_mode(self, mode):
+        """切换走时模式并保存；命令行指定的模式与设置相同时也要在这里生效"""
+        self.timing_mode = mode
+        self.tick_lead_ms = MIN_TICK_LEAD_MS
+        self.settings.set('timing_mode', mode)
 
     def toggle_debug_mode(self, checked):
-        """切换调试模式"""
+        """切换调试模式；开启时强制显示，关闭后保持现状直到下一个弹窗边界"""
         self.debug_mode = checked
-        if checked:  # 如果开启调试模式，强制显示
-            try:
-                self.enter_anim_group.finished.disconnect()
-            except:
-                pass
-            self.start_enter_animation()
+        self.ensure_animations()
+        self.popup_state.request(popup_state.PIN if checked else popup_state.UNPIN)
+        self.set_perf_hud(checked)
+
+    def set_perf_hud(self, enabled):
+        """打开/关闭性能 HUD；计数只在 HUD 打开期间进行"""
+        PERF.enabled = enabled
+        PERF.reset()
+        if self.perf_hud is None:
+            if not enabled:
+                return
+            self.perf_hud = PerfHud(self)
+            self.perf_hud_timer = self.time_source.create_timer(self)
+            self.perf_hud_timer.setObjectName("perf_hud_timer")
+            self.perf_hud_timer.setInterval(1000)
+            self.perf_hud_timer.timeout.connect(self.refresh_perf_hud)
+        if enabled:
+            margin = self.profile.window_margin
+            self.perf_hud.move(margin, margin)
+            self.refresh_perf_hud()
+            self.perf_hud.show()
+            if not self.session_paused:
+                self.perf_hud_timer.start()
+        else:
+            self.perf_hud_timer.stop()
+            self.perf_hud.hide()
+
+    def refresh_perf_hud(self):
+        if self.session_paused:
+            return
+        snap = PERF.snapshot(self.time_source.monotonic())
+        rate = lambda value: "-" if value is None else "%.1f/s" % value
+        lines = ["绘制 %s  唤醒 %s" % (rate(snap['paints_per_s']), rate(snap['wakeups_per_s']))]
+        for name, label in (('clock', "表盘"), ('lcd', "数字")):
+            last, p95 = snap['paint_ms'].get(name, (0.0, 0.0))
+            lines.append("%s %.2f ms  p95 %.2f" % (label, last, p95))
+        lag = self.latency.samples[-1] if self.latency.samples else 0.0
+        lines.append("延迟 %.2f ms  p95 %.2f" % (lag, self.latency.percentile(95)))
+        # 过渡进行中时按已跑的帧算，否则取上一次过渡的报告
+        meter = self.transition_meter
+        active = meter.active
+        if active is not None:
+            elapsed = meter.clock() - active['start']
+            fps = active['frames'] / elapsed if elapsed > 0 else 0.0
+        else:
+            fps = meter.reports[-1]['fps'] if meter.reports else None
+        lines.append("动画 " + ("-" if fps is None else "%.1f fps" % fps))
+        rss = rss_kb()
+        lines.append("RSS " + ("-" if rss is None else "%.1f MB" % (rss / 1024.0)))
+        self.perf_hud.set_lines(lines)
+        self.perf_hud.raise_()  # snapshot 模式的快照层过渡时会盖上来
 
     def setup_ui(self):
 
-        # 调整Mac平台下的尺寸
-        if platform.system() == 'Darwin':
-            self.resize(300, 80)  # 更紧凑的尺寸
-            self.window_width = 300
-        else:
-            self.resize(450, 150)
-            self.window_width = 450
-        # 尺寸调整
-        # self.resize(450, 150)
+        # 尺寸调整（Mac平台下更紧凑）
+        self.resize(*self.profile.window_size)
+        self.window_width = self.profile.window_width
 
         # 主布局
         self.gridLayout = QGridLayout(self)
-        if platform.system() == 'Darwin':
-            self.gridLayout.setContentsMargins(10, 10, 10, 10)
-        else:
-            self.gridLayout.setContentsMargins(20, 20, 20, 20)
+        margin = self.profile.window_margin
+        self.gridLayout.setContentsMargins(margin, margin, margin, margin)
 
         # 背景框架
-        self.frame1 = QFrame()
-        self.frame1.setObjectName("frame1")
+        self.frame1 = PanelFrame("frame1")
         self.horizontalLayout = QHBoxLayout(self.frame1)
-        if platform.system() == 'Darwin':
-            self.horizontalLayout.setContentsMargins(10, 10, 10, 10)
-        else:
-            self.horizontalLayout.setContentsMargins(20, 20, 20, 20)
+        margin = self.profile.frame_margin
+        self.horizontalLayout.setContentsMargins(margin, margin, margin, margin)
 
         # 添加时钟部件
-        self.clock_widget = DrawClock()
+        self.clock_widget = DrawClock(profile=self.profile)
+        if self.hand_render != 'vector':
+            self.clock_widget.set_hand_render(self.hand_render)
         self.horizontalLayout.addWidget(self.clock_widget)
 
         # 右侧数字面板
-        self.frame_3 = QFrame()
-        self.frame_3.setObjectName("frame_3")
+        self.frame_3 = PanelFrame("frame_3")
         self.gridLayout_3 = QGridLayout(self.frame_3)
-        self.lcdNumber = QLCDNumber()
-        self.lcdNumber.setDigitCount(8)
-        self.lcdNumber.setSegmentStyle(QLCDNumber.Flat)
+        self.lcdNumber = GlyphTimeDisplay(8)
         self.gridLayout_3.addWidget(self.lcdNumber)
 
-        if platform.system() == 'Darwin':
-            self.lcdNumber.setStyleSheet("font: bold 18px 'Helvetica';")
+        if self.profile.lcd_font_override:
+            self.lcdNumber.setStyleSheet("font: %s;" % self.profile.lcd_font)
         self.horizontalLayout.addWidget(self.frame_3)
         self.gridLayout.addWidget(self.frame1)
+        # snapshot 模式过渡时隐藏 frame1，布局不能因此收缩
+        policy = self.frame1.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.frame1.setSizePolicy(policy)
 
-        self.lcdNumber.setAttribute(Qt.WA_AlwaysShowToolTips)  # 强制渲染优化
-        self.lcdNumber.setStyle(QStyleFactory.create("Fusion"))  # 使用更现代的样式引擎
         # macOS 特殊处理
-        if platform.system() == 'Darwin':
+        if self.profile.mac_tool_window:
             # 统一设置窗口标志（关键修改）
             self.setWindowFlags(
                 Qt.FramelessWindowHint |
@@ -846,55 +2121,273 @@ class PopupClockClass(QWidget):
         self.setWindowTitle("PopupClock")
 
     def setup_timer(self):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_display)
-        self.timer.start(200)  # 更快的检测频率
+        # 单次精确定时器，每次触发后按下一个边界时刻重新设定，代替200ms轮询
+        self.timer = self.time_source.create_timer(self)
+        self.timer.setObjectName("tick_timer")  # 跟踪里按名字区分各个定时器
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_tick)
+        self.tick_target_ms = None  # 本次节拍对准的时刻（epoch 毫秒）
+        self.tick_scheduled = None  # 设定节拍时的 (墙上时间, 单调时钟)
+        self.tick_lead_ms = MIN_TICK_LEAD_MS  # corrected 模式下提前醒来的时长
+        self.tick_lead_used = 0.0
+        self.wake_lateness_ms = 0.0  # 定时器迟到量的滑动平均
+        self.tick_stats = {'ticks': 0, 'spins': 0, 'spin_ms': 0.0, 'clock_jumps': 0}
+
+        # 拖动节流：鼠标事件只记录最新目标，每个显示帧最多移动一次窗口
+        self.dragging = False
+        self.drag_target = None
+        self.drag_stats = {'events': 0, 'moves': 0}
+        self.drag_frame_timer = self.time_source.create_timer(self)
+        self.drag_frame_timer.setObjectName("drag_frame_timer")
+        self.drag_frame_timer.setSingleShot(True)
+        self.drag_frame_timer.setTimerType(Qt.PreciseTimer)
+        self.drag_frame_timer.timeout.connect(self.apply_drag)
+
+    def on_tick(self):
+        if PERF.enabled:
+            PERF.wakeup()
+        if self.session_paused:
+            return
+        self.align_tick()
+        if TRACE.enabled:
+            started = TRACE.begin()
+            self.update_display()
+            TRACE.end("update_display", 'tick', started)
+        else:
+            self.update_display()
+        self.schedule_next_tick()
+
+    def align_tick(self):
+        """醒来后测量相对目标时刻的误差；corrected 模式下忙等剩下的不到几毫秒"""
+        if self.tick_target_ms is None:
+            return
+        clock = self.time_source
+        now_ms = clock.wall_ms()
+        scheduled_wall, scheduled_mono = self.tick_scheduled
+        # 定时器按单调时钟计时；墙上时间多走或少走了，说明系统时间被调整过，
+        # 这一拍不参与估计，随后按新的时间重新对齐
+        jump = (now_ms - scheduled_wall) - (clock.monotonic() - scheduled_mono) * 1000
+        if abs(jump) > CLOCK_JUMP_MS:
+            self.tick_stats['clock_jumps'] += 1
+            self.wake_lateness_ms = 0.0
+            self.tick_lead_ms = MIN_TICK_LEAD_MS
+            return
+        self.tick_stats['ticks'] += 1
+        early = self.tick_target_ms - now_ms  # 正数表示早于目标时刻醒来
+        if self.timing_mode != 'corrected':
+            return
+        # 相对请求的唤醒时刻迟到了多少，用来决定下次提前多少
+        lateness = self.tick_lead_used - early
+        self.wake_lateness_ms += 0.2 * (lateness - self.wake_lateness_ms)
+        self.tick_lead_ms = min(MAX_TICK_LEAD_MS, max(MIN_TICK_LEAD_MS, self.wake_lateness_ms + 1.0, lateness))
+        if 0 < early <= MAX_TICK_LEAD_MS + 2:
+            spin_start = clock.wall_ms()
+            clock.spin_until(self.tick_target_ms, MAX_TICK_LEAD_MS + 2)
+            self.tick_stats['spins'] += 1
+            self.tick_stats['spin_ms'] += clock.wall_ms() - spin_start
+
+    def schedule_next_tick(self):
+        """显示时对齐到下一个整秒，隐藏时直接休眠到下一个弹窗边界"""
+        if self.session_paused:
+            return  # 恢复时会重新对齐
+        now = self.time_source.now()
+        lead = 0.0
+        if self.anim_state == 0 and not self.debug_mode:
+            delay = msecs_to_next_popup_edge(self.schedule, now)
+            delay = MAX_IDLE_WAIT_MS if delay is None else min(delay, MAX_IDLE_WAIT_MS)
+        else:
+            delay = msecs_to_next_second(now.time())
+            if self.timing_mode == 'corrected':
+                lead = self.tick_lead_ms
+        # 记下目标时刻，醒来时据此测量误差、发现系统时间跳变
+        self.tick_target_ms = now.toMSecsSinceEpoch() + delay
+        self.tick_scheduled = (self.time_source.wall_ms(), self.time_source.monotonic())
+        wait = max(int(delay - lead), 1)
+        self.tick_lead_used = delay - wait
+        self.timer.start(wait)
 
     def setup_animation(self):
+        # 动画组在第一次使用时才构建
+        self.enter_anim_group = None
+        self.exit_anim_group = None
+        # 显示状态机：状态转换的响应只在这里连接一次
+        self.popup_state = PopupStateMachine(self.time_source.monotonic, self)
+        self.popup_state.state_changed.connect(self.on_popup_state)
+
+    @property
+    def anim_state(self):
+        """0:隐藏 1:显示 2:动画中"""
+        return self.popup_state.anim_state
+
+    def on_popup_state(self, old, new):
+        """状态机进入新状态时的动作"""
+        if new == popup_state.ENTERING:
+            self.start_enter_animation()
+        elif new == popup_state.EXITING:
+            self.start_exit_animation()
+        elif new == popup_state.SHOWN:
+            if self.pending_pop is not None:
+                stay_ms, then = self.pending_pop
+                self.pending_pop = None
+                self.time_source.single_shot(stay_ms, then)
+            self.schedule_next_tick()
+        elif new == popup_state.HIDDEN:
+            self.pending_pop = None
+            if self.quitting:
+                qApp.quit()
+                return
+            if not self.debug_mode:
+                self.enter_dormant()
+            self.schedule_next_tick()
+
+    def ensure_animations(self):
+        if self.enter_anim_group is not None:
+            if self.animations_mode == self.animation_mode:
+                return
+            # 模式变了：过渡进行中先沿用旧的动画组，结束后再重建
+            if self.anim_state == 2:
+                return
+            for group in (self.enter_anim_group, self.exit_anim_group):
+                group.stop()
+                group.deleteLater()  # 可能正处在它自己的 finished 回调里，不能立即释放
         # 修改动画速度为500ms
-        animation_duration = 2000  # 全局控制动画速度
+        animation_duration = self.animation_duration  # 全局控制动画速度
+        self.animations_mode = self.animation_mode
+        self.animations_duration = animation_duration
+        move = self.animation_mode != 'opacity'
+        fade = self.animation_mode != 'geometry'
+        self.enter_pos_anim = self.enter_opacity_anim = None
+        self.exit_pos_anim = self.exit_opacity_anim = None
 
         # 进入动画组
-        self.enter_anim_group = QParallelAnimationGroup()
-        # 位置动画
-        self.enter_pos_anim = QPropertyAnimation(self, b"pos")
-        self.enter_pos_anim.setDuration(animation_duration)
-        self.enter_pos_anim.setEasingCurve(QEasingCurve.OutCubic)
-
-        # 透明度动画
-        self.enter_opacity_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.enter_opacity_anim.setDuration(animation_duration)
-        self.enter_opacity_anim.setKeyValueAt(0.0, 0.0)
-        self.enter_opacity_anim.setKeyValueAt(0.5, 1)
-        self.enter_opacity_anim.setKeyValueAt(1.0, 1.0)
-        self.enter_anim_group.addAnimation(self.enter_pos_anim)
-        self.enter_anim_group.addAnimation(self.enter_opacity_anim)
+        self.enter_anim_group = QParallelAnimationGroup(self)
+        if move:
+            # 位置动画
+            self.enter_pos_anim = QPropertyAnimation(self, b"pos")
+            self.enter_pos_anim.setDuration(animation_duration)
+            self.enter_pos_anim.setEasingCurve(QEasingCurve.OutCubic)
+            self.enter_anim_group.addAnimation(self.enter_pos_anim)
+        if fade:
+            # 透明度动画
+            self.enter_opacity_anim = QPropertyAnimation(self, b"windowOpacity")
+            self.enter_opacity_anim.setDuration(animation_duration)
+            self.enter_opacity_anim.setKeyValueAt(0.0, 0.0)
+            self.enter_opacity_anim.setKeyValueAt(0.5, 1)
+            self.enter_opacity_anim.setKeyValueAt(1.0, 1.0)
+            self.enter_anim_group.addAnimation(self.enter_opacity_anim)
 
         # 退出动画组
-        self.exit_anim_group = QParallelAnimationGroup()
-        # 位置动画
-        self.exit_pos_anim = QPropertyAnimation(self, b"pos")
-        self.exit_pos_anim.setDuration(animation_duration)
-        self.exit_pos_anim.setEasingCurve(QEasingCurve.InCubic)
-        # 透明度动画
-        self.exit_opacity_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.exit_opacity_anim.setDuration(animation_duration)  # 修正此行
-        self.exit_opacity_anim.setKeyValueAt(0.0, 1.0)
-        self.exit_opacity_anim.setKeyValueAt(0.5, 1)
-        self.exit_opacity_anim.setKeyValueAt(1.0, 0.0)
-        self.exit_anim_group.addAnimation(self.exit_pos_anim)
-        self.exit_anim_group.addAnimation(self.exit_opacity_anim)
-
-        self.anim_state = 0  # 0:隐藏 1:显示 2:动画中
+        self.exit_anim_group = QParallelAnimationGroup(self)
+        if move:
+            # 位置动画
+            self.exit_pos_anim = QPropertyAnimation(self, b"pos")
+            self.exit_pos_anim.setDuration(animation_duration)
+            self.exit_pos_anim.setEasingCurve(QEasingCurve.InCubic)
+            self.exit_anim_group.addAnimation(self.exit_pos_anim)
+        if fade:
+            # 透明度动画
+            self.exit_opacity_anim = QPropertyAnimation(self, b"windowOpacity")
+            self.exit_opacity_anim.setDuration(animation_duration)  # 修正此行
+            self.exit_opacity_anim.setKeyValueAt(0.0, 1.0)
+            self.exit_opacity_anim.setKeyValueAt(0.5, 1)
+            self.exit_opacity_anim.setKeyValueAt(1.0, 0.0)
+            self.exit_anim_group.addAnimation(self.exit_opacity_anim)
+
+        # 帧计数：不绑定属性的线性动画，每个动画节拍都会产生一个新值
+        for name, group in (('enter', self.enter_anim_group), ('exit', self.exit_anim_group)):
+            probe = QVariantAnimation(group)
+            probe.setStartValue(0.0)
+            probe.setEndValue(1.0)
+            probe.setDuration(animation_duration)
+            probe.valueChanged.connect(lambda value, n=name: self.on_animation_frame(n))
+            group.addAnimation(probe)
+            group.stateChanged.connect(lambda new, old, n=name, g=group: self.on_transition_state(n, g, new))
+            self.time_source.track_animation(group)
+
+    def on_animation_frame(self, name):
+        self.transition_meter.frame()
+        if TRACE.enabled:
+            TRACE.instant("animation frame", 'animation', {'group': name})
+
+    def on_transition_state(self, name, group, state):
+        """过渡开始/结束（包括被中途打断）时的统一处理"""
+        if state == QAbstractAnimation.Running:
+            self.transition_meter.begin(name, self.animations_mode, self.refresh_rate())
+            if self.animations_mode == 'snapshot':
+                self.begin_snapshot()
+            return
+        # 窗口销毁时正在运行的动画组会在析构中停止，此时不再做任何处理
+        if state != QAbstractAnimation.Stopped or sip.isdeleted(group):
+            return
+        self.end_snapshot()
+        completed = group.currentTime() >= group.totalDuration()
+        if name == 'exit' and completed:
+            # 只动一种属性的模式，结束状态与 classic 保持一致：屏幕外且完全透明
+            if self.exit_opacity_anim is None:
+                self.setWindowOpacity(0)
+            if self.exit_pos_anim is None:
+                self.move(self.pos().x() - self.window_width, self.pos().y())
+        report = self.transition_meter.end()
+        if report is not None and self.debug_mode:
+            print("动画 %(name)s [%(mode)s]: %(frames)d 帧 / %(duration_ms).0f ms, "
+                  "%(fps).1f fps, 丢帧 %(dropped)d" % report)
+        if self.animations_mode != self.animation_mode:
+            self.time_source.single_shot(0, self.ensure_animations)
+        elif self.animations_duration != self.animation_duration:
+            self.time_source.single_shot(0, lambda: self.update_animation_duration(self.animation_duration))
+        # 最后才通知状态机：排队的意图可能立即开始下一次过渡
+        self.popup_state.transition_done(name)
+
+    def refresh_rate(self):
+        handle = self.windowHandle()
+        screen = handle.screen() if handle is not None else QApplication.primaryScreen()
+        return screen.refreshRate() if screen is not None else 60.0
+
+    def begin_snapshot(self):
+        """把弹窗抓成一张位图，过渡期间只显示这张图，真实控件隐藏且不再重绘"""
+        if self.snapshot_layer is None:
+            self.snapshot_layer = QLabel(self)
+            self.snapshot_layer.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.snapshot_layer.hide()
+        snapshot = self.grab()
+        self.snapshot_layer.setGeometry(self.rect())
+        self.snapshot_layer.setPixmap(snapshot)
+        self.frame1.hide()
+        self.snapshot_layer.show()
+        self.snapshot_layer.raise_()
+
+    def end_snapshot(self):
+        if self.snapshot_layer is None or self.snapshot_layer.isHidden():
+            return
+        # 过渡期间时间已经走了，换回真实控件前先追上
+        if not self.dormant:
+            self.refresh_display(self.time_source.now().time())
+        self.frame1.show()
+        self.snapshot_layer.hide()
+        self.snapshot_layer.clear()  # 快照只在过渡期间持有
 
     def update_display(self):
         # 在时间条件判断前检查动画状态
         if self.anim_state == 2:
             return  # 动画中不处理新触发
 
-        current_time = QTime.currentTime()
-        self.lcdNumber.display(current_time.toString("HH:mm:ss"))
-        self.clock_widget.set_time(current_time)
+        now = self.time_source.now()
+        current_time = now.time()
+        # 休眠状态下窗口不可见，不做任何控件刷新
+        if not self.dormant:
+            shown = self.lcdNumber.text
+            self.refresh_display(current_time)
+            if self.lcdNumber.text != shown and self.isVisible():
+                # 统计这一秒从整秒边界到面板画出来的延迟
+                self.latency.expect(now.toMSecsSinceEpoch() - current_time.msec())
+                if self.timing_mode == 'corrected':
+                    # 立即绘制变化的部分，不等下一轮事件循环
+                    self.lcdNumber.repaint(self.lcdNumber.last_dirty_region)
+                    self.clock_widget.repaint(self.clock_widget.last_dirty_region)
+
+        position = week_position(now)
+        previous, self.schedule_checked = self.schedule_checked, position
 
         # 如果是首次启动后的第一次更新，跳过时间判断
         if hasattr(self, 'first_run') and self.first_run:
@@ -903,77 +2396,99 @@ class PopupClockClass(QWidget):
         # 调试/常显模式直接返回（保持显示）
         if self.debug_mode:
             if self.anim_state == 0:  # 如果当前是隐藏状态
-                self.start_enter_animation()
+                self.popup_state.request(popup_state.SHOW)
             return  # 跳过原有时间判断
 
-        # 计算当前分钟和秒
-        current_min = current_time.minute()
-        current_sec = current_time.second()
-
-        in_window = False
-        current_period = None
-        # 检查整点窗口（如07:59:30-08:00:30）
-        if (current_min == 59 and current_sec >= 30) or (current_min == 0 and current_sec < 30):  # 59:30-59:59
-            current_period = 'hour'
-            in_window = True
-        # 检查半点窗口（如08:29:30-08:30:30）
-        elif (current_min == 29 and current_sec >= 30) or (current_min == 30 and current_sec < 30):  # 29:30-29:59
-            current_period = 'half'
-            in_window = True
-
-        # 检查是否被抑制
-        if in_window and self.suppressed_period == current_period:
-            in_window = False
-        # 不在时间段时重置抑制
-        elif not in_window and current_min not in [59, 0, 29, 30]:
-            self.suppressed_period = None
-
-        # print("当前状态：" + str(in_window) + "当前current_period：" + str(current_period) + ":" + str(self.suppressed_period))
-        # print("当前状态：" + str(in_window) + "当前时间：" + str(current_min) + ":" + str(current_sec) + "状态" + str(self.anim_state))
-        # print("当前状态："+str(self.anim_state))
-        # 精确控制动画触发时机
-        if in_window:
-            # 进入动画触发点（59:30或29:30）
-            if (current_min == 59 and current_sec == 30) or \
-                    (current_min == 29 and current_sec == 30):
-                if self.anim_state in [0, 2]:  # 隐藏或动画中
-                    # 断开之前的信号连接（重要！）
-                    try:
-                        self.enter_anim_group.finished.disconnect()
-                    except:
-                        pass
-                    # 启动进入动画
-                    self.start_enter_animation()
+        # 只在跨过显示/隐藏边界时动作，按此刻应处的状态同步
+        if previous is None or not self.schedule.crossed(previous, position):
+            return
+        if self.popup_wanted(now, position):
+            if self.anim_state == 0:
+                self.popup_state.request(popup_state.SHOW)
+        elif self.anim_state == 1:
+            self.popup_state.request(popup_state.HIDE)
+
+    def popup_wanted(self, now, position):
+        """此刻是否处于弹窗时段内且未被双击抑制"""
+        if not self.schedule.contains(position):
+            return False
+        return self.suppressed_until is None or now >= self.suppressed_until
+
+    def set_schedule(self, rules):
+        """替换弹窗规则；不会在时段中途弹出，从下一个边界开始生效"""
+        self.schedule = PopupSchedule(rules)
+        self.suppressed_until = None
+        self.schedule_next_tick()
+
+    def refresh_display(self, current_time):
+        self.lcdNumber.display(current_time.toString("HH:mm:ss"))
+        self.clock_widget.set_time(current_time)
+
+    def enter_dormant(self):
+        """窗口隐藏在屏幕外时停止一切刷新和绘制"""
+        if self.dormant:
+            return
+        self.dormant = True
+        self.setUpdatesEnabled(False)
 
+    def leave_dormant(self):
+        """恢复绘制，并在同一帧内追上当前时间"""
+        if not self.dormant:
+            return
+        self.dormant = False
+        self.refresh_display(self.time_source.now().time())
+        self.setUpdatesEnabled(True)
+
+    def on_session_state(self, state):
+        """锁屏/空闲时暂停，回到 active 时恢复"""
+        if state == session_state.ACTIVE:
+            self.resume_session()
         else:
-            # 退出动画触发点（00:30或30:30）
-            if (current_min == 0 and current_sec >= 30) or \
-                    (current_min == 30 and current_sec >= 30):
-                if self.anim_state in [1, 2]:  # 显示或动画中
-                    # 断开之前的信号连接（重要！）
-                    try:
-                        self.exit_anim_group.finished.disconnect()
-                    except:
-                        pass
-                    # 启动退出动画
-                    self.start_exit_animation()
+            self.pause_session()
 
-    def start_enter_animation(self):
-        # 停止所有正在运行的动画
-        if self.enter_anim_group.state() == QPropertyAnimation.Running:
-            self.enter_anim_group.stop()
-        if self.exit_anim_group.state() == QPropertyAnimation.Running:
-            self.exit_anim_group.stop()
-
-        if self.anim_state == 2:
+    def pause_session(self):
+        """停掉所有定时器和正在进行的过渡，不再绘制"""
+        if self.session_paused:
             return
-        self.anim_state = 2
-        # 确保之前的连接被断开
-        try:
-            self.enter_anim_group.finished.disconnect()
-        except:
-            pass
+        self.session_paused = True
+        self.timer.stop()
+        self.drag_frame_timer.stop()
+        if self.perf_hud is not None:
+            self.perf_hud_timer.stop()
+        for group in (self.enter_anim_group, self.exit_anim_group):
+            if group is not None and group.state() == QAbstractAnimation.Running:
+                group.pause()
+        self.setUpdatesEnabled(False)
+
+    def resume_session(self):
+        """用一帧追上当前时间；锁屏期间错过的弹窗时段直接跳过，不补放"""
+        if not self.session_paused:
+            return
+        self.session_paused = False
+        now = self.time_source.now()
+        position = week_position(now)
+        # 从此刻重新开始判断边界，锁屏期间跨过的边界都不算
+        self.schedule_checked = position
+        for group in (self.enter_anim_group, self.exit_anim_group):
+            if group is not None and group.state() == QAbstractAnimation.Paused:
+                self.transition_meter.skip_gap()
+                group.resume()
+        if not self.dormant:
+            self.refresh_display(now.time())
+            self.setUpdatesEnabled(True)
+        if PERF.enabled:
+            PERF.reset()  # 锁屏期间的间隔不计入每秒次数
+            self.perf_hud_timer.start()
+        # 锁屏前弹出的窗口，所在时段已经在锁屏期间结束：收起
+        if self.anim_state == 1 and not self.debug_mode and not self.popup_wanted(now, position):
+            self.popup_state.request(popup_state.HIDE)
+        self.schedule_next_tick()
 
+    def start_enter_animation(self):
+        """进入 entering 状态：播放进入动画，结束时由 on_transition_state 通知状态机"""
+        self.ensure_animations()
+        self.leave_dormant()
+        self.schedule_next_tick()
         self.raise_()
 
         # 修改目标位置获取方式
@@ -994,31 +2509,19 @@ class PopupClockClass(QWidget):
         start_x = target_pos.x() - self.window_width
         start_pos = QPoint(start_x, target_pos.y())
 
-        self.enter_pos_anim.setStartValue(start_pos)
-        self.enter_pos_anim.setEndValue(target_pos)
-        # 重置透明度（避免动画中断后状态异常）
-        self.setWindowOpacity(0)
+        if self.enter_pos_anim is not None:
+            self.enter_pos_anim.setStartValue(start_pos)
+            self.enter_pos_anim.setEndValue(target_pos)
+        else:
+            self.move(target_pos)
+        # 重置透明度（避免动画中断后状态异常）；不做淡入时直接不透明
+        self.setWindowOpacity(0 if self.enter_opacity_anim is not None else 1)
         self.enter_anim_group.start()
-        # 使用安全的状态更新方法
-        self.enter_anim_group.finished.connect(
-            lambda: self.set_anim_state(1)
-        )
 
     def start_exit_animation(self):
-        # 停止所有正在运行的动画
-        if self.enter_anim_group.state() == QPropertyAnimation.Running:
-            self.enter_anim_group.stop()
-        if self.exit_anim_group.state() == QPropertyAnimation.Running:
-            self.exit_anim_group.stop()
-
-        if self.anim_state == 2:
-            return
-        self.anim_state = 2
-        # 确保之前的连接被断开
-        try:
-            self.exit_anim_group.finished.disconnect()
-        except:
-            pass
+        """进入 exiting 状态：播放退出动画"""
+        self.ensure_animations()
+        self.schedule_next_tick()
 
         current_pos = self.pos()
         # 计算结束位置
@@ -1026,31 +2529,17 @@ class PopupClockClass(QWidget):
         end_pos = QPoint(end_x, current_pos.y())
 
         # 设置动画
-        self.exit_pos_anim.setStartValue(current_pos)
-        self.exit_pos_anim.setEndValue(end_pos)
+        if self.exit_pos_anim is not None:
+            self.exit_pos_anim.setStartValue(current_pos)
+            self.exit_pos_anim.setEndValue(end_pos)
         # 确保透明度初始状态
         self.setWindowOpacity(1)
         self.exit_anim_group.start()
-        # 使用安全的状态更新方法
-        self.exit_anim_group.finished.connect(
-            lambda: self.set_anim_state(0)
-        )
-        # self.exit_anim_group.finished.connect(
-        #     # 添加回调并打印调试信息
-        #     lambda: [setattr(self, 'anim_state', 0) , print("Enter动画完成，状态设为0")]
-        # )
-
-    def set_anim_state(self, state):
-        """线程安全的状态更新方法"""
-        self.anim_state = state
-        # 调试模式特殊处理
-        if state == 0 and self.debug_mode:
-            QTimer.singleShot(100, self.start_enter_animation)
 
     # 实现窗口拖动
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            current_time = QTime.currentTime()
+            current_time = self.time_source.now().time()
             elapsed = self.last_click_time.msecsTo(current_time)
 
             # 双击检测（300ms内两次点击）
@@ -1067,42 +2556,80 @@ class PopupClockClass(QWidget):
 
             self.dragging = True
             self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+            self.drag_frame_interval = max(1, int(1000 / self.refresh_rate()))
             event.accept()
 
     def mouseMoveEvent(self, event):
         if self.dragging:
-            new_pos = event.globalPos() - self.drag_position
-            self.move(new_pos)
-            # 更新显示位置
-            self.show_pos = new_pos
+            # 只记下最新的目标；上一帧的节流结束前不移动窗口
+            self.drag_target = event.globalPos() - self.drag_position
+            self.drag_stats['events'] += 1
+            if not self.drag_frame_timer.isActive():
+                self.apply_drag()
             event.accept()
 
-    def mouseReleaseEvent(self, event):
-        # self.dragging = False
-        # self.dragged_pos = self.pos()  # 新增：记录拖动后的位置
-        # event.accept()
+    def apply_drag(self):
+        """把最新的拖动目标（吸附、限制后）应用到窗口，并开始一帧的节流"""
+        if self.drag_target is None:
+            return
+        new_pos = self.constrain_position(self.drag_target)
+        self.drag_target = None
+        if new_pos != self.pos():
+            self.move(new_pos)
+            self.drag_stats['moves'] += 1
+        # 更新显示位置
+        self.show_pos = new_pos
+        self.drag_frame_timer.start(self.drag_frame_interval)
+
+    def constrain_position(self, pos, top_inset=0):
+        """按目标位置所在屏幕的可用区域限制窗口位置，开启吸附时贴近边缘即吸附"""
+        center = pos + QPoint(self.width() // 2, self.height() // 2)
+        screen = QApplication.screenAt(center) or QApplication.primaryScreen()
+        snap = self.settings.get('snap_distance', 16) if self.settings.get('drag_snap', True) else 0
+        return constrain_to_area(pos, self.size(), screen.availableGeometry(), snap, top_inset)
 
+    def mouseReleaseEvent(self, event):
+        if not self.dragging:
+            return
         self.dragging = False
-        # 记录新位置时考虑屏幕偏移
-        screen_geo = QApplication.primaryScreen().availableGeometry()
-        new_pos = self.pos()
-
-        # 确保不会移出屏幕可见区域
-        new_pos.setX(max(screen_geo.x(), new_pos.x()))
-        new_pos.setY(max(screen_geo.y() + 40, new_pos.y()))  # 保持低于菜单栏
-
+        # 先应用还没来得及生效的最后一个目标
+        if self.drag_target is not None:
+            self.drag_frame_timer.stop()
+            self.apply_drag()
+        self.drag_frame_timer.stop()
+
+        # 记录新位置：确保不会移出屏幕可见区域，并保持低于菜单栏
+        new_pos = self.constrain_position(self.pos(), DRAG_TOP_INSET)
         self.dragged_pos = new_pos
-        self.move(new_pos)  # 立即应用修正后的位置
+        self.show_pos = new_pos
+        if new_pos != self.pos():
+            self.move(new_pos)  # 立即应用修正后的位置
+        self.settings.set('dragged_pos', [new_pos.x(), new_pos.y()])  # 去抖后写入，连续拖动只写一次
         event.accept()
 
 
+STARTUP.mark('import')
+
 if __name__ == "__main__":
-    import sys
+    # 启动时解析一次平台配置，可用 --profile darwin 或 POPUPCLOCK_PROFILE 强制指定
+    set_profile(resolve_profile())
+
+    # 性能跟踪：--trace 路径 或 POPUPCLOCK_TRACE，退出时写出
+    trace_path = resolve_trace_path()
+    if trace_path:
+        TRACE.enable(trace_path)
 
     # QApplication.setAttribute(Qt.AA_UseDesktopOpenGL)  # 启用硬件加速
-    app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon(":/touxiang.ico"))  # 关键：设置应用全局图标
+    app = TracingApplication(sys.argv) if trace_path else QApplication(sys.argv)
+    STARTUP.mark('QApplication')
     window = PopupClockClass()
+    STARTUP.mark('window built')
+    # 之后再启动时的命令经本地套接字转到这里
+    control = single_instance.ControlServer(window.handle_command, INSTANCE_LOCK)
+    control.listen()
+    app.aboutToQuit.connect(control.close)
+    if trace_path:
+        app.aboutToQuit.connect(lambda: window.export_trace(trace_path))
     window.show()
 
     sys.exit(app.exec_())
@@ -5,7 +5,7 @@ a = Analysis(
     ['PopupClock.py'],
     pathex=[],
     binaries=[],
-    datas=[('touxiang.ico', '.')],
+    datas=[('touxiang.ico', '.'), ('PopupClock.rcc', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
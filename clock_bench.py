@@ -0,0 +1,671 @@
+"""PopupClock 绘制性能基准
+
+在 offscreen 平台下运行，不需要显示器：
+
+    python clock_bench.py run --out bench_baseline.json
+    python clock_bench.py compare bench_baseline.json --threshold 1.15
+
+compare 会重新跑一遍所有用例，与基线的 p50 比较，超过阈值的用例
+标记为回退，并以退出码 1 结束，方便接到脚本里。
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import (QT_VERSION_STR, PYQT_VERSION_STR, QDateTime, QEvent, QPoint, QPointF, QTime, QTimer, Qt,
+                          QEventLoop, QProcess, QProcessEnvironment, qInstallMessageHandler)
+from PyQt5.QtGui import QImage, QMouseEvent, QPainter, QRegion
+from PyQt5.QtWidgets import QApplication, QWidget
+
+import PopupClock
+import popup_schedule
+import popup_state
+import session_state
+import single_instance
+from display_latency import percentile
+from settings_store import DEFAULTS as SETTINGS_DEFAULTS, SettingsStore
+
+# 注册的基准用例：名称 -> 构造函数，构造函数返回每次迭代要执行的函数
+CASES = {}
+
+# 参与测量的平台布局：windows 450x150，darwin 300x80
+LAYOUTS = ('windows', 'darwin')
+
+
+def bench_case(name):
+    def register(func):
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def make_popup(layout):
+    """按指定平台布局构造弹窗（不显示）"""
+    # 只用内存中的设置，基准不读写用户的设置文件
+    window = PopupClock.PopupClockClass(profile=PopupClock.PROFILES[layout],
+                                        settings=SettingsStore(persist=False))
+    window.finish_startup()
+    # 基准期间不需要节拍定时器和托盘图标
+    window.timer.stop()
+    window.tray_icon.hide()
+    return window
+
+
+def render_target(widget):
+    return QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+
+
+@bench_case('drawclock_paint')
+def drawclock_paint():
+    clock = PopupClock.DrawClock()
+    clock.resize(clock.minimumSize())
+    target = render_target(clock)
+
+    def step():
+        target.fill(0)
+        clock.render(target)
+
+    return step
+
+
+@bench_case('drawclock_tick_dirty')
+def drawclock_tick_dirty():
+    """逐秒走时，只重绘脏区域"""
+    clock = PopupClock.DrawClock()
+    clock.resize(clock.minimumSize())
+    target = render_target(clock)
+    clock.render(target)
+    now = [QTime(8, 0, 0)]
+
+    def step():
+        now[0] = now[0].addSecs(1)
+        clock.set_time(now[0])
+        clock.render(target, QPoint(), clock.last_dirty_region)
+
+    def extra():
+        stats = clock.paint_stats
+        return {'dirty_area_ratio': stats['requested_area'] / max(1, stats['full_area'])}
+
+    clock.reset_paint_stats()
+    step.extra = extra
+    return step
+
+
+def hand_render_case(mode):
+    def build():
+        """只测指针：固定表盘底图上按秒走一小时，sprite 模式先预热整个图集"""
+        profile = PopupClock.PROFILES['windows']
+        size = profile.clock_size
+        face = PopupClock.ClockFace(profile)
+        face.hand_render = mode
+        target = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        layers = face.dial_layers(size, size, target.devicePixelRatioF())
+        if mode == 'sprite':
+            # 测所有角度都已预热的稳定状态，容量上限的影响看 misses/evictions
+            PopupClock.HAND_ATLAS.clear()
+            PopupClock.HAND_ATLAS.set_capacity(64 * 1024 * 1024)
+            for _ in face.prewarm_sprites(size, size, 1.0):
+                pass
+        angles = [PopupClock.hand_angles(QTime(8, 0, 0).addSecs(i)) for i in range(3600)]
+        index = [0]
+
+        def step():
+            index[0] = (index[0] + 1) % len(angles)
+            target.fill(0)
+            painter = QPainter(target)
+            painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+            face.paint(painter, QPointF(0, 0), size, size, angles[index[0]], layers)
+            painter.end()
+
+        if mode == 'sprite':
+            step.extra = PopupClock.HAND_ATLAS.summary
+        return step
+
+    return build
+
+
+for _mode in PopupClock.HAND_RENDER_MODES:
+    bench_case('clock_hands_' + _mode)(hand_render_case(_mode))
+
+
+@bench_case('clock_hands_sprite_default')
+def clock_hands_sprite_default():
+    """sprite 模式按默认设置（图集容量 hand_atlas_mb）跑完整整一小时的秒节拍，每次迭代一小时
+
+    容量放不下的指针按矢量绘制；稳定状态下 misses/evictions 不应随迭代增长。
+    """
+    profile = PopupClock.PROFILES['windows']
+    size = profile.clock_size
+    face = PopupClock.ClockFace(profile)
+    face.hand_render = 'sprite'
+    target = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    layers = face.dial_layers(size, size, target.devicePixelRatioF())
+    PopupClock.HAND_ATLAS.clear()
+    PopupClock.HAND_ATLAS.set_capacity(int(SETTINGS_DEFAULTS['hand_atlas_mb'] * 1024 * 1024))
+    for _ in face.prewarm_sprites(size, size, 1.0):
+        pass
+    angles = [PopupClock.hand_angles(QTime(8, 0, 0).addSecs(i)) for i in range(3600)]
+
+    def step():
+        for hand_angles in angles:
+            target.fill(0)
+            painter = QPainter(target)
+            painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+            face.paint(painter, QPointF(0, 0), size, size, hand_angles, layers)
+            painter.end()
+
+    step.iterations = 3
+    step.warmup = 1
+    step.extra = PopupClock.HAND_ATLAS.summary
+    return step
+
+
+@bench_case('lcd_display')
+def lcd_display():
+    window = make_popup('windows')
+    lcd = window.lcdNumber
+    texts = [QTime(8, 0, 0).addSecs(i).toString("HH:mm:ss") for i in range(60)]
+    index = [0]
+
+    def step():
+        index[0] = (index[0] + 1) % len(texts)
+        lcd.display(texts[index[0]])
+
+    step.keep_alive = window
+    return step
+
+
+@bench_case('lcd_paint')
+def lcd_paint():
+    window = make_popup('windows')
+    lcd = window.lcdNumber
+    lcd.display("08:00:00")
+    target = render_target(lcd)
+
+    def step():
+        target.fill(0)
+        lcd.render(target)
+
+    step.keep_alive = window
+    return step
+
+
+@bench_case('lcd_tick_dirty')
+def lcd_tick_dirty():
+    """逐秒走时，只重绘字符变化的格子"""
+    window = make_popup('windows')
+    lcd = window.lcdNumber
+    lcd.display("08:00:00")
+    target = render_target(lcd)
+    lcd.render(target)
+    texts = [QTime(8, 0, 0).addSecs(i).toString("HH:mm:ss") for i in range(1, 3601)]
+    index = [0]
+
+    def step():
+        lcd.display(texts[index[0]])
+        index[0] = (index[0] + 1) % len(texts)
+        lcd.render(target, QPoint(), lcd.last_dirty_region)
+
+    def extra():
+        stats = lcd.glyph_stats
+        return {'cells_per_display': stats['cells_changed'] / max(1, stats['displays'])}
+
+    step.extra = extra
+    step.keep_alive = window
+    return step
+
+
+@bench_case('panel_paint')
+def panel_paint():
+    """外层背景框架的重绘：渐变背景和边框只在首次栅格化"""
+    window = make_popup('windows')
+    frame = window.frame1
+    target = render_target(frame)
+    flags = QWidget.RenderFlags(QWidget.DrawWindowBackground)  # 不含子控件，只测框架本身
+    frame.render(target, QPoint(), QRegion(), flags)
+    draws_before = frame.panel_stats['style_draws'] + window.frame_3.panel_stats['style_draws']
+    paints_before = frame.panel_stats['paints']
+
+    def step():
+        target.fill(0)
+        frame.render(target, QPoint(), QRegion(), flags)
+
+    def extra():
+        paints = max(1, frame.panel_stats['paints'] - paints_before)
+        draws = frame.panel_stats['style_draws'] + window.frame_3.panel_stats['style_draws'] - draws_before
+        return {'style_draws_per_paint': draws / paints,
+                'rasterizations': frame.panel_stats['rasterizations']}
+
+    step.extra = extra
+    step.keep_alive = window
+    return step
+
+
+def grab_case(layout):
+    def build():
+        window = make_popup(layout)
+
+        def step():
+            window.grab()
+
+        step.keep_alive = window
+        return step
+
+    return build
+
+
+for _layout in LAYOUTS:
+    bench_case('window_grab_' + _layout)(grab_case(_layout))
+
+
+@bench_case('update_display_visible')
+def update_display_visible():
+    window = make_popup('windows')
+    # 常显状态：每次都会刷新LCD和表盘
+    window.debug_mode = True
+    window.popup_state.force(popup_state.SHOWN)
+
+    def step():
+        window.update_display()
+
+    step.keep_alive = window
+    return step
+
+
+@bench_case('update_display_dormant')
+def update_display_dormant():
+    window = make_popup('windows')
+    window.enter_dormant()
+
+    def step():
+        window.update_display()
+        window.popup_state.force(popup_state.HIDDEN)  # 正好落在弹窗边界时不让动画改变状态
+
+    step.keep_alive = window
+    return step
+
+
+def transition_case(mode):
+    def build():
+        """进入动画逐帧推进（暂停后手动设置时间），每帧刷新一次待处理的绘制"""
+        window = make_popup('windows')
+        window.set_animation_mode(mode)
+        window.first_run = False  # 不触发首次显示的动画序列
+        window.show()
+        QApplication.processEvents()
+        window.popup_state.request(popup_state.SHOW)
+        group = window.enter_anim_group
+        group.pause()
+        duration = group.totalDuration()
+        elapsed = [0]
+
+        def step():
+            elapsed[0] = (elapsed[0] + 16) % duration
+            group.setCurrentTime(elapsed[0])
+            QApplication.processEvents()
+
+        step.keep_alive = window
+        return step
+
+    return build
+
+
+for _mode in PopupClock.ANIMATION_MODES:
+    bench_case('transition_' + _mode)(transition_case(_mode))
+
+
+@bench_case('session_lock_cycle')
+def session_lock_cycle():
+    """锁屏再解锁一次：暂停所有定时器，恢复时一次追赶帧并重新对齐"""
+    session = session_state.FakeSessionProvider()
+    window = PopupClock.PopupClockClass(profile=PopupClock.PROFILES['windows'],
+                                        settings=SettingsStore(persist=False), session=session)
+    window.finish_startup()
+    window.tray_icon.hide()
+
+    def step():
+        session.set_state(session_state.LOCKED)
+        session.set_state(session_state.ACTIVE)
+
+    step.keep_alive = window
+    return step
+
+
+@bench_case('second_launch_forward')
+def second_launch_forward():
+    """再次启动 PopupClock.py 把命令交给已运行的实例：从启动进程到它退出的整段时间"""
+    name = "PopupClock-bench-%d" % os.getpid()
+    window = make_popup('windows')
+    control = single_instance.ControlServer(window.handle_command, name=name)
+    control.listen()
+    environ = QProcessEnvironment.systemEnvironment()
+    environ.insert(single_instance.INSTANCE_ENV, name)
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PopupClock.py')
+
+    def step():
+        process = QProcess()
+        process.setProcessEnvironment(environ)
+        process.start(sys.executable, [script, 'toggle-always-show'])
+        # 服务端在本进程里，等待期间必须处理事件
+        while process.state() != QProcess.NotRunning:
+            QApplication.processEvents()
+        if process.exitCode() != 0:
+            raise RuntimeError(bytes(process.readAll()).decode('utf-8', 'replace'))
+
+    step.iterations = 10
+    step.warmup = 1
+    step.keep_alive = (window, control)
+    return step
+
+
+def drag_case(rate_hz, duration_ms=250):
+    def build():
+        """按真实时间回放一段鼠标拖动事件流，统计实际发出的窗口移动次数"""
+        window = make_popup('windows')
+        window.show()
+        QApplication.processEvents()
+        start_pos = QPoint(200, 200)
+        window.move(start_pos)
+        count = rate_hz * duration_ms // 1000
+        interval = 1.0 / rate_hz
+        grab = QPoint(40, 40)
+
+        def mouse(kind, offset, buttons):
+            global_pos = start_pos + grab + offset
+            return QMouseEvent(kind, QPointF(grab + offset), QPointF(global_pos),
+                               Qt.LeftButton, buttons, Qt.NoModifier)
+
+        def step():
+            window.move(start_pos)
+            window.last_click_time = QTime(0, 0)  # 不让连续回放被识别成双击
+            window.mousePressEvent(mouse(QEvent.MouseButtonPress, QPoint(), Qt.LeftButton))
+            begin = time.perf_counter()
+            for i in range(1, count + 1):
+                # 匀速向右下方拖动，事件之间照常处理定时器
+                while time.perf_counter() - begin < i * interval:
+                    QApplication.processEvents()
+                window.mouseMoveEvent(mouse(QEvent.MouseMove, QPoint(i, i // 2), Qt.LeftButton))
+            window.mouseReleaseEvent(mouse(QEvent.MouseButtonRelease, QPoint(count, count // 2), Qt.NoButton))
+
+        def extra():
+            stats = window.drag_stats
+            return {'events': stats['events'], 'moves': stats['moves'],
+                    'moves_per_event': stats['moves'] / max(1, stats['events'])}
+
+        step.extra = extra
+        step.iterations = 5
+        step.warmup = 1
+        step.keep_alive = window
+        return step
+
+    return build
+
+
+for _rate in (125, 1000):
+    bench_case('drag_replay_%dhz' % _rate)(drag_case(_rate))
+
+
+def tick_latency_case(mode, seconds=4):
+    def build():
+        """常显状态下真实走时若干秒，统计每个显示秒从整秒边界到面板绘制的延迟"""
+        settings = SettingsStore(persist=False)
+        settings.set('timing_mode', mode)
+        window = PopupClock.PopupClockClass(profile=PopupClock.PROFILES['windows'], settings=settings)
+        window.finish_startup()
+        window.tray_icon.hide()
+        window.first_run = False
+        window.debug_mode = True
+        window.show()
+        window.leave_dormant()
+        window.popup_state.force(popup_state.SHOWN)
+
+        def step():
+            window.latency.reset()
+            window.schedule_next_tick()
+            loop = QEventLoop()
+            QTimer.singleShot(seconds * 1000 + 100, loop.quit)
+            loop.exec_()
+            window.timer.stop()
+
+        def extra():
+            summary = window.latency.summary()
+            return {'latency_p50_ms': summary['p50_ms'], 'latency_p99_ms': summary['p99_ms'],
+                    'latency_max_ms': summary['max_ms'], 'seconds_shown': summary['count'],
+                    'missed': summary['missed']}
+
+        step.extra = extra
+        step.iterations = 1
+        step.warmup = 0
+        step.keep_alive = window
+        return step
+
+    return build
+
+
+for _mode in PopupClock.TIMING_MODES:
+    bench_case('tick_latency_' + _mode)(tick_latency_case(_mode))
+
+
+def multiclock_case(count, hand_render='vector'):
+    def build():
+        # 本地 + 若干时区交替，表盘尺寸相同
+        zones = [(None, 'Asia/Tokyo', 'Europe/London', 'America/New_York')[i % 4] for i in range(count)]
+        widget = PopupClock.MultiClockWidget(zones, columns=10, hand_render=hand_render)
+        widget.resize(widget.sizeHint())
+        if hand_render == 'sprite':
+            # 默认图集容量下的稳定状态：放得下的指针全部预热
+            PopupClock.HAND_ATLAS.clear()
+            PopupClock.HAND_ATLAS.set_capacity(int(SETTINGS_DEFAULTS['hand_atlas_mb'] * 1024 * 1024))
+            for _ in widget.prewarm_sprites():
+                pass
+        target = render_target(widget)
+        now = [QDateTime(QDateTime.currentDateTime().date(), QTime(8, 0, 0))]
+        builds_before = PopupClock.DIAL_CACHE.builds
+
+        def step():
+            now[0] = now[0].addSecs(1)
+            widget.set_time(now[0])
+            target.fill(0)
+            widget.render(target)
+
+        # 整轮运行中表盘实际栅格化的次数
+        step.extra = lambda: {'dial_builds': PopupClock.DIAL_CACHE.builds - builds_before}
+        step.keep_alive = widget
+        return step
+
+    return build
+
+
+for _count in (1, 50):
+    bench_case('multiclock_tick_%d' % _count)(multiclock_case(_count))
+    bench_case('multiclock_tick_%d_sprite' % _count)(multiclock_case(_count, 'sprite'))
+
+
+@bench_case('vector_clocks_50')
+def vector_clocks_50():
+    """对照组：50 个表盘每帧都直接画渐变背景和中心点（缓存前的画法）"""
+    face = PopupClock.ClockFace(PopupClock.current_profile())
+    size = PopupClock.current_profile().clock_size
+    target = QImage(size * 10, size * 5, QImage.Format_ARGB32_Premultiplied)
+    now = [QTime(8, 0, 0)]
+    scale = face.scale_for(size, size)
+
+    def step():
+        now[0] = now[0].addSecs(1)
+        hour_angle, minute_angle, second_angle = PopupClock.hand_angles(now[0])
+        target.fill(0)
+        painter = QPainter(target)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        for index in range(50):
+            row, column = divmod(index, 10)
+            painter.save()
+            painter.translate(column * size + size / 2, row * size + size / 2)
+            painter.scale(scale, scale)
+            face.draw_background(painter)
+            face.draw_hour_hand(painter, hour_angle)
+            face.draw_minute_hand(painter, minute_angle)
+            face.draw_second_hand(painter, second_angle)
+            face.draw_centre(painter)
+            painter.restore()
+        painter.end()
+
+    return step
+
+
+@bench_case('schedule_next_edge_5000')
+def schedule_next_edge_5000():
+    """5000 条随机规则编译后，查询下一个弹窗边界"""
+    rng = random.Random(13)
+    rules = ["%d %d %d %d" % (rng.randrange(60), rng.randrange(60), rng.randrange(24), rng.randrange(1, 8))
+             for _ in range(5000)]
+    rules.append("0 * 0-6 * suppress lead=0 trail=60")
+    start = time.perf_counter()
+    schedule = popup_schedule.PopupSchedule(rules)
+    compile_ms = (time.perf_counter() - start) * 1000
+    position = [0]
+
+    def step():
+        position[0] = (position[0] + 7919) % popup_schedule.WEEK
+        schedule.next_edge(position[0])
+        schedule.contains(position[0])
+
+    step.extra = lambda: {'compile_ms': compile_ms, 'intervals': len(schedule)}
+    return step
+
+
+def summarize(samples_ns):
+    values = sorted(v / 1000.0 for v in samples_ns)  # 微秒
+    return {
+        'n': len(values),
+        'mean_us': sum(values) / len(values),
+        'min_us': values[0],
+        'p50_us': percentile(values, 50),
+        'p90_us': percentile(values, 90),
+        'p99_us': percentile(values, 99),
+        'max_us': values[-1],
+    }
+
+
+def measure(step, iterations, warmup):
+    for _ in range(warmup):
+        step()
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        start = clock()
+        step()
+        samples.append(clock() - start)
+    return summarize(samples)
+
+
+def run_cases(names, iterations, warmup, rounds=1):
+    """每个用例跑 rounds 轮，取 p50 最低的一轮，降低机器噪声的影响"""
+    results = {}
+    for name in names:
+        step = CASES[name]()
+        best = None
+        # 单次迭代本身很长的用例可以自带迭代次数
+        case_iterations = getattr(step, 'iterations', iterations)
+        case_warmup = getattr(step, 'warmup', warmup)
+        for _ in range(rounds):
+            stats = measure(step, case_iterations, case_warmup)
+            if hasattr(step, 'extra'):
+                stats.update(step.extra())
+            if best is None or stats['p50_us'] < best['p50_us']:
+                best = stats
+            QApplication.processEvents()
+        results[name] = best
+    return results
+
+
+def metadata():
+    return {
+        'python': platform.python_version(),
+        'qt': QT_VERSION_STR,
+        'pyqt': PYQT_VERSION_STR,
+        'system': platform.system(),
+        'qpa': QApplication.platformName(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def print_results(results):
+    print("%-28s %8s %10s %10s %10s %10s" % ('case', 'n', 'mean(us)', 'p50(us)', 'p90(us)', 'p99(us)'))
+    for name, stats in results.items():
+        print("%-28s %8d %10.1f %10.1f %10.1f %10.1f" % (
+            name, stats['n'], stats['mean_us'], stats['p50_us'], stats['p90_us'], stats['p99_us']))
+
+
+def compare(baseline, current, threshold):
+    """返回回退的用例列表"""
+    regressions = []
+    print("%-28s %10s %10s %8s" % ('case', 'base p50', 'now p50', 'ratio'))
+    for name, stats in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print("%-28s %10s %10.1f %8s" % (name, '-', stats['p50_us'], 'new'))
+            continue
+        ratio = stats['p50_us'] / base['p50_us'] if base['p50_us'] > 0 else 1.0
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print("%-28s %10.1f %10.1f %8.2f%s" % (name, base['p50_us'], stats['p50_us'], ratio, flag))
+    return regressions
+
+
+def quiet_qt_messages(mode, context, message):
+    # offscreen 平台会对透明度/置顶等调用刷大量警告，基准输出里不需要
+    pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PopupClock 绘制性能基准")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help="运行基准并保存为JSON基线")
+    run_parser.add_argument('--out', default='bench_baseline.json')
+    compare_parser = sub.add_parser('compare', help="运行基准并与基线比较")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('--threshold', type=float, default=1.15,
+                                help="p50 超过基线的倍数即视为回退")
+    for p in (run_parser, compare_parser):
+        p.add_argument('--iterations', type=int, default=500)
+        p.add_argument('--warmup', type=int, default=20)
+        p.add_argument('--rounds', type=int, default=3)
+        p.add_argument('--case', action='append', choices=sorted(CASES),
+                       help="只运行指定用例，可重复")
+    args = parser.parse_args(argv)
+
+    qInstallMessageHandler(quiet_qt_messages)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    names = args.case or list(CASES)
+    results = run_cases(names, args.iterations, args.warmup, args.rounds)
+    print_results(results)
+
+    if args.command == 'run':
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump({'meta': metadata(), 'results': results}, f, indent=2)
+        print("基线已保存到 %s" % args.out)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print()
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        print("回退用例: %s" % ', '.join(regressions))
+        return 1
+    print("没有回退")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,424 @@
+"""PopupClock 离线帧导出
+
+在 offscreen 平台下把表盘（clock）或整个弹窗（popup）按一段时间和动画进度
+渲染成帧，输出为 PNG 序列、APNG 或 GIF：
+
+    python clock_export.py clock.gif --target popup --start 10:59:55 --duration 3 --progress 0:1
+    python clock_export.py frames/ --target clock --smooth --fps 50 --duration 60
+
+帧的绘制（QPainter 画到 QImage）和编码在线程池里并行进行，写出按帧顺序流式
+进行，同一时刻最多只有 2 × workers 帧在内存里。popup 的控件只能在 GUI 线程
+绘制，所以每个整秒在主线程渲染一次弹窗，滑入位移和透明度的合成放到线程池里。
+GIF 需要 Pillow（pip install Pillow），PNG 序列和 APNG 不需要额外依赖。
+"""
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QBuffer, QByteArray, QEasingCurve, QIODevice, QPointF, QTime, Qt
+from PyQt5.QtGui import QColor, QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+import PopupClock
+from settings_store import SettingsStore
+
+try:
+    from PIL import GifImagePlugin, Image
+except ImportError:  # 只有导出 GIF 时才需要
+    Image = GifImagePlugin = None
+
+TARGETS = ('clock', 'popup')
+FORMATS = ('png', 'apng', 'gif')
+DAY = 24 * 60 * 60
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 一帧：序号、一天内的秒数（可带小数）、popup 的滑入位移（像素）和透明度
+FrameSpec = namedtuple('FrameSpec', 'index seconds offset opacity')
+
+
+def parse_clock_time(text):
+    """HH:MM:SS 或 HH:MM:SS.zzz -> 一天内的秒数"""
+    parts = text.split(':')
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError("时间格式应为 HH:MM:SS")
+    hour, minute, second = int(parts[0]), int(parts[1]), float(parts[2])
+    return (hour * 3600 + minute * 60 + second) % DAY
+
+
+def parse_range(text):
+    """'a:b' 或单个值 -> (a, b)"""
+    start, _, stop = text.partition(':')
+    start = float(start)
+    return start, float(stop) if stop else start
+
+
+def qtime_at(seconds):
+    seconds = int(seconds) % DAY
+    return QTime(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def angles_at(seconds, smooth):
+    """指针角度；smooth 时秒针连续扫过，否则与 DrawClock 一样按整秒跳动"""
+    if not smooth:
+        return PopupClock.hand_angles(qtime_at(seconds))
+    seconds %= DAY
+    return 30.0 * seconds / 3600, 6.0 * (seconds % 3600) / 60, 6.0 * (seconds % 60)
+
+
+def transition_at(progress, mode, width):
+    """进入过渡在 progress（0-1）处的 (x 位移, 透明度)，与 PopupClockClass.ensure_animations 一致"""
+    progress = min(1.0, max(0.0, progress))
+    offset, opacity = 0.0, 1.0
+    if mode != 'opacity':
+        offset = -(1.0 - QEasingCurve(QEasingCurve.OutCubic).valueForProgress(progress)) * width
+    if mode != 'geometry':
+        # 关键帧 0 -> 0，0.5 -> 1，之后保持不透明
+        opacity = min(1.0, progress * 2)
+    return offset, opacity
+
+
+def frame_specs(start, duration, fps, progress, mode, width):
+    count = max(1, int(round(duration * fps)))
+    first, last = progress
+    for index in range(count):
+        fraction = index / (count - 1) if count > 1 else 1.0
+        offset, opacity = transition_at(first + (last - first) * fraction, mode, width)
+        yield FrameSpec(index, start + index / fps, offset, opacity)
+
+
+def image_bytes(image, fmt='PNG'):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, fmt)
+    buffer.close()
+    return bytes(data)
+
+
+class ClockRenderer:
+    """只画表盘：背景层和中心点层栅格化一次（QImage，可跨线程共享），每个线程各用一个 ClockFace"""
+
+    def __init__(self, profile, scale=1.0, smooth=False, background=None):
+        self.profile = profile
+        self.size = profile.clock_size
+        self.scale = scale
+        self.smooth = smooth
+        self.background = background
+        self.layers = PopupClock.ClockFace(profile).render_dial_layers(self.size, self.size, scale, image=True)
+        self.local = threading.local()
+
+    def prepare(self, spec):
+        """主线程部分：表盘不需要"""
+        return spec
+
+    def render(self, spec):
+        face = getattr(self.local, 'face', None)
+        if face is None:
+            face = self.local.face = PopupClock.ClockFace(self.profile)
+        side = int(round(self.size * self.scale))
+        image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.scale)
+        image.fill(self.background or Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        face.paint(painter, QPointF(0, 0), self.size, self.size, angles_at(spec.seconds, self.smooth), self.layers)
+        painter.end()
+        return image
+
+
+class PopupRenderer:
+    """整个弹窗：每个整秒在主线程渲染一次控件，线程池里按进度合成位移和透明度"""
+
+    def __init__(self, profile, scale=1.0, background=None):
+        self.window = PopupClock.PopupClockClass(profile=profile, settings=SettingsStore(persist=False))
+        self.window.finish_startup()
+        # 导出期间不需要节拍定时器和托盘图标
+        self.window.timer.stop()
+        self.window.tray_icon.hide()
+        self.window.layout().activate()
+        self.scale = scale
+        self.background = background
+        self.base_second = None
+        self.base = None
+        self.render_ms = 0.0  # 主线程渲染控件的总耗时
+
+    def prepare(self, spec):
+        """帧按时间顺序提交，只保留当前这一秒的控件图像"""
+        second = int(spec.seconds) % DAY
+        if second != self.base_second:
+            begin = time.perf_counter()
+            self.window.refresh_display(qtime_at(second))
+            size = self.window.size() * self.scale
+            image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(self.scale)
+            image.fill(Qt.transparent)
+            self.window.render(image)
+            self.base_second, self.base = second, image
+            self.render_ms += (time.perf_counter() - begin) * 1000
+        return spec, self.base
+
+    def render(self, job):
+        spec, base = job
+        image = QImage(base.size(), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.scale)
+        image.fill(self.background or Qt.transparent)
+        painter = QPainter(image)
+        painter.setOpacity(spec.opacity)
+        painter.drawImage(QPointF(spec.offset, 0), base)
+        painter.end()
+        return image
+
+
+class PngSequenceWriter:
+    """每帧一个 PNG 文件；path 为目录时文件名为 frame_00000.png，也可以直接给出 % 格式"""
+
+    def __init__(self, path, frame_count, delay_ms, loop):
+        if '%' not in path:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, 'frame_%05d.png')
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.pattern = path
+        self.index = 0
+
+    @staticmethod
+    def encode(image):
+        return image_bytes(image)
+
+    def write(self, data):
+        with open(self.pattern % self.index, 'wb') as f:
+            f.write(data)
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+class ApngWriter:
+    """把各帧独立编码好的 PNG 拼成 APNG：第一帧的 IDAT 作为默认图像，之后的帧改写成 fdAT"""
+
+    def __init__(self, path, frame_count, delay_ms, loop):
+        self.file = open(path, 'wb')
+        self.frame_count = frame_count
+        self.delay = (int(round(delay_ms)), 1000)
+        self.loop = loop
+        self.sequence = 0
+        self.header = None
+
+    @staticmethod
+    def encode(image):
+        # 统一成带 alpha 的格式，保证每帧的 IHDR 一致
+        return image_bytes(image.convertToFormat(QImage.Format_ARGB32))
+
+    @staticmethod
+    def chunks(data):
+        if not data.startswith(PNG_SIGNATURE):
+            raise ValueError("不是 PNG 数据")
+        position = len(PNG_SIGNATURE)
+        while position < len(data):
+            length, kind = struct.unpack('>I4s', data[position:position + 8])
+            yield kind, data[position + 8:position + 8 + length]
+            position += 12 + length
+
+    def chunk(self, kind, body):
+        self.file.write(struct.pack('>I', len(body)) + kind + body
+                        + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff))
+
+    def write(self, data):
+        chunks = list(self.chunks(data))
+        header = dict(chunks)[b'IHDR']
+        width, height = struct.unpack('>II', header[:8])
+        if self.header is None:
+            self.header = header
+            self.file.write(PNG_SIGNATURE)
+            self.chunk(b'IHDR', header)
+            self.chunk(b'acTL', struct.pack('>II', self.frame_count, self.loop))
+        elif header != self.header:
+            raise ValueError("APNG 各帧的尺寸和格式必须一致")
+        first = self.sequence == 0
+        # fcTL：序号、尺寸、偏移、延迟、dispose_op=0、blend_op=0（直接覆盖）
+        self.chunk(b'fcTL', struct.pack('>IIIIIHHBB', self.sequence, width, height, 0, 0,
+                                        self.delay[0], self.delay[1], 0, 0))
+        self.sequence += 1
+        for kind, body in chunks:
+            if kind != b'IDAT':
+                continue
+            if first:
+                self.chunk(b'IDAT', body)
+            else:
+                self.chunk(b'fdAT', struct.pack('>I', self.sequence) + body)
+                self.sequence += 1
+
+    def close(self):
+        self.chunk(b'IEND', b'')
+        self.file.close()
+
+
+class GifWriter:
+    """逐帧写 GIF：每帧在工作线程里量化、带局部调色板编码，主线程只负责拼接"""
+
+    def __init__(self, path, frame_count, delay_ms, loop):
+        if Image is None:
+            raise RuntimeError("导出 GIF 需要 Pillow：pip install Pillow")
+        self.path = path
+        self.file = None
+        self.loop = loop
+
+    @staticmethod
+    def encode_with(delay_ms):
+        quantize = getattr(getattr(Image, 'Quantize', Image), 'FASTOCTREE')
+
+        def encode(image):
+            # GIF 只有 1 位透明，先合成到白底上
+            flat = QImage(image.size(), QImage.Format_RGB888)
+            flat.fill(Qt.white)
+            painter = QPainter(flat)
+            painter.drawImage(0, 0, image)
+            painter.end()
+            pixels = flat.constBits()
+            pixels.setsize(flat.sizeInBytes())
+            frame = Image.frombuffer('RGB', (flat.width(), flat.height()), bytes(pixels),
+                                     'raw', 'RGB', flat.bytesPerLine(), 1)
+            frame = frame.quantize(256, method=quantize)
+            data = b''.join(GifImagePlugin.getdata(frame, duration=delay_ms, include_color_table=True))
+            return frame.size, data
+
+        return encode
+
+    def write(self, data):
+        (width, height), body = data
+        if self.file is None:
+            self.file = open(self.path, 'wb')
+            # 逻辑屏幕描述符不带全局调色板，之后是 NETSCAPE2.0 循环扩展
+            self.file.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0, 0, 0))
+            self.file.write(b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00')
+        self.file.write(body)
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(b';')
+            self.file.close()
+
+
+WRITERS = {'png': PngSequenceWriter, 'apng': ApngWriter, 'gif': GifWriter}
+
+
+def output_format(path):
+    """按路径猜输出格式：.gif、.png/.apng 为单个动画文件，目录或 % 格式为 PNG 序列"""
+    lower = path.lower()
+    if lower.endswith('.gif'):
+        return 'gif'
+    if '%' in path or path.endswith(os.sep) or os.path.isdir(path):
+        return 'png'
+    if lower.endswith(('.png', '.apng')):
+        return 'apng'
+    return 'png'
+
+
+def export(renderer, specs, writer, encode, workers):
+    """并行绘制和编码，按帧顺序写出；返回统计"""
+    stats = {'frames': 0, 'render_ms': 0.0, 'encode_ms': 0.0, 'write_ms': 0.0}
+    lock = threading.Lock()
+
+    def work(job):
+        begin = time.perf_counter()
+        image = renderer.render(job)
+        rendered = time.perf_counter()
+        data = encode(image)
+        with lock:
+            stats['render_ms'] += (rendered - begin) * 1000
+            stats['encode_ms'] += (time.perf_counter() - rendered) * 1000
+        return data
+
+    def drain(future):
+        data = future.result()
+        begin = time.perf_counter()
+        writer.write(data)
+        stats['write_ms'] += (time.perf_counter() - begin) * 1000
+        stats['frames'] += 1
+
+    begin = time.perf_counter()
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export') as pool:
+        for spec in specs:
+            pending.append(pool.submit(work, renderer.prepare(spec)))
+            # 限制在途帧数，输出再长内存也不会增长
+            while len(pending) >= workers * 2:
+                drain(pending.popleft())
+        while pending:
+            drain(pending.popleft())
+    writer.close()
+    stats['wall_ms'] = (time.perf_counter() - begin) * 1000
+    stats['fps'] = stats['frames'] / (stats['wall_ms'] / 1000) if stats['wall_ms'] else 0.0
+    stats['workers'] = workers
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PopupClock 离线帧导出")
+    parser.add_argument('out', help="输出：.gif、.png/.apng（动画），目录或含 %%05d 的文件名（PNG 序列）")
+    parser.add_argument('--format', choices=FORMATS, help="默认按输出路径判断")
+    parser.add_argument('--target', choices=TARGETS, default='clock')
+    parser.add_argument('--profile', choices=sorted(PopupClock.PROFILES), default='windows')
+    parser.add_argument('--start', type=parse_clock_time, help="起始时间 HH:MM:SS，默认当前时间")
+    parser.add_argument('--duration', type=float, default=2.0, help="导出多少秒")
+    parser.add_argument('--fps', type=float, default=25.0)
+    parser.add_argument('--progress', type=parse_range, default=(1.0, 1.0),
+                        help="popup 的进入过渡进度，'0:1' 表示在导出时长内从头滑入")
+    parser.add_argument('--transition', choices=PopupClock.ANIMATION_MODES, default='classic',
+                        help="popup 过渡的样式")
+    parser.add_argument('--smooth', action='store_true', help="clock 的秒针连续扫过而不是逐秒跳动")
+    parser.add_argument('--scale', type=float, default=1.0, help="设备像素比，2 表示输出两倍分辨率")
+    parser.add_argument('--background', type=QColor, help="背景色，默认透明（GIF 为白色）")
+    parser.add_argument('--loop', type=int, default=0, help="动画循环次数，0 为无限")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--report', help="把吞吐量统计另存为 JSON")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    profile = PopupClock.PROFILES[args.profile]
+    PopupClock.set_profile(profile)
+    if args.target == 'clock':
+        renderer = ClockRenderer(profile, args.scale, args.smooth, args.background)
+        width = profile.clock_size
+    else:
+        renderer = PopupRenderer(profile, args.scale, args.background)
+        width = profile.window_width
+    start = args.start if args.start is not None else parse_clock_time(QTime.currentTime().toString('HH:mm:ss'))
+    frame_count = max(1, int(round(args.duration * args.fps)))
+    delay_ms = 1000.0 / args.fps
+
+    fmt = args.format or output_format(args.out)
+    if fmt == 'gif' and Image is None:
+        parser.error("导出 GIF 需要 Pillow（pip install Pillow），或者改用 .png 输出 APNG")
+    writer = WRITERS[fmt](args.out, frame_count, delay_ms, args.loop)
+    encode = GifWriter.encode_with(delay_ms) if fmt == 'gif' else writer.encode
+    specs = frame_specs(start, args.duration, args.fps, args.progress, args.transition, width)
+    stats = export(renderer, specs, writer, encode, max(1, args.workers))
+    if isinstance(renderer, PopupRenderer):
+        stats['widget_render_ms'] = renderer.render_ms
+
+    print("%d 帧 -> %s（%s），%.1f ms，%.1f 帧/秒，%d 个线程" % (
+        stats['frames'], args.out, fmt, stats['wall_ms'], stats['fps'], stats['workers']))
+    print("累计：绘制 %.1f ms，编码 %.1f ms，写出 %.1f ms" % (
+        stats['render_ms'], stats['encode_ms'], stats['write_ms']))
+    if fmt == 'gif' and not math.isclose(delay_ms, round(delay_ms / 10) * 10):
+        print("注意：GIF 的帧间隔以 10 ms 为单位，%.1f ms 会被取整" % delay_ms)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""PopupClock 弹窗时间表的快进模拟
+
+用 time_source.VirtualClock 代替真实时间驱动 PopupClockClass：节拍定时器、
+双击计时器、过渡动画和锁屏暂停都按虚拟时间推进，不进入 Qt 事件循环，
+在 offscreen 平台下几秒钟就能跑完一整天，而且每次结果完全相同：
+
+    python clock_sim.py --start "2026-10-16 00:00:00" --hours 24 --check
+    python clock_sim.py --rule "0 0 9-18 1-5" --double-click 10:00:05 --lock 12:10:00-13:10:00 --check
+
+每次显示/隐藏过渡（popup_state 的状态变化）都带着虚拟时间戳记录下来
+（show-start、shown、hide-start、hidden）。--check 按规则算出应有的弹窗时段，检查每个时段准时弹出、准时收起，
+双击后不再弹出、锁屏期间没有任何过渡；不符合时以退出码 1 结束，可以直接当作
+时间表和动画状态机的回归测试。
+"""
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QDateTime, qInstallMessageHandler
+from PyQt5.QtWidgets import QApplication
+
+import PopupClock
+import popup_state
+import session_state
+from popup_schedule import PopupSchedule, rules_from_settings
+from settings_store import SettingsStore
+from time_source import VirtualClock
+
+DATETIME_FORMAT = "yyyy-MM-dd HH:mm:ss"
+# 状态机进入的状态 -> 记录的事件名
+TRANSITIONS = {popup_state.ENTERING: 'show-start', popup_state.SHOWN: 'shown',
+               popup_state.EXITING: 'hide-start', popup_state.HIDDEN: 'hidden'}
+
+
+def parse_datetime(text):
+    value = QDateTime.fromString(text, DATETIME_FORMAT)
+    if not value.isValid():
+        raise argparse.ArgumentTypeError("时间 %r 应为 YYYY-MM-DD HH:MM:SS" % text)
+    return value
+
+
+def offset_ms(start, text):
+    """模拟开始后的毫秒数；HH:MM:SS 取开始之后第一次到达该时刻，也可以写完整日期时间"""
+    if len(text) > 8:
+        when = parse_datetime(text)
+    else:
+        when = QDateTime.fromString(start.toString("yyyy-MM-dd ") + text, DATETIME_FORMAT)
+        if not when.isValid():
+            raise ValueError("时间 %r 应为 HH:MM:SS" % text)
+        if when < start:
+            when = when.addDays(1)
+    return start.msecsTo(when)
+
+
+def quiet_qt_messages(mode, context, message):
+    # offscreen 平台会对透明度/置顶等调用刷大量警告
+    pass
+
+
+class Simulation:
+    """一个使用虚拟时钟的弹窗和它的过渡记录"""
+
+    def __init__(self, start, rules=None, profile='windows', frame_ms=16, history=None):
+        self.clock = VirtualClock(start, frame_ms)
+        settings = SettingsStore(persist=False)
+        if rules:
+            settings.set('schedule_rules', list(rules))
+        self.session = session_state.FakeSessionProvider()
+        self.window = PopupClock.PopupClockClass(profile=PopupClock.PROFILES[profile], settings=settings,
+                                                 session=self.session, time_source=self.clock)
+        # [(虚拟毫秒, 事件名)]；history 限制保留的条数（长时间运行时），counts 始终是总数
+        self.transitions = collections.deque(maxlen=history)
+        self.counts = collections.Counter()
+        self.window.popup_state.state_changed.connect(self.on_popup_state)
+        self.window.finish_startup()
+        self.window.tray_icon.hide()
+        self.window.show()
+
+    def on_popup_state(self, old, new):
+        event = TRANSITIONS[new]
+        self.transitions.append((self.clock.elapsed_ms, event))
+        self.counts[event] += 1
+
+    def double_click_at(self, ms):
+        self.clock.schedule(ms, self.window.handle_double_click)
+
+    def lock_between(self, begin_ms, end_ms):
+        self.clock.schedule(begin_ms, lambda: self.session.set_state(session_state.LOCKED))
+        self.clock.schedule(end_ms, lambda: self.session.set_state(session_state.ACTIVE))
+
+    def run(self, duration_ms):
+        self.clock.run_until(duration_ms)
+
+    def time_text(self, ms):
+        return self.clock.start.addMSecs(ms).toString("yyyy-MM-dd HH:mm:ss.zzz")
+
+
+def schedule_edges(schedule, start, duration_ms):
+    """模拟区间内的所有显示/隐藏边界 [(毫秒, 'show' 或 'hide')]"""
+    origin = PopupClock.week_position(start)
+    edges = []
+    position = origin
+    while True:
+        found = schedule.next_edge(position)
+        if found is None:
+            return edges
+        distance, kind = found
+        position += distance
+        ms = (position - origin) * 1000 - start.time().msec()
+        if ms > duration_ms:
+            return edges
+        edges.append((ms, kind))
+
+
+def check(sim, schedule, duration_ms, clicks, locks, tolerance_ms):
+    """返回发现的问题列表"""
+    problems = []
+    events = sim.transitions
+    # 启动时的弹出和收起不受时间表控制，从第一次 hidden 之后开始检查
+    settled = next((ms for ms, event in events if event == 'hidden'), None)
+    if settled is None:
+        return ["启动序列没有收起"]
+    locked = lambda ms: any(begin <= ms < end for begin, end in locks)
+    starts = {event: [ms for ms, name in events if name == event and ms > settled]
+              for event in ('show-start', 'hide-start')}
+
+    def near(times, ms):
+        return any(abs(t - ms) <= tolerance_ms for t in times)
+
+    edges = [(ms, kind) for ms, kind in schedule_edges(schedule, sim.clock.start, duration_ms) if ms > settled]
+    show_edges = [ms for ms, kind in edges if kind == 'show']
+    hide_edges = [ms for ms, kind in edges if kind == 'hide']
+    # 每次弹出都落在时段开始；每次收起都落在时段结束、双击或解锁时
+    for ms in starts['show-start']:
+        if not near(show_edges, ms):
+            problems.append("%s 在时段之外弹出" % sim.time_text(ms))
+    unlocks = [end for begin, end in locks]
+    for ms in starts['hide-start']:
+        if not (near(hide_edges, ms) or near(clicks, ms) or near(unlocks, ms)):
+            problems.append("%s 在时段结束之前收起" % sim.time_text(ms))
+    for ms, event in events:
+        if ms > settled and locked(ms) and not any(ms == begin for begin, end in locks):
+            problems.append("%s 锁屏期间发生过渡 %s" % (sim.time_text(ms), event))
+    # 每个没有锁屏、没有双击打断的完整时段都准时弹出、准时收起
+    for begin, kind in edges:
+        if kind != 'show':
+            continue
+        end = next((ms for ms, k in edges if k == 'hide' and ms > begin), None)
+        if end is None:
+            continue
+        if any(begin - tolerance_ms <= c <= end for c in clicks) or any(b <= end and e >= begin for b, e in locks):
+            continue
+        if not near(starts['show-start'], begin):
+            problems.append("%s 的时段没有弹出" % sim.time_text(begin))
+        if not near(starts['hide-start'], end):
+            problems.append("%s 的时段没有按时收起" % sim.time_text(end))
+    # 双击后直到时段结束都不再弹出
+    for click in clicks:
+        end = next((ms for ms in hide_edges if ms >= click), None)
+        if end is not None and any(click < ms < end for ms in starts['show-start']):
+            problems.append("%s 双击之后同一时段内又弹出" % sim.time_text(click))
+    if events and events[-1][1] in ('show-start', 'hide-start') and duration_ms - events[-1][0] > 10000:
+        problems.append("%s 开始的过渡一直没有结束" % sim.time_text(events[-1][0]))
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PopupClock 弹窗时间表快进模拟")
+    parser.add_argument('--start', type=parse_datetime,
+                        help="模拟开始的本地时间 YYYY-MM-DD HH:MM:SS，默认今天 00:00:00")
+    parser.add_argument('--hours', type=float, default=24.0)
+    parser.add_argument('--rule', action='append', help="弹窗规则（见 popup_schedule），可重复，默认使用默认规则")
+    parser.add_argument('--double-click', action='append', default=[], metavar='HH:MM:SS',
+                        help="在该时刻双击弹窗，可重复")
+    parser.add_argument('--lock', action='append', default=[], metavar='HH:MM:SS-HH:MM:SS',
+                        help="锁屏的时间段，可重复")
+    parser.add_argument('--profile', choices=sorted(PopupClock.PROFILES), default='windows')
+    parser.add_argument('--frame-ms', type=int, default=16, help="动画推进的步长")
+    parser.add_argument('--tolerance-ms', type=int, default=0, help="--check 允许的时间误差")
+    parser.add_argument('--check', action='store_true', help="检查过渡是否符合时间表，不符合时退出码为 1")
+    parser.add_argument('--json', help="把过渡记录和统计写成 JSON")
+    parser.add_argument('--quiet', action='store_true', help="不逐条打印过渡")
+    args = parser.parse_args(argv)
+
+    start = args.start or QDateTime(QDateTime.currentDateTime().date())
+    duration_ms = int(args.hours * 3600 * 1000)
+    try:
+        clicks = [offset_ms(start, text) for text in args.double_click]
+        locks = []
+        for text in args.lock:
+            begin, _, end = text.partition('-')
+            locks.append((offset_ms(start, begin), offset_ms(start, end)))
+    except ValueError as e:
+        parser.error(str(e))
+
+    qInstallMessageHandler(quiet_qt_messages)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    sim = Simulation(start, args.rule, args.profile, args.frame_ms)
+    for ms in clicks:
+        sim.double_click_at(ms)
+    for begin, end in locks:
+        sim.lock_between(begin, end)
+
+    real_start = time.perf_counter()
+    sim.run(duration_ms)
+    real_s = time.perf_counter() - real_start
+
+    if not args.quiet:
+        for ms, event in sim.transitions:
+            print("%s  %s" % (sim.time_text(ms), event))
+    shows = sim.counts['show-start']
+    print("模拟 %.1f 小时用时 %.2f 秒（%.0f 倍速）：弹出 %d 次，触发定时器 %d 次，动画帧 %d"
+          % (args.hours, real_s, duration_ms / 1000.0 / max(real_s, 1e-9), shows,
+             sim.clock.stats['timers'], sim.clock.stats['frames']))
+
+    problems = []
+    if args.check:
+        schedule = PopupSchedule(rules_from_settings(sim.window.settings.values()))
+        problems = check(sim, schedule, duration_ms, clicks, locks, args.tolerance_ms)
+        for problem in problems:
+            print("不符合：" + problem)
+        print("检查通过" if not problems else "检查发现 %d 个问题" % len(problems))
+
+    if args.json:
+        report = {
+            'start': start.toString(DATETIME_FORMAT),
+            'hours': args.hours,
+            'rules': args.rule,
+            'real_seconds': real_s,
+            'stats': sim.clock.stats,
+            'transitions': [{'ms': ms, 'time': sim.time_text(ms), 'event': event} for ms, event in sim.transitions],
+            'problems': problems,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
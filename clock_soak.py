@@ -0,0 +1,220 @@
+"""PopupClock 长时间运行的浸泡测试
+
+用 clock_sim 的虚拟时钟快进，让弹窗连续经历上千次弹出/收起，期间随机地双击、
+切换常显、切换动画模式、在过渡中途保存设置、发 pop 命令和锁屏，模拟几周的
+使用。每隔一段周期采样：
+
+    rss_kb          进程常驻内存
+    traced_kb       tracemalloc 统计的 Python 分配
+    qobjects        弹窗的 QObject 子对象数
+    wrappers        Python 侧存活的 QObject 包装对象数
+    receivers       过渡组、定时器和设置信号上连接的槽数
+    pending_timers  虚拟时钟里等待触发的定时器数
+
+前一半采样作为预热，后一半里计数类指标超过预热期的最大值，或内存增长超过
+限额，即判定为无界增长；周期结束时弹窗停在"动画中"却没有任何过渡在运行，
+判定为卡死。发现问题时打印 tracemalloc 增长最多的位置并以退出码 1 结束：
+
+    python clock_soak.py
+    python clock_soak.py --cycles 10000 --json soak.json
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QAbstractAnimation, QDateTime, QObject, qInstallMessageHandler
+from PyQt5.QtWidgets import QApplication
+
+import PopupClock
+import session_state
+from clock_sim import DATETIME_FORMAT, Simulation, quiet_qt_messages
+from perf_counters import rss_kb
+
+# 每个周期 20 秒：周期开始后 10 秒弹出，停留 8 秒
+CYCLE_MS = 20000
+WINDOW_OFFSET_MS = 10000
+SOAK_RULE = "*/20 * * * lead=0 trail=8"
+COUNT_METRICS = ('qobjects', 'wrappers', 'receivers', 'pending_timers')
+MEMORY_METRICS = ('rss_kb', 'traced_kb')
+
+
+def receiver_count(window):
+    pairs = [(window.timer, window.timer.timeout), (window.settings, window.settings.changed),
+             (window.popup_state, window.popup_state.state_changed)]
+    for group in (window.enter_anim_group, window.exit_anim_group):
+        if group is not None:
+            pairs += [(group, group.finished), (group, group.stateChanged)]
+    return sum(owner.receivers(signal) for owner, signal in pairs)
+
+
+def sample(sim):
+    window = sim.window
+    gc.collect()
+    return {
+        'rss_kb': rss_kb(),
+        'traced_kb': tracemalloc.get_traced_memory()[0] // 1024,
+        'qobjects': len(window.findChildren(QObject)),
+        'wrappers': sum(1 for o in gc.get_objects() if isinstance(o, QObject)),
+        'receivers': receiver_count(window),
+        'pending_timers': sum(1 for entry in sim.clock.queue if entry[3]),
+    }
+
+
+class Soak:
+    """按周期安排随机操作"""
+
+    def __init__(self, sim, seed):
+        self.sim = sim
+        self.window = sim.window
+        self.random = random.Random(seed)
+        self.actions = {name: 0 for name in
+                        ('double_click', 'always_show', 'animation_mode', 'apply_settings', 'pop', 'lock')}
+
+    def at(self, ms, callback):
+        self.sim.clock.schedule(max(0, ms - self.sim.clock.elapsed_ms), callback)
+
+    def count(self, name, callback):
+        def run():
+            self.actions[name] += 1
+            callback()
+        return run
+
+    def plan_cycle(self, begin_ms):
+        window = self.window
+        rnd = self.random
+        shown = begin_ms + WINDOW_OFFSET_MS
+        if rnd.random() < 0.3:
+            self.at(shown + rnd.randint(0, 8000), self.count('double_click', window.handle_double_click))
+        if rnd.random() < 0.1:
+            toggle = self.count('always_show', window.always_show_action.toggle)
+            on = shown + rnd.randint(-5000, 8000)
+            self.at(on, toggle)
+            self.at(on + rnd.randint(500, 6000), window.always_show_action.toggle)
+        if rnd.random() < 0.1:
+            mode = rnd.choice(PopupClock.ANIMATION_MODES)
+            self.at(begin_ms + rnd.randint(0, CYCLE_MS - 1),
+                    self.count('animation_mode', lambda: window.set_animation_mode(mode)))
+        if rnd.random() < 0.2:
+            stay = rnd.choice((1000, 1500, 2000))
+            self.at(shown + rnd.randint(-1000, 9000),
+                    self.count('apply_settings', lambda: window.apply_settings({'stay_duration': stay})))
+        if rnd.random() < 0.1:
+            self.at(shown - rnd.randint(3000, 9000), self.count('pop', lambda: window.handle_command('pop')))
+        if rnd.random() < 0.05:
+            begin = shown + rnd.randint(-3000, 6000)
+            self.at(begin, self.count('lock', lambda: self.sim.session.set_state(session_state.LOCKED)))
+            self.at(begin + rnd.randint(500, 5000), lambda: self.sim.session.set_state(session_state.ACTIVE))
+
+
+def stalled(window):
+    """anim_state 停在 2，但没有过渡在运行（也不是锁屏暂停），之后再也不会离开"""
+    if window.anim_state != 2 or window.session_paused:
+        return False
+    groups = (window.enter_anim_group, window.exit_anim_group)
+    return not any(group is not None and group.state() != QAbstractAnimation.Stopped for group in groups)
+
+
+def growth_problems(samples, rss_limit_kb, traced_limit_kb):
+    """后一半采样相对预热期的增长"""
+    half = len(samples) // 2
+    warm, late = samples[:half], samples[half:]
+    problems = []
+    for key in COUNT_METRICS:
+        ceiling = max(s[key] for s in warm)
+        peak = max(s[key] for s in late)
+        if peak > ceiling:
+            problems.append("%s 从预热期最多 %d 增长到 %d" % (key, ceiling, peak))
+    for key, limit in (('rss_kb', rss_limit_kb), ('traced_kb', traced_limit_kb)):
+        growth = late[-1][key] - late[0][key]
+        if growth > limit:
+            problems.append("%s 在后一半周期里增长了 %d KB（上限 %d KB）" % (key, growth, limit))
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PopupClock 长时间运行浸泡测试")
+    # 默认约 24 小时虚拟时间：指针包围盒的缓存要走完 12 小时的时针角度才饱和，预热期需要覆盖它
+    parser.add_argument('--cycles', type=int, default=4400, help="弹出/收起的周期数，每个周期 20 秒虚拟时间")
+    parser.add_argument('--samples', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--animation-ms', type=int, default=500, help="过渡时长，缩短可以跑得更快")
+    parser.add_argument('--rss-limit-kb', type=int, default=4096)
+    parser.add_argument('--traced-limit-kb', type=int, default=256)
+    parser.add_argument('--trace-frames', type=int, default=1, help="tracemalloc 记录的调用栈深度")
+    parser.add_argument('--json', help="把采样序列写成 JSON")
+    args = parser.parse_args(argv)
+
+    qInstallMessageHandler(quiet_qt_messages)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    start = QDateTime.fromString("2026-01-05 00:00:00", DATETIME_FORMAT)
+    sim = Simulation(start, [SOAK_RULE], history=100)
+    sim.window.settings.set('animation_duration', args.animation_ms)
+    soak = Soak(sim, args.seed)
+    # 启动序列在第一个周期开始前结束
+    sim.run(WINDOW_OFFSET_MS)
+
+    tracemalloc.start(args.trace_frames)
+    every = max(1, args.cycles // args.samples)
+    samples = []
+    snapshots = []
+    stalled_at = None
+    real_start = time.perf_counter()
+    # 双击和调试模式的打印不是这里要看的
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for cycle in range(args.cycles):
+            begin = WINDOW_OFFSET_MS + cycle * CYCLE_MS
+            soak.plan_cycle(begin)
+            sim.run(begin + CYCLE_MS)
+            if stalled(sim.window):
+                # 卡死之后弹窗不再弹出或收起，剩下的周期只是空转，采样也没有意义；记下卡住的位置就结束
+                stalled_at = (cycle + 1, sim.time_text(sim.clock.elapsed_ms))
+                samples.append(dict(sample(sim), cycle=cycle + 1))
+                break
+            if (cycle + 1) % every == 0:
+                samples.append(dict(sample(sim), cycle=cycle + 1))
+                if len(samples) == args.samples // 2:
+                    snapshots.append(tracemalloc.take_snapshot())
+    real_s = time.perf_counter() - real_start
+    snapshots.append(tracemalloc.take_snapshot())
+
+    keys = ('cycle',) + MEMORY_METRICS + COUNT_METRICS
+    print("  ".join("%14s" % key for key in keys))
+    for s in samples:
+        print("  ".join("%14d" % s[key] for key in keys))
+    simulated_h = sim.clock.elapsed_ms / 3600000.0
+    shows = sim.counts['show-start']
+    print("模拟 %.1f 小时用时 %.1f 秒：弹出 %d 次，操作 %s"
+          % (simulated_h, real_s, shows, ', '.join('%s=%d' % item for item in soak.actions.items())))
+
+    if stalled_at is not None:
+        problems = ["第 %d 个周期（%s）起停在动画中，不会再弹出或收起" % stalled_at]
+    elif len(samples) >= 4:
+        problems = growth_problems(samples, args.rss_limit_kb, args.traced_limit_kb)
+    else:
+        problems = []
+    for problem in problems:
+        print("问题：" + problem)
+    if problems and len(snapshots) == 2:
+        print("tracemalloc 增长最多的位置：")
+        for stat in snapshots[1].compare_to(snapshots[0], 'lineno')[:10]:
+            print("  %s" % stat)
+    print("没有发现无界增长" if not problems else "发现 %d 个问题" % len(problems))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'cycles': args.cycles, 'seed': args.seed, 'real_seconds': real_s,
+                       'simulated_hours': simulated_h, 'actions': soak.actions,
+                       'samples': samples, 'problems': problems}, f, ensure_ascii=False, indent=2)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
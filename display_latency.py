@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""整秒显示延迟的统计
+
+每当一个新的秒数交给数字面板，记下这一秒在墙上时钟里的起点；面板真正把它
+画出来时，两者之差就是这一秒的显示延迟。保留最近 capacity 个样本算百分位，
+另外按固定桶累计一个不会丢弃的直方图。
+"""
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+
+# 直方图桶的上界（毫秒），最后一个桶收纳所有更大的值
+BUCKET_EDGES_MS = (0.5, 1, 2, 3, 4, 5, 8, 10, 16, 20, 33, 50, 100, 200, 500, 1000)
+
+
+def percentile(values, pct):
+    """最近秩法的百分位，没有样本时为 0；延迟统计、性能 HUD 和基准测试共用"""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(pct / 100.0 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+def wall_ms():
+    """当前墙上时间（自 epoch 的毫秒数，带小数）"""
+    return time.time() * 1000.0
+
+
+class LatencyRecorder:
+    """记录每个显示秒从整秒边界到绘制完成的延迟"""
+
+    def __init__(self, capacity=3600):
+        self.samples = deque(maxlen=capacity)
+        self.buckets = [0] * (len(BUCKET_EDGES_MS) + 1)
+        self.expected = None  # 等待绘制的整秒边界（毫秒）
+        self.count = 0
+        self.missed = 0  # 交给面板之后没等到绘制就被下一秒覆盖的次数
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def expect(self, boundary_ms):
+        """新的一秒已经交给面板，等待它被画出来"""
+        if self.expected is not None:
+            self.missed += 1
+        self.expected = boundary_ms
+
+    def painted(self, now_ms=None):
+        """面板完成一次绘制；有等待中的整秒时记一个样本"""
+        if self.expected is None:
+            return
+        latency = (wall_ms() if now_ms is None else now_ms) - self.expected
+        self.expected = None
+        self.record(latency)
+
+    def record(self, latency_ms):
+        self.samples.append(latency_ms)
+        self.buckets[bisect_left(BUCKET_EDGES_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def reset(self):
+        self.__init__(self.samples.maxlen)
+
+    def percentile(self, pct):
+        """最近样本的百分位（最近秩法），没有样本时为 0"""
+        return percentile(self.samples, pct)
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'missed': self.missed,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+        }
+
+    def histogram(self):
+        """[(桶上界或 None, 次数), ...]，None 表示超过最大上界"""
+        return list(zip(BUCKET_EDGES_MS + (None,), self.buckets))
+
+    def report_text(self):
+        """给调试菜单显示的文本：摘要加一列直方图"""
+        summary = self.summary()
+        lines = ["样本 %(count)d，未绘制 %(missed)d" % summary,
+                 "平均 %(mean_ms).2f ms  p50 %(p50_ms).2f  p90 %(p90_ms).2f  "
+                 "p99 %(p99_ms).2f  最大 %(max_ms).2f" % summary,
+                 ""]
+        peak = max(self.buckets) or 1
+        lower = 0
+        for edge, count in self.histogram():
+            if count:
+                label = "%g-%g ms" % (lower, edge) if edge is not None else "> %g ms" % lower
+                lines.append("%-12s %6d %s" % (label, count, '#' * max(1, count * 30 // peak)))
+            if edge is not None:
+                lower = edge
+        return "\n".join(lines)
+
+    def export(self, path, extra=None):
+        """导出为 JSON：摘要、直方图和最近的原始样本"""
+        data = {
+            'summary': self.summary(),
+            'buckets': [{'le_ms': edge, 'count': count} for edge, count in self.histogram()],
+            'samples_ms': list(self.samples),
+            'exported_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""主线程事件循环和绘制路径的跟踪，导出为 Chrome trace JSON
+
+用 --trace 路径 或环境变量 POPUPCLOCK_TRACE=路径 打开（见 PopupClock.resolve_trace_path）。
+打开后：
+
+    TracingApplication  代替 QApplication，在 notify() 里给定时器、绘制、
+                        样式 polish、窗口移动等事件记一段耗时
+    TRACE.begin/end     代码里的关键路径（update_display、move() 等）自己记一段
+    TRACE.instant       没有耗时的标记（每个动画帧）
+
+所有记录放进固定容量的环形缓冲区，满了丢弃最旧的；退出时或从托盘菜单写成
+Chrome trace JSON，可以直接拖进 chrome://tracing 或 ui.perfetto.dev 查看。
+没有打开时各处只多一次 TRACE.enabled 判断。
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+
+TRACE_ENV = "POPUPCLOCK_TRACE"
+# 缓冲区默认保留的记录数；每条约一百多字节，满了丢弃最旧的
+DEFAULT_CAPACITY = 200000
+
+# notify() 里计时的事件：类型 -> (名字前缀, 分类)
+TRACED_EVENTS = {
+    QEvent.Timer: ("timer", 'timer'),
+    QEvent.Paint: ("paint", 'paint'),
+    QEvent.UpdateRequest: ("update request", 'paint'),
+    QEvent.Polish: ("polish", 'style'),
+    QEvent.PolishRequest: ("polish request", 'style'),
+    QEvent.StyleChange: ("style change", 'style'),
+    QEvent.Move: ("move event", 'window'),
+    QEvent.Expose: ("expose", 'window'),
+    QEvent.MetaCall: ("queued call", 'event'),
+}
+
+
+class TraceRecorder:
+    """主线程上的跟踪记录，时间戳取 perf_counter"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, clock=time.perf_counter):
+        self.enabled = False
+        self.clock = clock
+        self.path = None
+        self.events = deque(maxlen=capacity)  # (阶段, 名字, 分类, 开始秒, 持续秒, 参数)
+        self.recorded = 0
+        self.origin = clock()
+
+    def enable(self, path=None, capacity=None):
+        """开始记录；path 为退出时默认写出的位置"""
+        if capacity is not None and capacity != self.events.maxlen:
+            self.events = deque(self.events, maxlen=capacity)
+        self.path = path
+        self.enabled = True
+
+    def begin(self):
+        return self.clock()
+
+    def end(self, name, category, started, args=None):
+        """记一段 begin() 开始、到此刻结束的耗时"""
+        self.events.append(('X', name, category, started, self.clock() - started, args))
+        self.recorded += 1
+
+    def instant(self, name, category, args=None):
+        self.events.append(('i', name, category, self.clock(), 0.0, args))
+        self.recorded += 1
+
+    def dropped(self):
+        """因缓冲区已满被丢弃的记录数"""
+        return self.recorded - len(self.events)
+
+    def trace_events(self):
+        """转换成 Chrome trace 的 traceEvents 列表（时间单位微秒）"""
+        pid = os.getpid()
+        tid = threading.main_thread().ident or 0
+        result = [
+            {'ph': 'M', 'name': 'process_name', 'pid': pid, 'tid': tid, 'args': {'name': "PopupClock"}},
+            {'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'args': {'name': "main"}},
+        ]
+        origin = self.origin
+        for phase, name, category, start, duration, args in list(self.events):
+            event = {'ph': phase, 'name': name, 'cat': category, 'pid': pid, 'tid': tid,
+                     'ts': round((start - origin) * 1e6, 3)}
+            if phase == 'X':
+                event['dur'] = round(duration * 1e6, 3)
+            else:
+                event['s'] = 't'  # 线程范围的瞬时标记
+            if args:
+                event['args'] = args
+            result.append(event)
+        return result
+
+    def dump(self, path=None):
+        """写出 Chrome trace JSON，返回写出的路径；没有路径时不写"""
+        path = path or self.path
+        if not path:
+            return None
+        data = {
+            'traceEvents': self.trace_events(),
+            'displayTimeUnit': 'ms',
+            'otherData': {'recorded': self.recorded, 'dropped': self.dropped(),
+                          'capacity': self.events.maxlen, 'exported_at': time.strftime('%Y-%m-%dT%H:%M:%S')},
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        return path
+
+
+def event_name(prefix, receiver):
+    """事件名带上接收者：有 objectName 时用它（如各个定时器），否则用类名"""
+    return "%s %s" % (prefix, receiver.objectName() or type(receiver).__name__)
+
+
+class TracingApplication(QApplication):
+    """给 TRACED_EVENTS 里的事件记耗时的 QApplication
+
+    每个事件都要经过 Python 的 notify()，只在打开跟踪时才用它代替 QApplication。
+    """
+
+    def notify(self, receiver, event):
+        traced = TRACED_EVENTS.get(event.type()) if TRACE.enabled else None
+        if traced is None:
+            return super().notify(receiver, event)
+        # 先取名字：处理事件的过程中接收者可能被删除
+        name = event_name(traced[0], receiver)
+        started = TRACE.begin()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            TRACE.end(name, traced[1], started)
+
+
+TRACE = TraceRecorder()
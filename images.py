@@ -1,751 +1,63 @@
 # -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x2b\xd1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x20\
-\x00\x49\x44\x41\x54\x78\x5e\x85\x9b\x07\x78\x1d\xd5\xb5\xb6\xdf\
-\x29\xa7\x37\x75\x4b\x72\x91\x2c\xb9\xdb\x18\x17\x5c\x30\x2d\x60\
-\x0c\x26\x98\x40\x20\x01\x02\xb9\x21\x90\x06\x24\x21\x21\x7f\x08\
-\x21\x05\x92\x90\x5c\x2e\xb9\x10\xe0\xc2\x0d\x84\x12\x12\x08\x25\
-\xd8\x80\x09\xb8\x04\xdb\x18\x30\xb6\x01\xf7\x2a\x37\x59\xc5\xea\
-\xed\xf4\x36\x73\x66\xe6\x7f\xf6\x3e\x92\x31\xdc\xdc\xff\x9f\xe7\
-\xd1\x23\xe9\xe8\x68\xce\xec\xb5\xd7\xfa\xd6\xb7\xbe\xb5\xb6\xc2\
-\xbf\xb8\x0e\x1c\x58\x5b\x96\xcc\x1b\x97\xaa\x28\x67\x68\xaa\x7e\
-\x86\x61\x1a\xb3\x4c\xd3\xf4\x17\x2c\x03\x9f\xcf\x4d\x24\x1c\x22\
-\x14\x0a\x93\x4c\x26\xd0\x35\x17\x5d\x3d\xbd\xe4\x72\x39\xc2\xc1\
-\x08\x25\xa5\x01\xdc\x6e\x1d\xb7\xdb\x2d\x5f\xb3\x6d\x5b\x7e\x29\
-\x8a\x22\x5f\x33\x4d\x87\x6c\xbe\x40\x3c\x9a\xe6\x70\x7b\x27\x6d\
-\x83\x51\xa2\x89\xa4\xbc\x5f\x5d\x69\x39\xf5\x0d\xf5\x8c\x1e\x1b\
-\x41\x35\x92\x44\xa3\x31\x94\x82\x4d\x36\x9b\x25\xec\xf3\x53\xb0\
-\x2c\xe2\xf1\x38\x95\x95\xe5\xd8\xaa\x85\xdb\xed\xc1\xe5\xd2\xe4\
-\xd7\x89\x13\xdd\xa8\x8a\x26\xef\xe3\xf5\xba\x71\x7b\x94\x8c\xaa\
-\xb9\x77\x0f\xf4\xf7\x6d\x7b\xe5\xb9\x47\xb6\xff\xe6\x16\xcf\xea\
-\xc8\xf4\xad\x43\x9f\x5d\xae\xf2\xd9\x17\xb6\xef\x7a\xf3\x0a\x54\
-\xf5\xa9\xd2\xd2\x50\x85\xcb\xe5\xc2\x71\x1c\xf9\x00\x5d\x9d\xfd\
-\x94\x94\x86\xe4\xcd\xf3\xb9\x2c\xe1\x70\x04\xaf\xd7\xcb\xe0\xc0\
-\x20\x89\x64\x16\x55\x53\x50\x1c\x85\x6c\x2e\xc1\xe8\xd1\x35\x88\
-\xff\xcd\x19\x79\xb0\x2c\xf6\x1f\xe9\x61\x77\xd3\x11\x3a\x92\x06\
-\xde\xea\xc9\x78\x4a\x6b\x29\x1d\x3b\x06\x77\xb0\x14\xc7\xe5\x45\
-\x43\x41\xb3\x1c\x8c\x02\x38\xb6\x41\x21\x9d\xa0\xfb\xe0\xbb\x64\
-\x87\x12\xcc\x6b\x28\x65\x76\x63\x18\xdb\xb2\xc8\x64\x32\x64\x53\
-\x19\xbc\x3e\x9f\xbc\xbf\x30\x6a\x30\xe4\x97\x06\xc6\x51\xe5\xb3\
-\x89\xf7\x84\x42\x21\x3c\x5e\x1d\xdb\x76\xd8\xba\x79\x1b\x17\xcf\
-\x68\xa7\xd2\xbb\x6e\x40\x29\x68\xdf\xf2\xcc\x3e\xb1\xf2\xd4\x35\
-\x9f\x34\x40\x6b\xeb\xfb\x35\x69\x33\xff\xc7\xde\x9e\x81\x2b\xe4\
-\xce\xea\x3a\xa1\x50\x10\x55\x71\xe1\xf3\xeb\x0c\x0d\x26\x18\x35\
-\xaa\x5a\xde\x34\x16\x1f\x24\x12\x0a\x52\x5b\x5b\xcb\xb1\xc3\x87\
-\xf0\x05\x82\x18\x05\xb1\xcb\x2a\xd9\x4c\x9a\xb2\xaa\x72\xf6\x1f\
-\x3c\xc4\xdb\x3b\x8e\x51\x3a\x69\x01\xa5\x8d\xa7\x91\x0f\x96\xa3\
-\xe0\x26\xa7\xe9\x38\x8e\x07\x07\x1b\xd5\x01\x4d\x57\x71\x14\xb0\
-\x6c\x03\xc7\x51\x50\x1d\x55\x2e\x4c\x71\x34\x20\x83\x2b\x3e\xc8\
-\xd1\x1d\xef\x30\xd6\x95\x65\xe9\xdc\xf1\x94\x07\x54\x74\x1d\x0a\
-\xa6\x49\x22\x9e\xc4\xef\x0f\xe3\xf7\xfb\x29\x14\xf2\x28\x8a\x83\
-\x91\xcb\xe1\x72\xbb\xb1\xb1\x28\x98\x16\x43\xfb\x5e\x66\xc9\x9c\
-\xdd\xd8\x8e\x83\xe3\xe4\x78\xe2\xe9\xbe\x95\xdf\xf8\xaf\xbe\x5b\
-\x03\x4a\x65\xb7\x30\xc4\x49\x03\xb4\x75\x6d\x59\x9b\xcf\xe7\x2f\
-\x8e\x45\x53\x58\x76\x81\xea\xea\x6a\x50\x0c\x14\x47\x65\x68\x28\
-\x4a\x34\x9a\x41\xd7\x55\x69\x3c\x61\x70\x14\x8b\xea\x71\xd5\xa8\
-\x39\xb3\xe8\xee\x9a\x9b\xc1\xc1\x28\x6f\xbe\xb1\x89\x68\x79\x03\
-\xd5\x73\x3f\x07\x91\x5a\xf2\x76\x01\xf1\x76\x5b\x51\x31\x51\x41\
-\xd1\x50\xad\x02\x2e\x45\xc5\xb6\x6c\x1c\x55\x91\xf7\x12\x8b\x16\
-\xde\xa6\xa1\xc9\xef\x23\x61\x23\x16\xe5\xa8\x26\x1e\x54\xf6\xae\
-\xf9\x1b\x0b\x47\xbb\xb9\x66\xf1\x69\x78\xf2\x69\x2c\x47\x25\x95\
-\xce\x52\x52\x52\x42\x22\x11\x27\x95\x4c\x82\xa2\x48\xcf\xd4\x6c\
-\x8b\xa7\x9e\x78\x80\x07\xbe\xa9\xa1\xb8\xda\xb0\x2d\xf1\xec\x39\
-\x9e\x5d\x3e\xc4\xd7\xef\xe9\x59\xe3\x71\x95\x7f\xfe\xa4\x01\x76\
-\xef\x5b\x7b\xb3\xdb\xab\x3d\x2e\x76\x5d\xc1\x45\xde\xc8\x11\x0a\
-\xf9\xd1\x74\xc8\xa6\xf3\x0c\x0e\x0e\xa0\xbb\x5c\x68\x9a\x0b\xc3\
-\x30\x65\x6c\xab\xaa\x88\x3d\x95\x70\x38\x84\x69\x69\x3c\xb5\x7c\
-\x03\xee\x86\xc9\x8c\x9d\xf5\x39\x7a\x0b\x61\x0c\xdd\xc6\x32\xb3\
-\x84\x4d\x05\x4b\xf7\x63\xe8\x62\x47\x1d\x0a\x8a\x70\x78\x61\x79\
-\x61\x16\xe7\xa4\x37\x8e\x2c\x7c\xe4\x05\xc7\x06\x55\x55\xa5\xa7\
-\x14\xa4\xdd\x15\x74\xdb\xc1\x49\xc5\xd8\xb7\xf1\x45\x7e\x70\xf9\
-\x02\xca\x8c\x28\xba\x0b\xc2\xfe\x00\xd9\x4c\x96\x7c\x3e\x8b\xcf\
-\xef\x21\x10\xf0\xb3\x67\xcf\x0e\x16\x54\x1f\xa7\xca\xf3\x16\xb6\
-\xa3\xa1\xe2\xc7\xb1\xf3\xbc\xf8\x4a\x3b\x5f\xbb\xb7\x8b\x02\xe1\
-\x1b\xdd\x7a\xf0\x2f\xca\xeb\xab\xff\xd4\x38\xbe\x6e\xec\x1e\x97\
-\x4b\x0f\x58\x96\x25\x3f\x54\x55\x75\x72\xb9\x4c\xd1\x3d\x2d\x07\
-\x9f\xc7\x83\xcf\xed\x41\x75\x7b\xc8\xe5\x73\x58\x8e\x41\x3e\x9f\
-\x27\x1e\x4b\xb1\xf9\xe0\x21\x86\x7c\x13\x08\x4c\x5f\x4a\x4a\xd1\
-\xc1\xd1\xc9\xaa\x16\x2d\xef\xad\x63\xfe\xb6\x9d\x2c\xd4\x52\x7c\
-\x14\x1d\xc2\x28\xad\xa0\xec\xca\xcb\xe9\xaa\x9b\x4d\x5e\x46\xbd\
-\x83\xa6\x38\x68\x76\xd1\xab\x46\x3c\x60\xc4\x00\x0a\xc5\x50\x40\
-\x71\xb0\xb0\x50\x15\x1d\xcb\x36\x65\xd8\xe8\xaa\xc2\xd0\x89\x16\
-\xac\xa6\x35\x7c\x69\xf6\x24\x54\x7b\x40\xda\x32\x14\xf4\x53\x5e\
-\x59\x26\x9c\x80\x97\x5e\xf8\x2b\x3f\xfc\x7c\x27\x3e\xf5\x38\xb6\
-\x92\x27\x3d\x54\x4b\xb0\x3c\x4a\x3e\xab\xf2\xd6\xc7\x75\x5c\xfb\
-\xcd\xe7\x86\x14\x6f\xf0\x34\x65\xe3\xa6\x17\x7f\x3a\xaa\xba\xf2\
-\x3e\xb1\x20\xd3\x34\x09\xf8\x7d\xd2\x08\xc7\x5b\x5a\x48\xa5\x53\
-\x12\x59\x67\xcd\x9a\x85\x4b\xd7\x24\x1e\x14\xac\xac\x04\xc5\x96\
-\xf6\x4e\x56\x6e\x3c\xc0\x84\xab\x6f\xa3\x5f\x89\x60\x6b\x2e\xe9\
-\xca\x6a\xd6\x24\xd7\x7b\x82\xd1\xaf\x3f\xc7\xed\xaa\x49\xaf\xd1\
-\x4d\xc8\x53\x8a\xdf\xd4\x79\xad\xb3\x87\x43\xbf\x7f\x8c\x98\x56\
-\x8a\x62\x3b\xa8\x8a\x82\x3e\xbc\x62\x5b\x11\x98\xf0\x89\x31\x3e\
-\x0b\xce\xc2\x13\x2c\x5b\x2c\xbe\xf8\x1e\x1c\x1b\x25\x11\xe7\xe3\
-\xd5\xcf\xf2\xed\x73\xea\xa9\x09\x6a\x72\xb3\x54\x55\xc1\xe5\x76\
-\xb1\x6d\xdb\x26\xae\x3a\xab\x87\x51\xea\x47\xd2\x7b\xfa\xfa\x46\
-\x51\x51\xd5\x85\xdb\x76\x28\xe0\xe2\x50\xbb\x4d\x34\x56\x7e\x97\
-\xb2\xef\xd0\xba\x97\x3d\x6e\xed\x1a\x11\x73\xb9\x5c\x16\x4d\xd5\
-\x29\x58\xa6\x5c\x64\x3c\x96\xa4\xac\xbc\x9c\x8a\xf2\x0a\x0a\x56\
-\x5e\x62\x80\x00\x93\xad\x1f\xee\xe7\x84\x7f\x2c\xd9\xfa\x59\xe4\
-\xa8\xc2\x92\xee\x2c\x3e\xa7\x40\xdb\xfd\xbf\xe3\x07\x3e\xb0\xe2\
-\x07\x19\x35\xbf\x84\x09\x4b\xcb\xf9\xdb\x6f\xfe\xc1\x0d\xa5\x17\
-\xf3\xc7\x63\xdd\xf4\x3f\xf0\x24\x31\x57\x08\x11\x6c\x22\xd6\x55\
-\xb5\x18\xef\xc2\x18\xff\x2f\x03\x08\x6f\x48\x24\x12\xb4\x1d\x39\
-\xc6\x8c\xd3\xa7\x21\x7c\xdf\xa4\x20\x81\xb7\x65\xc3\x72\x6e\x39\
-\xbb\x9e\xfa\x72\x95\xde\xde\x6e\x84\xf7\xa4\x53\x69\xde\x78\xf1\
-\x09\x1e\xbe\x2d\x82\x6d\x1d\xa3\xbb\x63\x34\x63\xea\x3b\x50\x0b\
-\x0e\xb6\xaa\xa1\x8a\xf4\xec\x36\xfe\xae\x1c\x38\xbc\xf6\x90\xdb\
-\xad\x4f\x16\xcf\x2f\x62\x3b\x1a\x8d\xe2\xf1\x78\xe4\x6e\x5b\x96\
-\x8d\xa2\x3a\x04\x83\x01\xdc\x2e\x1d\x8f\x4f\xe5\xed\x0d\x7b\x68\
-\x2b\x9b\x80\x35\x7a\x0e\x19\x35\x22\xd3\x8f\x82\x25\x17\xb3\x76\
-\xc5\xf3\xbc\x9a\xe8\xa1\xb1\xa7\x9b\xee\xf3\x3d\x54\x5d\xa6\x32\
-\x78\x7c\x80\xad\x4f\xee\x44\x1f\xa8\x67\xf0\xae\x07\x38\x54\x56\
-\x87\x5e\x50\x91\x20\xaf\xa9\xe4\x2c\x4b\x22\x81\x4b\x64\x04\x01\
-\x84\x76\x31\x1c\x94\xe1\x8d\x3e\xd5\x13\x24\x26\x64\x32\xac\x59\
-\xfb\x0f\x2e\x5d\xb6\x8c\xac\x48\xa1\x8e\x03\x8a\x49\xac\xf9\x08\
-\x55\x43\xfb\xb9\x7e\xde\x18\x3a\x7a\xbb\x30\xf3\x19\x92\xc9\x41\
-\xba\x8e\xbe\xcd\x77\x2f\x1b\xe0\x44\x73\x19\x0d\x13\x4e\xe0\xe0\
-\x42\xec\x97\x0c\x39\xcc\x3d\xca\xfe\x43\xab\x73\xba\xae\x79\x1c\
-\xc7\xa6\x50\x28\x90\x4a\xa5\x29\x14\xc4\x8e\xe8\xf2\x77\x8f\xd7\
-\xc5\x84\x09\x8d\x14\x0a\x26\xc7\x8e\xb5\xb2\xb5\x2f\x40\xb4\x6e\
-\x21\x09\xd5\x2d\xd3\x91\xc7\x2a\x80\x55\xa0\x80\xca\x96\xb7\x56\
-\xf0\x9b\xe3\xbb\x99\x92\x88\x52\xb8\xb4\x82\xed\xcd\xbb\x70\x35\
-\x1b\x2c\x76\xd5\xf1\x41\xf5\x04\x56\x7f\xf5\x2e\x7c\xb8\x24\x08\
-\x0a\xaf\x11\x0b\x32\x87\x11\x5f\x26\x03\x54\x19\xe3\xd2\x33\xb4\
-\x62\x82\x12\x3f\x4b\x2c\x18\xc6\x09\x99\xf3\xad\x02\xdb\x3f\xda\
-\xc4\xf8\x51\x63\xa8\x1d\x5f\x47\x41\x64\x14\x47\x21\x36\xd8\xc1\
-\x99\xc9\xf5\xd4\x57\x94\x52\x5d\x59\x81\xe5\xd8\xa4\xd2\x51\x5a\
-\x77\x3d\x49\x63\x49\x9c\xd9\x13\xe2\x02\x52\x8b\xf7\x73\x74\x11\
-\xb2\x71\xa5\xb9\xed\x1d\xa7\xa7\xa7\x0b\x01\x35\x92\xa9\x19\x96\
-\x74\x35\x01\x84\x91\x48\x44\xbe\xe6\xf3\xf9\x48\x65\xd3\x3c\xba\
-\x7a\x0b\x8d\x17\xff\x9c\xb4\xa6\x50\x70\x1c\x3a\xdb\x0e\x51\x9b\
-\x8f\x11\x4a\x27\xd9\x77\xec\x28\x67\xcd\x9e\xca\x47\x7f\x7e\x84\
-\xe7\x6b\xa6\x81\x93\x93\x8b\x74\x6b\x1a\xd1\x82\xc2\xfa\x9a\xf1\
-\xec\xfc\xca\xf7\x71\x2c\x0d\x45\x55\x24\x50\xc9\x4b\x55\x87\xc1\
-\x6d\xf8\x85\x61\x1c\x18\xd9\x79\x4d\xfc\xdd\x29\xa6\xc9\x93\x19\
-\x42\xec\xba\x65\x32\xd0\x79\x82\xbe\xf6\x76\xce\x38\xf3\x2c\xd2\
-\x8a\x4d\x57\x77\x07\xe7\xa6\x77\x50\x17\xc9\x0f\x13\x25\x95\x40\
-\x30\x42\xd7\x89\x0e\xa2\xcd\xab\xb9\x76\xf1\x41\x5c\xd8\x38\x8e\
-\x89\xaa\x04\xd0\xf4\x02\x4a\x7b\xd7\x7b\x8e\xa0\xb8\x79\x33\x8f\
-\xc8\x02\x9a\xa2\x91\xcb\xe5\x31\xf2\x96\x24\x18\x41\xbf\x97\xbc\
-\x69\xf2\xc0\xd3\x2f\x30\xe1\xaa\x5f\xd1\xef\xab\xa2\x60\x3b\x64\
-\x62\x83\x5c\x50\x65\x73\xc9\xc4\x71\x58\xd9\x1c\x96\x66\xa3\xb9\
-\xdd\x3c\xf2\xf5\x1b\xb9\x5b\x8f\x48\x30\x7a\xa7\xa9\x89\xfe\x31\
-\x75\x1c\x1d\x5d\x43\xe0\xda\x6f\xd1\xe9\x1f\x27\x1f\x5c\xe2\x98\
-\x22\xb6\x5a\x18\xa2\x88\xf4\x9a\xa6\x49\x8f\x93\xac\xe8\x94\x4b\
-\xfc\xe6\x08\x2e\x20\xf1\xa2\x18\x17\xe2\xe7\x91\x2b\x1e\x1d\x62\
-\xdf\x47\x9b\x39\x67\xc9\xf9\xec\xf8\xc7\x8b\x3c\x70\xe3\x12\x4a\
-\x94\x01\xc9\x08\x53\xa9\x14\x2e\xbd\xc8\x14\x5f\x7d\xf1\xf7\xdc\
-\x7d\x7d\x17\x28\x09\x74\xc7\x83\xa2\x78\x31\x0d\x1b\xa5\xb5\x63\
-\xa3\xa3\xbb\x14\x86\x62\x51\xda\xdb\xdb\x09\x05\x42\x54\x94\x57\
-\x91\x4a\x65\xe4\x67\x88\xd8\x6f\x6a\xe9\xa4\xcb\x37\x85\xfe\xea\
-\x39\x18\x88\x74\x64\xb3\xf1\xb5\xbf\xb0\xe1\x97\xb7\x32\x78\x74\
-\x3b\xc9\xf4\x20\xd3\x67\x9f\xc9\x9d\xbf\xba\x8f\x74\x2c\xc3\xe9\
-\x43\x0a\x71\x8f\x9b\x31\xdf\xfe\x2e\xdd\xba\x8b\x98\xd7\x8f\xa1\
-\x78\x70\xe1\x45\xb1\x0b\x9f\x05\xf8\x4f\x7e\x1f\x36\xca\xa7\x2d\
-\x50\x34\x94\x30\xd2\x88\x17\x8c\x18\x60\x24\x75\x16\x8c\x3c\xeb\
-\x56\xbd\xc6\x0f\x3f\x37\x96\xf3\x1b\xbd\x84\x83\x3e\x69\x4c\xb1\
-\x89\x99\x74\x5e\x62\xdb\xcb\x7f\x7b\x9c\x5f\x5c\xd7\x89\x9b\x28\
-\x8a\x6d\x93\x4e\x3b\xbc\xfa\x48\x16\xe5\xe0\xb1\xb5\x8e\x28\x26\
-\xda\xdb\x3b\xe4\xe7\x0a\x56\x95\x4c\xa6\xb1\x4c\x83\x40\x20\x40\
-\x3e\x6f\xf0\xfc\x3f\x0f\x52\x75\xf5\x0f\xc9\x2a\x1e\x14\x5b\x61\
-\xe7\xfa\x37\xf8\xd2\x18\x2f\xd5\x5a\x92\x59\x53\x7a\x49\x66\x8e\
-\x51\x59\x77\x27\xeb\xdf\xdf\x47\x9b\x5b\x27\x3f\x6e\x2e\x79\x42\
-\x38\x12\x68\x8a\x3b\x6a\xab\x82\xe5\x21\xff\x7f\x64\x97\xc5\x8f\
-\x8a\x3a\x9c\x41\x64\x66\x53\x25\x43\x90\x6f\x91\xbb\xec\x0c\xaf\
-\x5d\xd0\x26\x01\x5f\xea\x27\xe0\x38\xec\x0d\x92\x1b\xa0\x70\xa2\
-\x69\x3f\x8b\xab\x52\x7c\x71\x76\x15\x1e\x97\x28\xc0\x2c\xf9\xb9\
-\x66\xc1\x26\x11\xcf\xf3\xf6\x9a\xd7\xb9\xee\xac\xfd\xf8\xd8\x4b\
-\xbc\x4f\x61\xc3\xf3\x01\xbe\x58\x7e\x3d\xca\x96\x6d\x2b\x9c\xa1\
-\x68\x3f\xa1\x60\x98\x40\x30\x40\x2c\x16\xa3\xa6\xba\x86\x92\x48\
-\x90\x13\x6d\x5d\xbc\xbc\x6a\x03\xb5\x97\xde\x41\x8f\xb7\x12\x11\
-\x8f\x1d\x47\x8f\xf0\x93\xa5\xd3\x69\xd4\x0b\xac\x59\xf1\x5b\x96\
-\x5e\x14\xe7\x99\xe7\x37\x73\xf3\xf7\xd7\x63\x3a\x21\xbe\x7d\xdf\
-\x03\x34\x5e\xfe\x0d\xd2\x5a\x18\xcd\x29\xe0\xd8\x02\xd1\x3f\x71\
-\x59\x01\xf9\xe2\x81\x45\xf6\x40\x53\xb0\x9d\x02\x9a\xa2\x4b\xee\
-\x2e\xe9\xaf\xad\xa2\x9c\xcc\x04\x8a\xac\xfa\x6c\xe1\x19\x96\x06\
-\xaa\x22\x51\xff\xd3\x78\x60\x63\x89\x10\xb2\x0c\xfc\x47\x56\x71\
-\xcb\xf9\x33\xf0\x78\x1c\x74\x97\x8d\x4b\xb0\x5a\xcb\x26\x91\x28\
-\xf0\xfa\x2b\xcf\x70\xe3\x92\x66\xfa\x9a\xf7\xb0\xf5\x95\x0a\xae\
-\x2a\xbf\x16\x9f\xed\xa0\x3c\xfe\xd4\xaf\x1d\xb7\x47\x91\x40\x37\
-\x79\xf2\x64\x6a\x6a\xab\x51\x55\x1b\xdb\x30\x39\xd2\xdd\xcb\x07\
-\x9d\x7e\x52\xe3\xe6\x61\x39\x2e\x04\x44\xbf\xbb\x76\x25\x6f\x7e\
-\xff\x6a\x3c\xf9\x14\x2f\xbc\xf0\x08\xc9\xe8\x46\x7e\xfc\xa3\xbf\
-\x91\xd2\xaa\xd8\xb0\x65\x1b\xad\x46\x80\xee\x9a\x06\x2c\xbc\xa8\
-\x8a\x2d\x0d\x50\x04\x3b\x91\x7f\x6d\x34\xdb\x40\x17\x9b\x9e\xca\
-\x92\xed\x6e\x21\xde\xd5\x43\x2e\x91\xc4\x95\xcc\x11\x74\xe9\xd8\
-\xba\x2a\xf1\xc0\xb4\x2d\xf2\xb6\x41\x24\x54\x42\x64\x74\x2d\x9e\
-\x9a\xf1\xa4\xc3\x01\x6c\xb7\x0f\x1d\x4d\x1a\xcb\x51\xd4\x62\xdd\
-\xa0\xd8\x58\x05\x83\x92\xa6\xf5\x9c\x3f\xce\x4d\x6d\x6d\x99\x24\
-\x4a\x99\xac\x20\x6d\x86\xc4\x8e\xbf\x3f\xf7\x04\xbf\xfa\x6a\x0f\
-\x0f\xfc\xfb\x3e\x6e\x9d\x78\x27\x95\x59\x0f\xaa\x6d\xa1\x3c\xff\
-\xd2\x83\x8e\xd7\xa7\x11\x0e\x87\xe5\x97\xb8\x52\xe9\x38\x8e\x65\
-\xf3\xe2\xd6\x36\xea\x3e\xff\x2d\xb2\xae\x10\xdb\xb6\xed\x64\xee\
-\xac\x99\x0c\x74\x75\xa0\xb6\xee\x65\x86\xc7\xe0\x96\x7f\xbb\x52\
-\x82\xdd\xb3\x2f\xbf\xc1\xa1\x84\x4d\x70\xca\x5c\x0a\x15\xb5\x98\
-\x8a\x07\x4b\x11\x6b\xd6\x50\x35\x4b\xba\xbd\x12\x8f\x92\x6a\x3d\
-\x42\xa1\xa7\x87\x79\x81\x0a\x16\x4c\xad\xa7\xdc\xeb\xa6\x42\x30\
-\x48\x43\x00\xa3\xa0\xd1\x72\x93\x87\xaf\xa2\x86\x60\x5a\x16\x59\
-\x55\x61\x30\x9d\xa4\xa9\xb3\x93\x8d\x2d\xcd\xe8\x63\x1b\x28\x3d\
-\xed\x34\xb2\xbe\x08\x19\xcd\x91\x1e\x23\xb2\x63\xec\xc3\xb7\xf8\
-\xf2\x69\x15\xf8\xf4\x2c\xba\xa2\x63\xe4\x0b\x32\xa3\x41\x16\xd5\
-\x65\xb3\x7f\xeb\xab\x24\x5b\x76\x71\x53\xd5\x77\x18\x9f\x74\xcb\
-\xc2\x49\xd9\xf0\xde\xcb\xd2\x00\x15\x15\xe5\x45\xd0\x73\xbb\x71\
-\x94\x1c\x4f\xfd\x65\x15\x91\x25\xdf\x62\xd0\x57\x8d\x63\x5b\xb4\
-\xb7\xb6\xd1\xd8\x30\x9e\x02\x1a\x85\x78\x82\x2b\xc6\xc1\x19\x55\
-\x01\x74\x97\x8f\xdb\x7e\xff\x14\x35\x97\x5c\x4f\x06\x1d\x47\xc4\
-\xa6\x63\x63\xab\x05\xec\xc1\x41\x06\x0e\xec\x65\x8c\x61\xf3\xc5\
-\x89\x93\x99\x5c\x1e\x21\x20\x1e\x56\x77\x44\x79\x28\xea\xbe\x93\
-\x95\x9f\xfc\x70\x61\x34\x4d\x20\x45\x31\x49\x7c\xf6\x12\x38\x20\
-\xae\x0c\x05\x76\xb4\x77\xb2\x66\xff\x2e\xb4\x86\xa9\x78\xa6\x4c\
-\xc7\x08\x47\xd8\xf9\xd6\x73\xdc\x71\xf1\xe9\x84\xac\x04\x22\xb3\
-\x99\xa6\x41\x3e\x57\x90\xe9\x71\xdb\x9b\xeb\xa8\x53\x42\x94\x6b\
-\x21\xe8\x8b\x72\xfd\xf4\x79\x78\x4d\x0d\xe5\x9d\xf7\xff\xee\x08\
-\x85\xa5\xa4\x2c\x80\x91\x37\xe5\x07\x1c\x6a\x6b\x66\x67\x62\x3c\
-\xe9\x86\x59\xd8\x05\x87\xe3\xc7\x0e\x31\x75\x42\x23\x59\x47\xc5\
-\xc6\x03\xaa\xc5\xb6\x37\x5f\xa3\x2a\xd7\x4f\x59\x4d\x35\xa3\xce\
-\x38\x97\xbc\xb7\x0c\xc7\x51\x51\xb1\x30\x8f\xee\x27\xb6\x6b\x1b\
-\xd7\x2f\x3c\x97\x05\xe5\x95\x78\xb1\xa4\x51\xe4\x56\x09\xe2\x76\
-\x0a\xe7\x3f\x15\xd1\xff\xf7\xf4\xf0\xc9\x5f\x46\xde\x2f\x18\xab\
-\xc0\xac\x84\x4b\xe1\xe5\x7f\x6e\x20\x3b\x69\x2a\x9b\x8e\x7d\xc8\
-\x5d\x57\x9c\x47\xb2\xef\x20\xbd\x7d\x3d\x52\xad\xaa\xa8\x18\xc5\
-\xdb\x6b\xd7\xf2\xa3\xda\x33\xa9\x31\x75\x59\x82\x7f\xb4\x7d\x07\
-\xb3\x26\x4e\x20\x98\x11\x1e\xf0\xfe\x0a\x27\x1a\xeb\x61\xe2\x84\
-\xf1\xf2\x86\xa9\x54\x94\x57\x77\x74\xe0\x9c\xf6\x65\xb2\x8a\x5f\
-\xee\xca\xfa\x35\xaf\x73\xc9\xd2\xa5\x18\x6a\x40\x22\xb4\xf0\x52\
-\x49\x41\x1d\x03\xb7\xe3\x60\x68\x8a\x64\x8e\x66\x57\x37\x43\x6b\
-\x57\x72\xf7\xe7\xbf\x40\x8d\x47\x47\x17\xb5\xff\xb0\x4b\x4b\x80\
-\xd3\x8b\x61\x21\x76\xb2\x58\x12\x17\xeb\x81\x7f\x75\x9d\x0a\x74\
-\x9f\x4e\x8b\x45\xf5\x47\x5c\xad\x6d\xc7\xd9\xbe\x7d\x07\xf3\xce\
-\x38\x03\xcb\xad\xf1\x56\xeb\x76\xce\x39\x6f\x2e\xa9\x5c\x27\x03\
-\x83\x03\x68\x9a\x82\xa6\xba\x59\xf7\xce\xbb\xdc\x35\xfa\x6c\xaa\
-\xd2\x6e\x14\xc7\x62\x5f\xd3\x5e\x7c\xf5\x55\x8c\x4f\xba\x50\xfe\
-\xfe\xda\x13\x8e\x28\x62\x7c\x5e\x95\x69\xd3\xa7\x49\x3a\xfa\xd7\
-\x97\x57\xe0\x4c\xbe\x88\xf4\xf8\xb3\xd1\xb0\x78\x7b\xc5\x6b\x5c\
-\x78\xd5\xb5\x72\xf1\xa6\xe2\x48\x31\x43\x51\x6c\x34\xe1\x11\x82\
-\x2e\xab\x79\x5a\x5f\x5b\xce\x8f\x3f\x77\x21\xa7\x7b\x7c\xd8\x98\
-\xb2\x48\xc1\xfe\xf4\xe2\xfe\x55\x1e\x3f\x75\x71\x8a\x5a\x94\xbd\
-\x7c\xbe\x40\xb1\xc6\x50\x9d\x22\x88\x0e\x83\xe9\xa7\xb2\xc9\xf0\
-\x3f\x8a\x7b\xe6\x73\x39\xb6\xed\xdd\xcd\xa6\xdd\x5b\xa9\x99\x5a\
-\x4b\xd9\x98\x32\xb4\x12\x0d\xaf\x4f\x15\xac\x99\x0d\xef\xbe\xcf\
-\x6d\x15\x67\x50\x93\x2a\x4a\x7c\xad\x9d\xcd\xbc\x94\x38\xce\xf7\
-\x6a\x66\xa1\xbc\xb1\xe6\x69\x47\xd3\x4c\xc6\x8f\x6f\xc0\xe7\xf5\
-\xd1\xdd\xdd\x2d\x6b\xfd\xa1\xac\x9b\xd7\x36\x37\x11\x0f\x94\x52\
-\x52\x55\x4f\xf5\xec\x25\x32\x67\x0b\xc4\x15\x15\xa3\xd8\x42\xc5\
-\xcc\xd1\xbf\x6f\x0f\xb3\xe3\x09\xbe\x31\x77\xba\x2c\x72\x84\xd5\
-\x4f\x8d\xdf\xcf\xee\x70\x26\x9f\xc6\xe5\xf1\xcb\xb2\x56\x7a\x81\
-\xb0\x91\x2a\x74\xc7\x3c\xcb\x37\xbd\x49\x2e\x6f\xb0\xec\xc2\x8b\
-\xa9\xf6\x95\xc9\xbf\x8b\x77\x89\xe7\xd9\xf2\xf1\x47\x9c\x7b\xf6\
-\xd9\xf2\xfd\xc2\xfd\xcb\xca\xca\x4e\xda\x4e\x16\x4f\x92\x51\x22\
-\xe3\xde\xd2\x2c\x76\x35\xef\xa6\x39\xde\xc6\xec\x0b\xe6\xb0\x77\
-\xcf\x5e\x16\x75\xb8\x19\x9d\x11\xc0\xe7\x10\x1d\xec\x67\xf0\xca\
-\x85\xac\x7c\xf8\x31\x94\x75\xef\xfd\xd9\x71\xe9\x6e\x49\x80\xc4\
-\x0d\xc4\xcd\x0d\xc3\x90\xc5\x45\xae\xa0\xd0\xd6\x9d\xa4\x3b\x1f\
-\x84\x85\x5f\xc0\xc0\x8d\xad\x2b\xf8\x04\xc2\x1a\x26\x87\xdf\x5f\
-\xcd\xad\x33\x1a\x59\xec\x29\x41\x57\xb5\xff\x01\x5c\xa7\x16\x32\
-\xe2\x69\x9b\xdb\x9a\x51\x1a\x46\xf1\xee\x3b\x1b\x98\x58\x3d\x86\
-\xca\x8a\x0a\x0a\x86\x49\x73\x4b\x33\x63\x4e\x9b\xc4\xdc\xc5\xe7\
-\xca\x45\x35\xed\xdb\xcf\xfb\xff\x5c\x4f\x58\xf7\x62\xd9\x16\xcd\
-\x07\x8f\x72\xd7\x77\x6f\x47\xb7\xa4\xad\x24\x63\xdd\xbe\x7d\x3b\
-\xcb\x96\x7d\x5e\x82\xb6\x30\xd3\x67\x2f\xa1\x5b\x1c\x6c\x6b\xe2\
-\xa8\xaf\x9b\xea\xda\x2a\x72\xef\xb5\x70\xbe\x19\x46\x75\x14\xe2\
-\xf1\x24\x99\xeb\xce\x24\x17\x52\x51\x76\xee\x5b\xed\x28\xaa\x89\
-\x6d\x15\x2d\x2d\x68\xa3\xc8\xc3\x99\x4c\x5e\x1a\x43\xb1\x74\x36\
-\x1d\x68\x41\x9d\x7e\x2e\xfa\xf4\xf3\x71\x39\x02\xbb\x53\xec\xfc\
-\xf3\x13\xdc\xb9\xf0\x6c\xce\x6f\x68\x40\xfb\x8c\xab\x8f\xc4\xe8\
-\xa9\x00\xb7\x6d\xcf\x2e\xca\xe7\x34\x30\xee\xf4\x19\xb8\x35\x15\
-\xc3\xcc\x93\xcb\x66\x65\x8e\xf6\x06\xfc\x72\xb7\x85\x77\x8d\x5c\
-\xf2\x7f\x35\x4d\x16\x42\x03\x9d\x7d\xf4\xec\x3e\xc2\xe9\x65\xe3\
-\x70\x2b\x9a\xd4\x11\x45\xa9\xde\x74\xb8\x89\xa6\xa6\x03\x2c\x59\
-\xb2\x44\x2a\xc1\x32\x95\x0e\x5f\x96\x9d\xe7\xaf\x6f\x2c\x27\x3f\
-\x5e\x21\x97\xcd\x33\x78\xa0\x8d\x9f\x4d\xba\x80\xf4\xe0\x10\x1b\
-\xd2\xed\x1c\x8e\x58\x2c\x59\xba\x18\x65\xf7\x81\x35\x8e\xee\x72\
-\xc8\x66\x0c\xe9\x46\x42\x77\x17\x45\x50\x26\x63\xd0\xda\x7a\x1c\
-\x8f\xe6\x67\xdc\xf8\x46\x1e\x7d\x73\x03\xe3\xaf\xbb\x07\x23\x9b\
-\x24\xbb\xe6\x4d\x2e\x72\x7c\x9c\xb3\x68\x06\xe5\xe1\x8a\x93\x1f\
-\x3a\x38\x38\x48\x45\x45\x85\x8c\x5f\x61\x3c\xb1\x88\xa3\xbd\x1d\
-\x34\x0f\xb4\xf3\xc5\x6f\x7e\x0d\x4f\xc0\x5f\x64\xc1\xc5\x9a\xb7\
-\x98\x11\x34\x15\xdb\x2e\xfc\xaf\x60\xf8\xf4\x9f\x9f\xe1\x4f\x8f\
-\x3f\xc1\x0d\xff\x76\x13\xd7\x2c\x5a\x4c\xb5\x12\x94\xd5\xa4\xc0\
-\x17\xc1\x55\xc4\x33\x77\x74\x76\xb0\x79\xcb\x7b\xec\x3f\xb6\x9f\
-\xb1\xd3\x1b\x25\xc8\x0e\x65\xe3\xd4\x4e\x6f\x44\xd1\x14\xae\xbb\
-\xee\xdb\xa4\x33\x31\xde\xfa\xdd\x1f\x39\xeb\xfc\xb3\x19\xf7\xf9\
-\xf3\xe9\x4b\xf4\xd2\xb4\x6b\x07\xca\xc6\x4d\xaf\x38\xaa\x66\xe2\
-\xf3\xfb\x28\x09\x95\x90\xcd\x65\x30\x0b\x05\x5a\x5b\xdb\x08\x04\
-\x82\x54\x57\x8f\xa2\xbd\xb9\x83\x15\x1b\x3f\xa0\xea\x4b\x3f\xe7\
-\xe0\x1b\x6f\x70\x01\x36\x37\x5f\xb2\x54\xd6\x0a\x8e\x54\x36\xe0\
-\xc8\x91\x23\x8c\x1f\x3f\x5e\x96\xa1\xe2\x5a\xb5\x7e\x3d\xa5\x0b\
-\xa7\xb3\xe8\xbc\x33\x31\xac\x82\x7c\x68\xb1\xdb\x52\xe5\x75\x8a\
-\x3c\xfd\x53\xbb\xfd\x19\x1f\x3e\xd1\xd1\xc1\x59\x67\x2d\x62\xa0\
-\x7f\x10\x55\x53\xd9\xb0\x7e\x3d\xb9\x8c\x49\xfb\x8e\xfd\x2c\x9c\
-\x7e\x3a\x93\x4a\x47\x4b\xe9\x5e\x5c\xc2\x1b\x2c\x25\xc3\xab\x5b\
-\xd7\x71\xc1\xd5\x8b\x49\xd8\x82\x03\xc4\x39\xd4\x72\x9c\x05\xd3\
-\x16\x11\xaa\x69\x80\xb4\xc1\xed\xb7\x5c\xce\x4f\xee\xfc\x21\x95\
-\xd3\x3e\x87\xcf\xf6\xf0\xf0\x43\xf7\xa1\x7c\xb8\xfd\x0d\x47\x28\
-\x2a\xa6\x21\x90\x5b\x41\xd7\x15\x29\x6f\x57\x54\x55\xca\xbe\x80\
-\xd8\xa6\xd8\x60\x8a\xdd\x07\x5b\x78\xf4\xc9\xd7\xb9\xfd\xda\x1b\
-\xb9\x61\xde\xd9\x72\xa1\x23\xeb\x10\xc0\xb3\x72\xe5\x4a\xbe\xfc\
-\xe5\xab\xe5\x03\x89\xfb\x3c\xfa\xb7\x67\x98\x71\xc9\x62\xfe\xf0\
-\xf8\x43\x5c\x73\xcd\x35\x2c\x5e\x7c\x1e\x55\x15\x63\x40\x15\xbb\
-\xfd\x89\x01\xfe\x55\x1a\x14\xaf\xdd\x7d\xf7\xdd\x3c\xf4\xd0\xc3\
-\xc5\x82\xc8\x71\x98\x33\x67\x0e\x1b\xdf\xdb\x84\xa2\x68\xbc\xf8\
-\xc0\x63\x7c\xf5\xbc\x4b\x71\x69\xba\xc4\x1d\xc9\x18\x8d\x18\x9b\
-\xfa\x9b\x98\x7c\xf6\x44\x2c\x5b\x84\x70\x8c\xce\x81\x1e\x52\x5d\
-\x39\x2e\xb8\xe2\x2b\x3c\xf6\x87\x7b\xb8\xe9\xab\x36\x9d\xad\x47\
-\x19\x3b\xe9\x27\x98\xf9\x71\x2c\x5f\xf1\x12\xca\x87\x3b\x5e\x77\
-\x04\x72\xf7\x0d\xf4\xa3\x89\xf4\xe6\x28\x78\x7c\x6e\xc6\x8e\x1b\
-\x43\x3e\x2f\x4a\x62\x85\xe3\xcd\x9d\x6c\x78\x75\x23\xb7\x5d\xff\
-\x5d\xc6\xfa\x2a\x8b\x15\xdd\x49\xb5\xc6\xe1\xaf\x7f\x7d\x96\xeb\
-\xaf\xbf\x1e\x97\xcb\x87\x63\x17\xd8\xb4\x6d\x13\xb3\xbf\x74\x39\
-\x63\xa7\x4f\x24\x9d\x4a\x48\x65\x46\xd1\x34\x8e\x1c\x3c\x40\x7d\
-\x7d\xc3\xff\xd7\x03\xc4\x82\xef\xbd\xf7\x5e\xee\xbf\xff\x7e\x84\
-\x9c\x2f\x7e\xf7\xbb\x7c\x0c\xc6\x63\x92\x41\x2e\x7f\xe2\x59\xae\
-\x39\xe3\x3c\x49\x77\x8b\x15\xb4\xc3\x8b\xab\x9f\x67\xca\xc5\xf3\
-\x29\xad\x09\x49\x2c\x11\x5a\x80\xdb\xeb\x61\xc7\xce\x03\x1c\x39\
-\xdc\xc6\x82\x59\xa3\xb9\x60\xfe\x0e\x6c\xdb\xcf\xfe\xa3\xb3\xd8\
-\xbe\xbf\xc0\xd4\x69\x8d\x28\x2f\xbf\xfa\xb0\x13\x0c\xfa\x28\xab\
-\x28\x27\x91\x48\x12\x1b\x8a\x31\x6f\xfe\x6c\x6c\xdb\x94\x2a\x71\
-\x57\x47\x27\xf9\x6e\x8d\x8b\x1a\xe6\xa1\xda\x42\xce\x12\x6c\xe6\
-\x13\x02\xf3\xf6\xba\x37\x99\x3f\x7f\x1e\x91\x70\x85\xcc\x0c\xab\
-\x37\xad\xe7\xd2\xef\xdc\xc0\x60\x3e\xc3\xd8\xb1\x63\x71\x5c\x45\
-\x63\x09\x11\xf4\x81\x07\x1f\xe4\xbb\xb7\x7e\x17\xc7\xf9\xb4\x26\
-\xf0\xaf\xbc\x60\xc5\x8a\x15\xdc\x70\xc3\x0d\x27\x0d\xe0\xd3\xfd\
-\x0c\x44\x07\xe4\xa2\xef\xfd\xe5\x3d\xdc\x7b\xd5\x0d\x12\xb8\x45\
-\x01\xfd\xf1\xee\x6d\xb4\x6b\xbd\x78\xab\x43\x64\x9d\x14\x7e\x8f\
-\x97\x42\xc1\xa2\x7a\x54\x2d\xab\xd6\xac\xe5\xae\x9f\xfe\x8e\x27\
-\x1f\x7b\x80\x2b\x3e\x9f\xe5\xc8\xc1\x56\x16\x5e\xfc\x0b\xdc\xae\
-\x29\xfc\xf8\xc7\x3f\x42\x79\xe6\xb9\xdf\x38\x02\xf4\x44\x3a\x19\
-\x18\x18\xc0\xe3\xf1\x53\x5f\x5f\x8f\xdf\xa7\xc9\x78\xdd\xf6\xd1\
-\x6e\xae\x9d\x77\x35\x61\x2b\x84\x22\x3a\x14\xb2\x7e\x2f\xd6\xea\
-\x6f\xad\x5a\xc9\xc2\x85\xf3\xe8\xe9\x1e\xa2\xab\xab\x8b\x7d\xed\
-\xcd\xdc\xf6\xd0\xef\x70\xbc\x0a\x9b\xb7\x7c\xc8\x92\x8b\x17\x4b\
-\x06\x2c\x2e\x11\xff\x37\x7e\xfd\xeb\xfc\xe9\x8f\x8f\x4b\xd0\x3b\
-\xf5\xfa\xd3\x93\x8f\xb3\x60\xc1\x42\x4e\x9f\x39\xeb\xe4\xcb\x22\
-\x1b\x89\xd6\x5b\xde\x34\xe4\xa7\x89\x0d\x6a\x6b\x69\x97\xe4\xeb\
-\xf0\xf1\x66\x02\xed\x43\xd4\x45\x2a\x24\x39\xfb\xaf\xe7\xff\xc8\
-\xa4\x8b\x4e\xc7\x56\x2c\x72\xf9\x24\x05\xdb\xa2\xaa\xb2\x06\xab\
-\xa0\xb3\x7d\xfb\x36\x7e\xf2\xe3\x5f\x4b\xee\xb9\x7a\xed\x4b\x4c\
-\x6f\x9c\x42\xdd\x84\xd3\x51\x35\x17\x37\xdd\xf8\x35\xc1\x04\x1f\
-\x76\x04\x98\x99\xa6\x88\x4d\x9b\x9e\x9e\x1e\xbc\x5e\x1f\xe1\x70\
-\x00\x97\x5b\xc5\x36\x15\xbc\xbd\x0a\xe7\xcd\x3c\x57\x5a\x5b\x64\
-\xaa\xde\x9e\x5e\x99\x87\x97\x5e\xb4\x14\xaf\x57\x00\xa1\xec\x95\
-\xf1\xfe\x87\x9b\x39\xe7\xe6\xeb\xc8\xe8\x06\x47\x5b\x5a\x39\x63\
-\xe6\x4c\x89\xd4\x23\x06\xf8\x8f\xdf\xfc\x96\x1f\xdc\xfe\x43\x69\
-\xd8\x91\x4b\x50\xe4\xf6\x13\x6d\x8c\x19\x33\x06\xb7\xcb\x23\x65\
-\xb9\x91\xeb\xe3\x8f\x3f\x66\xc9\x45\x17\x49\x7e\xf2\xd8\x7f\x3f\
-\xce\x75\xd7\x5d\x87\xa9\x2a\xc4\x7b\x07\xf8\xdb\xc3\x4f\x50\x5d\
-\x31\x99\x4e\x27\x43\x4b\xb4\x83\x65\x17\xcd\x83\x54\x2f\x96\x25\
-\x0c\x66\x51\x59\x51\x43\xde\x28\xb0\x71\xe3\x46\xae\xfb\xca\x0d\
-\xd4\xd7\x4d\xe2\xbe\x9f\xfc\x9c\x39\x69\x95\xba\x0b\xcf\x62\x5d\
-\x6b\x13\x3f\xba\xe3\xa7\x28\xcf\xbd\xf4\x7b\xc7\xe7\xf3\x12\xf0\
-\x87\x31\x4d\x4b\xb6\x95\x44\xeb\xe0\xc8\x91\x26\xaa\xaa\xaa\x88\
-\x84\x03\xa2\x44\xa3\xa7\xb9\x8b\x44\x47\x94\xee\xa3\x9d\xdc\x7a\
-\xf5\x2d\x8c\x1a\x35\x0a\x45\x28\xab\x4e\xb1\xb9\x29\xd6\xf4\xe1\
-\xee\x6d\xcc\xbd\xe9\x32\xa9\xd2\x0a\xd9\x2c\x52\x1e\x01\xb3\xb8\
-\x20\x11\x02\x87\xf6\x1f\x60\x6c\x7d\xdd\x49\x55\x47\xaa\xc2\xb6\
-\x85\x95\x37\x38\x7c\x64\x2f\x13\x1b\xa7\xe2\xf5\x07\x3f\x95\x12\
-\x05\x7e\x08\x23\x0a\x6e\x62\xa1\x60\x6a\xf0\xe3\xff\xf3\x63\xec\
-\x70\x35\x33\xaf\xb8\x89\x3e\x55\xd0\xdb\x02\x07\xfe\xfb\x7e\x4e\
-\x1f\xa3\x32\x79\x4a\xdd\xc9\x4c\xe4\x76\xbb\x50\x85\x24\x17\x4d\
-\x93\x4a\xa6\x71\x9d\x88\x72\x83\x4f\x28\xdc\x06\x9d\x93\x6b\xa9\
-\xbf\x6a\x29\xca\xeb\x6f\x3d\xee\x08\x16\x68\x15\x6c\x0c\xa3\x20\
-\xe3\xd6\x2c\x64\x39\x74\xe8\x10\xc1\xa0\x9f\xda\xd1\x35\xe8\x9a\
-\x4e\x42\xf4\xea\x81\xda\x51\x55\x7c\xbc\x7a\x07\xcb\x16\x5e\x81\
-\x57\x60\x82\x28\xfc\xf5\x62\x9c\x3f\xf9\xe2\xb3\x7c\xe3\xc1\x9f\
-\xc9\xa6\xa5\xb8\xfe\xf4\xe4\x63\xdc\x71\xc7\x4f\x65\x5f\xff\xde\
-\x7b\xee\xe6\xce\x3b\xef\x2c\xf2\x00\x91\xc3\x87\x95\x9d\x3d\x3b\
-\x77\xf1\xd8\xaf\x7e\x4d\xb5\xe9\x60\x28\x0e\x77\x3f\xff\x2c\x81\
-\xf2\xf2\x4f\xea\x61\xe7\x54\x89\x0c\x4e\x74\xf7\xb1\x6e\xcf\x0e\
-\x62\xb5\x67\x10\x75\x8b\xba\x43\x64\x23\x93\xf1\xdb\x36\x51\xe5\
-\xef\x63\xeb\x8e\xcd\x2c\x58\x38\x5b\xf2\x90\x31\x63\x6a\x25\x41\
-\xea\xec\xe8\x25\x18\x1e\x45\xc7\x3b\xdb\xb8\xa5\x62\x06\x14\x6c\
-\xf6\x07\x61\xea\xf7\xbe\x86\xf2\xcf\x77\xfe\xea\x88\x06\x67\x2e\
-\x5b\x90\x2c\x50\xe4\x56\xd1\x70\x14\x74\xb8\xae\x6e\xac\xe4\xd6\
-\xe2\x12\x3b\xe0\x20\xa4\x26\x9d\x2d\xef\xed\xe2\xc0\x96\x66\xce\
-\x98\x3c\x9b\x79\x73\xe6\x33\x2a\x10\xc4\x65\xc0\x37\xef\xf8\x1e\
-\x4f\xbd\xfb\xba\x0c\x95\x91\x96\xb7\x91\x33\xa4\x01\x55\x8f\x86\
-\x47\x77\xc9\xf8\x14\x06\x10\xae\x9e\x4d\x67\xb8\xfd\xcb\xd7\x33\
-\x19\x0b\x4f\x21\x8f\x81\x87\xea\x45\x73\xf8\xda\xbd\x77\x63\x89\
-\xd2\x51\xa6\x9a\xa2\x01\x64\xe7\xca\xc8\xf3\xef\x2f\xfc\x83\xe0\
-\x82\x4b\xc9\x68\x1e\x49\xd7\x85\x21\xd3\xa9\x24\x53\x77\x6f\xe4\
-\x2b\xcb\x66\xf3\xf8\xf3\x7f\xe2\xaa\x2f\x7d\x81\xb2\xf2\xb0\x6c\
-\xf0\x1c\x3e\x7c\x90\x78\x2c\x8d\x69\xba\xd8\xb5\xea\x1d\xee\xaa\
-\x5d\x24\x15\xa9\x8f\x8c\x41\xe6\xde\x7d\x3b\xca\x8a\x37\x1e\x91\
-\x18\x20\x24\x31\xab\x20\x5a\xd3\xb6\x64\x82\xe9\x4c\x82\xb2\xb2\
-\x88\x2c\x3a\xc4\x4c\x80\xc8\xbf\x5d\x5d\xdd\xc4\x63\x19\xb6\x6d\
-\xf8\x88\x31\x0b\x97\xd1\x3d\x61\x1a\xd9\xde\x3e\xfa\x5a\x7a\x51\
-\x5b\x5a\x98\x1e\xf1\x30\x67\xc1\x4c\xce\x38\x73\x0e\xce\xb0\x0e\
-\xa8\x4b\x99\xe7\x93\x1d\x1f\xe1\x09\xe2\xc1\x7f\x7e\xc7\x1d\xe8\
-\x07\x0f\x51\x99\xcf\xa1\x58\x16\xba\xe3\xa6\xbf\x3c\xcc\x2f\x97\
-\x3f\x8f\xad\x16\x09\xd5\x88\x01\x7a\x7a\xa3\x3c\xf4\xdc\xdf\x29\
-\x5d\xfa\x75\xd2\x82\x00\x89\xd0\x93\x33\x06\x36\x27\x8e\x1c\xe1\
-\xbc\xe3\xdb\xf1\x94\x64\xa9\x18\x53\xce\xec\xb9\x33\x80\x02\x5e\
-\x9f\x47\x36\x6f\x3a\x3a\x7a\xd8\xbb\xfb\x30\xdb\xfe\xf9\x3e\xf7\
-\x4e\x5e\x4c\xc0\x74\xf1\x41\xcf\x71\x16\x3e\x78\x37\xca\x9a\xf5\
-\x4f\x3b\x82\xd4\x88\xbc\x29\x16\x27\x9a\x21\xa5\xa5\xa5\x58\x56\
-\x01\x55\xb3\xa5\x0b\xa5\x53\x79\x1e\xff\xe3\x9f\xb9\xf1\xc6\xaf\
-\x53\x3b\xae\x9e\xee\xbd\x47\x68\xcf\x84\xd8\x3f\x7b\xa1\x34\x8c\
-\x0b\x0d\x9f\xa5\x90\x69\x6d\xe2\xfd\x0d\xeb\xf9\xde\x05\x0b\xf9\
-\xe2\xd2\x73\x8b\x3a\xbe\xe4\xf7\x76\xb1\x1f\x7c\x8a\xa0\x29\x7e\
-\xbe\xfc\xe2\x8b\x38\x87\x00\x21\xdb\x14\x13\x0f\xd2\x73\xfa\xcb\
-\x43\xfc\xe2\xf5\x97\xb0\x2d\x1d\x53\xb3\x70\x5b\xb0\x66\xdb\x87\
-\x6c\x6e\xb5\xf0\x4e\x9b\x49\x46\x0d\x9c\x9c\x6a\x90\xbd\x02\xc5\
-\x61\xd7\xeb\xaf\xf1\x35\x6f\x96\x1d\x5d\x1f\x33\x7d\xe6\x64\xaa\
-\xaa\xca\x09\x47\x42\xb2\x6a\xd5\xf4\x62\xa3\xa7\xbb\x6b\x88\x9d\
-\x1f\x6c\xe3\xdf\x27\x5f\x40\x28\xa7\xb3\x6e\xdf\x4e\xce\x7b\xee\
-\x41\x94\xb5\x1b\x9e\x91\x06\x18\x1a\x1a\x22\x99\xcc\xe0\xf7\x45\
-\x4e\xa2\xb1\x65\xe7\x64\x8b\x5c\xe4\xf7\x86\xfa\xa9\x34\x34\x4c\
-\xa0\xad\xf5\x04\xad\x5b\x76\xd3\x92\x2f\xa5\xff\x92\xcb\x40\x36\
-\x19\x86\xcb\x51\x61\xf7\x42\x01\xbb\xb7\x83\x8e\xcd\xab\xf9\xed\
-\x6d\x37\x33\x2e\xe2\x47\x55\x8a\x5c\x5f\x06\x51\x91\xc6\xcb\xee\
-\xf0\xaf\x7f\x7d\x0f\x81\x4d\x7b\x08\x0b\xcd\x90\x0c\x9a\xa3\x51\
-\x73\xcd\xa5\x5c\x72\xf3\xf7\x64\x6c\x1f\xef\x6a\xe5\x91\xe7\x97\
-\x53\x7a\xd6\x85\xa8\xe5\x93\xc8\x0b\xa6\x3a\xd2\x1d\x1e\x4e\x15\
-\x96\x63\xb2\x77\xf9\xf3\xcc\x3a\xb4\x95\xd3\x2f\x99\x47\x22\x97\
-\xa2\xbc\xaa\x42\x1a\x3f\x95\x8c\x91\x37\x32\xb8\x5d\x3e\xc2\xa1\
-\x32\xde\xdd\xf0\x0e\xbf\x1b\x7f\x3e\xa1\x9c\xc3\xcb\x1b\xd7\xa2\
-\x7f\xe7\x72\x94\x77\x37\xbf\xe0\x88\xfc\x9f\x88\x1b\x72\xe7\x4d\
-\xa3\xd8\x3b\x13\x61\xd1\xd7\xdf\x29\x53\x8a\x98\xae\xe8\xee\x1a\
-\x60\xd9\xb2\x65\x4c\x9d\x7a\x1a\xbf\xba\xf5\x67\x58\x5a\x35\xfe\
-\xef\xdc\x4c\x5a\x2f\x32\xaf\x91\xce\xae\x78\x2e\xd1\xcf\xd7\x1d\
-\x95\x7c\x47\x13\x07\x77\x6f\xe5\xca\xd9\xa7\xf1\x85\x73\x17\xe1\
-\x77\x6b\x78\x1c\x5b\x36\x41\xc5\xc8\x42\x5b\x5b\x0b\xf7\x7c\xed\
-\x26\x66\x68\x3e\x34\xdb\x24\xa5\xc0\xb7\x1f\x79\x88\x77\x37\x6d\
-\xe1\xf5\xf7\x3e\xc0\x75\xd1\x32\xaa\xe7\x9f\x03\x7a\x49\x31\x95\
-\x8a\x6c\x7e\x8a\xb1\xe5\x8b\x76\x9e\xce\x17\x9e\xe5\xb2\x99\x61\
-\x7c\x41\x17\x79\xb3\x58\xcd\x0a\x5e\x23\x64\xb1\xf9\xf3\xe7\x92\
-\x4e\xa7\xe9\xef\x8b\xb2\xf9\xe3\x8f\xb9\xad\x74\x26\xd5\x19\x85\
-\x77\xb6\x6d\xc1\xfb\xc3\x2f\x0a\x26\xf8\x90\x23\x76\xd8\xe7\x0d\
-\x14\x9b\x95\x66\x71\xaa\xcb\xb6\x0d\x1a\x1a\xeb\x65\xfc\x0b\xb9\
-\x4b\xf8\xdd\x96\x2d\x5b\x19\x35\xba\x81\xe8\xd1\x7e\x0a\x09\x9b\
-\xfc\x75\x37\x31\xa0\x05\x24\xf7\x16\xc2\x85\x10\x4c\xa4\x4c\x2d\
-\xe7\x7c\x84\xfa\xa9\xe2\xb1\x04\xe8\x46\xe9\x6a\x39\x4e\x6f\xd3\
-\x01\x82\xe4\x50\xbb\x3b\xb8\x68\xfc\x24\x02\xaa\x45\xfb\x8e\xdd\
-\x14\xba\x7a\x98\x3c\x6e\x2c\x13\x26\x4d\xa7\x66\x54\x0d\xdb\x5b\
-\x3a\x39\x3c\x65\x1a\x7d\xb3\x67\x60\xe2\x93\xf2\xb7\x95\xcd\x63\
-\xe4\xb2\x94\x96\x88\xfa\x44\x3c\x8e\x4b\xa6\xde\x96\xa6\x6d\x4c\
-\x68\xdb\xc5\xec\x86\x10\x91\x48\x50\x1a\x68\x04\xcc\x85\x21\xe2\
-\x89\x21\x09\xe4\x15\x95\xa5\xf4\xf4\xc7\x58\xd0\xa5\x31\x31\xed\
-\xe5\x9d\xed\xef\x11\xf8\xf1\x35\x82\x08\x3d\xe8\x88\x85\x27\x92\
-\x09\x12\xf1\x04\xd9\x5c\x5a\xce\xd8\x94\x97\x8b\x46\x88\x18\x3b\
-\x0b\x49\x8b\x96\x97\x97\x13\xf0\xfb\x69\xeb\x38\x41\xf7\xee\x18\
-\xb3\x6a\x26\xb2\x6d\xf2\x1c\x5a\x7c\x95\xe4\x87\x89\x8d\x6c\x3c\
-\xca\x3a\x41\xc1\x96\x4d\x8f\x22\xe1\x11\x1c\x40\x7a\x46\x5e\x8c\
-\xdb\xf4\xd3\xdd\xdf\x49\xc9\x96\xcd\xdc\x7f\xc6\x42\x46\xab\x6e\
-\x6c\xd3\x44\xa8\xe3\x9e\xd2\x12\xba\xe2\x83\xac\xca\x9a\xb4\x9d\
-\x3d\x9f\xb4\xe3\x95\xc6\x14\x97\xcb\x86\x7f\xbe\xf9\x2a\x97\x5d\
-\xb6\x0c\x4b\xaa\x3f\x1e\x69\xec\x77\x97\xff\x99\x5f\x9c\x3f\x8e\
-\xb0\x47\xc5\xc8\x66\x48\xc4\xe2\x72\xf7\x45\x59\x1e\x08\xfa\x89\
-\xc7\xa3\xf8\x03\x62\x9c\x4e\xa7\xad\xab\x9d\x51\xfb\xd3\x2c\x48\
-\x85\x78\x7f\xcf\x16\x94\x5b\x96\xa1\xac\x5a\x27\x78\x40\x19\x47\
-\x8f\x36\x15\xfb\x01\x22\x3e\x05\x64\xa9\x8e\x64\x67\xb5\xb5\x35\
-\x44\x22\x61\xc9\xad\xbd\x2e\x37\x9a\xa3\xf0\xf4\x23\x2f\xf0\x83\
-\xab\xbf\xcf\x4b\xfb\x3a\xe8\x38\xf3\x1c\xd9\x32\x13\x0f\x23\x67\
-\x78\x64\x75\x56\x5c\x78\x4e\x0c\x50\x69\x2a\x8a\xbb\x38\xee\x22\
-\xfe\x57\x02\xbb\xe3\x90\x49\xa7\x48\xbf\xf1\x0a\x7f\xbc\xe2\x4b\
-\xf8\x73\x62\x46\x20\x4b\xdf\x40\x2f\x2f\xb5\x77\x91\x5c\xbc\x98\
-\x84\xee\xc1\x14\x32\xfb\xb0\x11\x5d\x8e\xc2\x89\xa3\x7b\x99\x58\
-\x5f\x8f\xe1\x0a\xc9\xfb\x89\xf6\xd7\xf6\x95\xcf\xf1\xdc\x6d\x17\
-\x91\xce\xf4\xb1\x6b\xf3\x2e\x44\x99\x21\xc2\x57\x0c\x79\x85\xc2\
-\x7e\x4e\x9c\x68\x97\xdd\xe7\x70\x49\x88\x44\x3c\x8a\xbe\xad\x93\
-\x8b\xac\xb1\x6c\xda\xb3\x95\xd8\x57\xe7\xa1\x3c\xf7\xf2\x6f\x9d\
-\xba\xba\xba\xe1\x1b\x16\xc1\xea\xc0\x81\x03\x34\x36\x4e\x62\xf4\
-\x18\x61\x45\x37\x43\x83\x31\x0c\x43\x34\x14\xd3\x32\x4b\xe8\xb6\
-\xc2\xde\x4d\xbb\xd8\xdd\x9c\x23\xfc\xcd\x9f\x11\xd7\x82\xc5\x6e\
-\x8f\xf2\x09\x8d\x15\x0f\xf8\xc6\x8a\xd7\x68\xa8\xad\xe1\xb4\x05\
-\xf3\x8b\xfd\x82\xe1\x4b\xc8\x52\xb2\xdd\x85\x45\xec\xd5\x57\x79\
-\x68\xf1\xc5\x14\x32\x83\xfc\x7e\xc7\x0e\x4a\x97\x2e\x65\x50\xf7\
-\xc9\x1d\x16\xed\x75\x73\x38\x7b\x08\x03\x68\x56\x8e\xa6\xed\x1f\
-\x71\xfa\x59\xe7\x60\xda\x45\xae\xd1\x79\xe2\x10\x77\xce\x2f\x23\
-\x90\xee\x22\x9b\x49\x62\x18\x79\x8e\x1f\x6b\x95\x4c\x55\x0c\x4d\
-\x8a\x49\x17\xc9\x65\x54\xf0\xb8\x35\xda\xfe\xb1\x8d\x2f\xbb\x26\
-\xf3\xf1\x81\xed\xd4\xff\xe7\x8d\x28\x0f\x3e\x7a\xbb\x23\x48\x49\
-\x69\xa4\x44\x62\x80\x20\x40\x82\x19\x8e\x19\x5b\x47\xed\x98\x10\
-\x66\x3e\x4f\xdb\x89\x6e\x26\x4f\x9e\x28\x07\x27\x84\x6a\x3b\x34\
-\x30\x88\x5a\xd0\xd9\xb2\xf9\x30\xf9\xcb\x6e\x66\x50\x29\x0a\x94\
-\xfa\x48\x6b\x5b\xb1\x64\xd8\x2c\xff\xcb\xd3\x94\xfa\x7d\x2c\xbd\
-\xe2\x4b\xe4\x44\xcc\x8e\xf4\x08\xa5\x20\x24\x04\x12\x1b\x33\x39\
-\x48\xff\xba\xb7\x18\xe3\x0e\x51\x7a\xf1\xa5\xf4\xbb\x85\x74\xfd\
-\x89\xb1\x44\xc3\x54\x28\xd1\x22\x8c\xdc\xb6\xc5\x8a\xbf\x3e\xc9\
-\x75\x37\x7c\x8d\xbc\x16\xa4\x60\xdb\x18\x79\x83\xaf\x8e\x49\x50\
-\xa7\x77\x4a\x25\x28\x9f\x33\x69\x6b\xed\xa4\xb3\xab\x93\xf1\xf5\
-\x0d\xf2\x39\x04\xc8\x0b\xb5\x4a\x77\xa9\xc4\x3f\x6c\xe6\xdb\xe5\
-\x0b\xd8\xd3\xb4\x93\xd2\xbb\x2e\x47\x79\x61\xf9\xfd\x8e\x20\x41\
-\x3e\xb7\x0f\xb3\x20\x94\x14\x93\xa1\xa1\x01\xf2\x79\x93\x79\xf3\
-\x67\xc9\xa6\xa5\x88\x29\x81\x0b\x12\xe0\x04\x77\x37\x54\x92\xa9\
-\x0c\x87\x8f\x76\x91\x9c\x78\x2e\x27\x42\x53\x65\x91\x22\xe2\x54\
-\xe2\x93\x68\x84\x00\xab\x5f\x7c\x96\x12\x8f\x8f\x25\x57\x5c\x45\
-\x5e\xf5\x52\x38\xc5\x43\x04\x56\xa8\x1a\x74\x1c\x3b\x8c\x31\xd8\
-\xcb\x8c\xd9\x73\xe5\x7b\x6c\xc5\x85\xad\x8a\x06\x4d\x51\x35\x36\
-\x04\xf6\x3b\x45\x29\x5e\xf4\x22\x8e\xee\xdb\xc5\xfc\xd3\xa6\x31\
-\x28\xdb\x68\x1e\x0c\xb3\xc0\x65\xe1\x2e\x26\x87\xfa\xe4\x88\x6e\
-\x3e\x5f\x60\xef\x9e\x83\xd2\x10\xe2\x2a\x29\x2d\xa1\xb4\xa4\x8c\
-\xf6\xb6\x36\x52\x99\x14\x9b\x57\x6e\xe0\xd1\x19\x57\x73\xe0\xe0\
-\x2e\xaa\x7f\x7b\xbd\x30\xc0\x7d\x52\x10\xb1\xcc\xe2\x88\x4c\xc1\
-\x34\xd0\x74\x8f\xd4\xd3\x45\x36\xf0\xf9\x35\xaa\xaa\xab\xa4\x4b\
-\x09\x0f\x11\xde\xd2\xd9\xd9\x8b\xd7\xe3\x65\x28\x9a\xa5\x3d\x38\
-\x9d\x81\x8a\x69\xa4\x34\xa1\xce\x16\xd5\x19\xcd\x2e\xa6\xd2\xbf\
-\x3f\xfe\x28\x17\x9c\x73\x0e\x35\xd3\x67\xa0\xaa\x3e\xd9\x2f\x14\
-\xf1\x28\x9b\x44\x2a\x9c\x38\xbc\x1f\xb7\xea\x66\x74\xe3\x38\x0a\
-\xaa\xf7\x64\x2a\x15\x69\x75\xa4\x87\x30\x02\x82\xf2\xde\x0e\x64\
-\x52\x83\xd8\x7d\x7d\x94\x34\x8c\x97\x5c\x21\x67\x39\x2c\xf3\x1d\
-\x67\x52\xa8\x0b\xc7\xd6\xc8\x66\x0b\x6c\x7c\xe7\x5d\x6a\x6b\x47\
-\x53\x57\x57\x2f\x3d\x56\x8e\xfc\x08\xa0\x8f\x25\xf8\xdb\x53\xcf\
-\xf1\xd4\xfc\x1b\x39\x76\x70\x2f\xee\x5b\x17\x0b\x03\xfc\xce\x11\
-\xf3\xb6\x2e\x55\x93\xee\x94\xc9\x1a\x92\xf9\x09\x86\x27\xb8\xb4\
-\xa0\x9b\x8e\xe8\xc4\x62\x53\x52\x12\xa6\x7e\xfc\x04\xfa\xfa\x7a\
-\xe9\xeb\xeb\xe3\x68\x53\x3b\xa1\x4b\x6f\xa4\xdb\x3b\x09\x43\x36\
-\x4b\x86\xc5\x0f\xa7\xb8\x83\x8f\xde\xfd\x73\x7e\xf8\xfd\xef\x41\
-\x79\x05\x9a\xe6\x97\x06\x30\x6d\x03\xf1\xc3\x40\x7b\x33\x1e\xcd\
-\x43\x55\x6d\x35\xa6\xe6\xfe\x94\x22\x3c\x02\x94\xc5\x59\x9e\x62\
-\xcf\x50\x77\x34\x7c\xe9\x7e\xda\xb7\x7f\x48\x36\xde\xc9\xcc\x0b\
-\xaf\xc0\xb0\xf2\xf4\xc5\x06\x39\x3f\xd0\x49\x85\x2b\x21\x27\x5c\
-\x45\xd5\x97\x4a\x65\x09\x06\x22\xd4\xd4\x8c\x96\x98\x75\xfc\xf8\
-\xf1\xa2\x21\x2c\x87\x55\xaf\xae\xe6\xd1\xd3\xae\xa1\xb3\xe9\x00\
-\x5d\x57\x4e\x43\x59\xb9\xfa\xbf\x9c\xca\x4a\x21\x73\x59\x52\x16\
-\xcf\x64\xf3\x82\x95\x52\xb0\x0b\x52\x3f\x0f\x06\x4a\xf0\x78\x85\
-\x38\x62\x93\x4c\x24\x58\x74\x96\xd0\x03\xc5\x6e\x2b\x3c\xfb\xcc\
-\x0b\xf8\xbf\x70\x2b\x27\xa8\x14\x81\x32\x0c\x71\x36\x02\xb0\x04\
-\x69\xf9\xeb\x83\xf7\x71\xf3\x0f\xbe\x4f\x56\xe4\x38\xc7\x7d\x52\
-\x49\x3a\xbc\x67\x17\xb5\x55\xa3\x28\xad\xa9\xc0\x56\x8b\x60\x37\
-\x72\x89\xf8\x77\x4e\x91\xc7\x75\xcb\x22\x76\xf4\x20\x03\x1d\x47\
-\xb9\xf1\xdc\xf9\x2c\x9a\xd6\xc8\x47\xdb\x3f\x64\xe3\x9e\x83\x68\
-\x56\x9c\xb3\x16\xcd\xe3\xf4\x29\xa5\xe4\xa3\x9d\x72\x22\x24\x99\
-\x4c\xd1\xdb\xdb\x23\xa7\xd2\x05\x7f\x11\x0d\x17\x91\xd2\xfd\x3e\
-\xbf\xc4\x81\xcd\xef\x6d\xe6\xe7\x35\xe7\x71\x62\xdf\x51\x3a\x2e\
-\x6b\x14\x54\xf8\x69\x89\x01\x7e\x9f\x4b\x4a\xe1\xc2\x52\x2e\xdd\
-\x4b\x36\x9f\xa3\xb7\x88\x6f\xa5\x5f\x00\x00\x0b\x7f\x49\x44\x41\
-\x54\xb7\xb7\x48\x23\x23\x21\x5c\x2e\x85\xe3\xad\x2d\x2c\x9c\x37\
-\x9f\xda\xda\x7a\x62\xb1\x38\xcf\xfc\xe5\x79\xaa\xae\xbe\x8b\x1e\
-\x57\xf9\xb0\x01\x8a\x0b\x11\x80\x25\xa8\xd3\x9e\xcd\x1b\x99\xbb\
-\x60\x3e\x79\x61\x00\x31\xf8\xa0\x28\x6c\xdf\xfc\x01\xa7\x4f\x9b\
-\x41\x20\x12\x14\x7c\x11\x53\xcc\x07\x8a\x01\x07\xa9\xd9\x38\xb8\
-\x1c\x9b\x7c\x62\x90\xde\xf6\x36\x72\xbd\xad\x5c\x34\x7b\x26\x67\
-\xcf\x9c\x44\x4d\x89\x4f\xf6\x21\x35\x3b\x4d\x3c\x9e\x62\xfb\x91\
-\xfd\x60\x76\x53\x55\x31\x8a\xa1\x58\x0c\xbb\x90\x91\xb9\x5e\x68\
-\x18\x22\x94\x7b\x7b\xfa\x19\x1a\x8a\x15\x59\xad\xbf\x44\xf2\x13\
-\x31\x79\x26\xf0\x6d\x69\x7f\x80\xde\xdd\xcd\x94\xfd\xe2\x4a\x94\
-\x95\xab\xfe\xdb\x49\x24\xa3\xb2\x0c\xce\x65\x4d\x3a\x3a\xba\x65\
-\x1e\x15\xb9\x5f\xe6\x76\xdd\x25\xd5\x61\xb7\x5b\x93\x69\x70\xb0\
-\x3f\x8a\x61\xda\xf2\x66\x41\x91\x66\xea\x2f\xa4\xa7\x6c\x32\x19\
-\x47\x97\x3b\x37\x32\x0f\x61\x45\x93\x74\x7c\xb4\x8a\x89\xa7\x4f\
-\x21\x10\x19\x85\xa9\xe8\xac\x5a\xf9\x0f\xce\x39\xfb\x1c\x42\x7e\
-\x81\xe0\x62\xb6\xd0\xc6\xad\x98\x14\x32\x69\xcc\x44\x12\x35\xde\
-\xcf\x9c\x29\x53\x98\x31\x65\x1c\xe3\x4a\xcb\x71\x89\xc9\x53\xad\
-\x18\x03\x2e\x27\x87\xe3\xb8\x49\x65\x32\xac\x5c\xb3\x8e\xaa\x71\
-\x7e\x14\x73\x80\x92\x50\x98\xca\xb2\x72\x39\xc8\x99\x4a\x24\xa4\
-\xa0\x63\x1a\x79\x12\xf1\x94\x4c\x81\x43\x43\x49\x39\x61\x2a\x66\
-\x9b\xeb\xea\xc6\x91\x4f\x65\x29\xdd\xd5\x81\xeb\x60\x1f\xe5\x3f\
-\xbb\x0a\x65\xf9\xca\x87\x1c\xc3\xcc\xc9\x69\x6b\x99\x72\x8c\xe2\
-\xb4\x88\x18\x3a\x16\xd6\x2b\x29\x09\x51\x56\x26\xe6\xf5\xc5\xcc\
-\x5d\x8a\x8a\xf2\x51\xf4\xf4\xf5\x48\x77\x13\x2e\xb6\x6e\xcf\x6e\
-\xc6\x2c\xbc\x86\x68\xd5\x34\x6c\x35\x80\x25\xab\x5f\x87\x0f\x57\
-\xad\xe4\xb9\x3b\xae\x42\x35\x0b\xc4\x13\x69\x12\xd1\x04\xe9\x94\
-\x68\xbe\x88\xf9\x48\xd1\x0d\xf2\x48\xb6\x56\x19\x09\x0a\x49\x03\
-\xbd\x20\xe8\xb4\x41\x5e\x11\x93\xe1\xc2\x17\xc4\x58\xac\xf8\xd2\
-\x49\x99\x36\x5b\x76\xee\xe6\xf5\xcd\x9b\x28\x9b\x30\x87\xc0\xe8\
-\x09\x94\xc4\x77\x31\xd1\x93\xa3\xb2\x3c\x82\x2e\xa7\x4d\x4d\x62\
-\xd1\xa8\x2c\x9f\xfd\x1e\x8f\x54\xa4\x3a\x3a\x3b\xf1\xf9\x84\x2e\
-\x10\xa0\x50\x70\x08\x47\x82\xd2\x13\x52\xef\xef\x63\xf4\x91\x28\
-\xa9\x6b\xe7\xa3\xac\x5e\xff\x84\xe4\x01\xb1\xd8\x10\x8a\xe2\x22\
-\x93\x36\x24\x81\x10\x83\x53\x42\x2a\xab\xa9\x1d\x25\x77\x3f\x9f\
-\xcd\xd2\xd7\xdf\x23\x41\x25\x93\x36\xe9\xe8\xec\xc6\xe5\xd6\xf1\
-\x87\x23\x1c\x6b\xeb\xe2\xfd\xa3\x69\xc6\x9f\xfd\x05\xdc\xa3\xc6\
-\x91\xcb\x15\xa8\xcd\x0d\xf2\xad\x0b\x66\xe2\x73\x54\x3c\x9a\x53\
-\x94\xc6\x87\x47\xe1\x8b\xbc\xd8\x42\x71\x89\xd6\x57\x91\x3f\x08\
-\x98\x15\xe3\xb2\x59\xc7\xc0\x29\x08\xd2\x95\xe3\x9f\x5b\x3f\x60\
-\xeb\xc1\x76\x6a\xce\x58\x44\x21\x5c\x8e\xea\x09\x92\x72\xf9\xe4\
-\x90\xc5\xb9\x7a\x3b\x81\x64\x13\x6e\xdd\x85\xee\x12\x18\x55\x8c\
-\x7f\xe1\xfe\xa1\x80\x38\xcd\x22\x4e\xa1\x08\xc6\xa8\x92\xce\xe4\
-\xc9\xa4\x0b\xc5\xd3\x25\xee\x00\x3b\x57\xbc\xc9\xc5\x99\x52\xea\
-\xef\xbd\x09\x65\xfb\xde\x15\x8e\x70\x75\x31\x1c\x25\x24\xb1\xae\
-\x13\x7d\x94\x95\x95\x48\x51\x44\x72\x7a\x27\x2f\x1f\xc8\x2c\xe4\
-\xf1\x07\x83\x52\x3c\x15\x9d\x18\x21\x49\x8b\x0f\x16\x63\xb4\xb1\
-\xf8\x80\x9c\xdb\xff\x78\x6f\x0b\x46\xfd\x25\x0c\x78\xbd\x04\xcd\
-\x02\x25\x46\x92\x4b\xe6\xcf\xa2\xba\xbc\x4c\xb6\xaa\x95\x61\x20\
-\x54\x8d\xac\x1c\x98\x08\x85\x83\x24\x53\x26\x87\x9a\x5b\x68\xe9\
-\xe8\xa2\xa5\xab\x87\x04\x0e\xee\x8a\x0a\xaa\xa6\xcc\xc2\xf1\x06\
-\x30\x1c\x7f\x71\x3e\x4a\x4c\xa6\xc8\xda\x54\xc5\xc9\x26\xb8\x32\
-\xdc\x47\xd8\x3c\x41\xce\x34\xe4\x9c\x81\xa6\xa9\xa4\x52\x62\x1c\
-\x06\x19\xce\xc2\x10\x42\xde\x13\xb5\xb7\x69\x09\xb1\x77\x50\x36\
-\x7f\xec\x82\xc6\xaa\xbf\xbd\xc4\xcd\xfe\xa9\x8c\xfb\xcd\x4d\x28\
-\x1b\x36\x3d\xe3\xc8\x03\x06\x9a\x50\x7c\x7a\xe8\xe9\xea\xa5\xaa\
-\xaa\x92\xf2\xf2\xb2\xe1\xd1\xd9\xd4\x70\x8c\x19\xe4\x8c\x22\x51\
-\x12\x37\x17\x67\x07\x6c\x01\x2c\x62\x7e\x57\xb1\xc8\x67\x33\x0c\
-\x25\xd3\x24\x47\x5f\x48\xef\xa8\x29\x80\x47\x30\x79\x39\x44\xa9\
-\x9b\x49\x72\xa9\x41\xb2\x29\x43\x9e\x28\x31\xcc\x2c\xc7\x76\xec\
-\x22\x14\x8a\x30\x67\xde\x5c\x7c\xb5\x55\x38\x9e\x08\x86\xe6\xc5\
-\x51\x75\x74\xd5\x85\x21\x96\xea\x28\x58\x27\xeb\x07\x65\xf8\xdc\
-\x80\x4d\x6e\xa0\x87\x2b\xab\xa2\x0c\xec\x7d\x0f\xa3\x60\xe0\x75\
-\xfb\x08\x85\x04\x6e\x85\x64\x25\x28\xd2\xb7\xd0\x38\x44\x03\x56\
-\x74\xa1\x84\xfe\x60\x5b\x1a\x5e\xb7\x97\x6c\xda\xe0\x99\xa7\x9f\
-\xe4\x07\x25\x33\xb1\xae\x5a\x84\xb2\xf7\xf0\x4a\x47\xec\x68\x26\
-\x91\x96\x24\xa7\xa5\xb5\x5d\x7e\x17\x9a\xbc\x1c\x3e\xc8\xa6\x25\
-\x18\xa6\x52\x71\xb9\xf8\xbc\xf0\x84\x80\x97\x50\xb0\x04\xcb\x76\
-\x13\x0c\x06\xc9\xa6\x53\x92\x29\xe6\x0d\x93\x17\xfe\xb9\x95\xc6\
-\x6f\x3e\x4c\x5e\x96\xd0\x2a\x9a\xea\x92\xe4\x47\xee\x8c\x28\x96\
-\x8a\xbd\x2c\x5c\x05\xd0\x2d\x93\x68\xdf\x71\xf6\xbc\xb1\x9e\x69\
-\x63\x47\x61\x38\x50\x37\x77\x16\x44\xca\x30\x04\xf3\xd4\x3c\xc5\
-\xa9\x70\x43\x0c\x63\x38\x14\x5c\x8a\xa4\xbf\xfd\xc7\x0e\xb2\x24\
-\xd0\x4d\xb5\x6a\xc8\x46\xb4\xed\x98\xf4\x76\xf7\x48\x6f\x2c\xaf\
-\x28\x93\x18\x26\x6a\xa8\xee\x9e\x76\xe9\x15\x95\x55\xd5\xf2\xf9\
-\x3c\x7a\x88\xc1\xa1\x6e\x36\x6e\x7c\x97\x2b\x8c\x3a\x22\x57\x9f\
-\x8b\xb2\x63\xff\x72\x47\xf0\x7f\x5d\x71\x11\x8f\xc5\x24\x0f\x10\
-\xc2\x48\x38\xe2\x97\xbd\x3f\x23\x9f\xe5\xe0\x41\x31\x73\xd3\x45\
-\x79\x69\x09\x81\x60\x98\xc6\x09\x8d\x52\x3f\x30\x4c\x47\x5a\xbb\
-\xa5\xb5\x55\x82\xa8\xdb\xed\xe5\xcd\x0d\x5b\x98\xf2\xad\xfb\x19\
-\xd0\x2a\xd0\x44\x8e\x1f\x5e\xfc\x48\x9e\x17\x45\x93\x70\x63\x57\
-\x36\xce\xc1\x77\x36\x30\xcf\xab\x72\xe3\xe7\xce\xa3\xd6\xd2\xc9\
-\x19\x59\xa2\xd9\x34\xad\x7d\xfd\xb4\x0c\xf4\x73\x74\xa0\x93\xa4\
-\xe1\x90\xcc\x19\x64\xdc\x36\x89\xbc\x49\x7b\xdf\x00\x67\x4f\x6f\
-\x60\xc6\xc4\x00\xe3\xca\x7d\xa4\x12\x49\x99\xee\x84\xfc\x25\xd8\
-\x6a\xde\xc8\x12\x09\xfb\xe5\xf9\x26\x31\x71\x22\x3c\x40\x54\xa7\
-\x9d\xdd\x3d\x74\x77\xf4\xca\xf7\x9c\xe8\xe9\xa4\x76\x4f\x92\x09\
-\xd7\x2e\x45\x59\xb3\xe1\xa9\x43\xc9\x44\x72\xb2\xe8\xde\x8a\x18\
-\x09\x87\x02\xd2\x00\x92\xd2\x6a\x2a\xd9\x5c\x52\xea\x85\xb1\x98\
-\x48\x95\x1a\x91\x50\x98\x71\xe3\x46\x0f\x77\x86\x45\x51\x23\x26\
-\xcc\xb3\x74\x77\xf5\xcb\x35\x76\xf6\x0e\xf0\x5e\x87\x43\xf9\xe7\
-\x6f\x47\xd3\xdd\x27\x0d\x20\x36\xde\x63\xd9\xc4\x3b\x9a\xe9\xfa\
-\x68\x2b\xcb\xa6\x4c\xe0\xb2\x89\xa7\x51\x6e\x99\x72\xc4\x4d\x9c\
-\x1b\x18\x29\x7d\x45\x9f\x5f\xd4\x20\x9f\xbd\x44\x9a\xfd\xe9\x1f\
-\xfe\x93\xb3\xbe\x7c\x3e\xfd\x76\x0c\x2d\x9f\x94\x1b\x22\xf0\xc4\
-\x2a\xe4\x71\xbb\xbc\xe4\xf2\x69\x6a\x6a\x46\x51\x52\xe2\x93\xa7\
-\x5e\x84\xd4\x97\x17\x19\x4b\x15\xb2\xa3\x5d\x7c\x6e\x45\x61\x60\
-\xfd\x7e\xc6\x2e\x9e\xfb\x91\xb2\xe2\x1f\x0f\xbd\x9c\xcd\xe6\xae\
-\x11\x6e\x23\xe4\x6b\x61\x00\x51\x03\x08\xaf\x10\xb1\x2e\xd0\xd4\
-\xb2\x04\x1f\x28\x2a\xc6\xa3\xc7\x54\x11\x70\x29\x44\xc2\x61\xe9\
-\x8e\x1e\xbf\x9f\x58\x2c\x21\x87\x91\xc4\x81\xab\x64\x36\xce\x2b\
-\x6b\x77\x30\xf9\x86\x7b\x48\x68\x55\xf8\x54\x37\xe9\xa1\x56\x3a\
-\x3e\xda\x43\xbd\x93\xe5\xab\x67\xcf\x61\x22\x21\x09\x69\xb2\xe0\
-\x91\xf4\x59\x08\xa6\xa2\xf6\x28\x9c\x1c\x88\x1e\x99\x03\x1e\xa9\
-\x2f\x44\x96\x10\xa1\xf9\xcb\x87\xef\xe1\xcc\xeb\x17\x33\x94\xcf\
-\xe1\xc6\xa1\x44\x56\xb1\x50\xdf\x30\x4a\x9e\x1b\x10\xef\xf1\xfb\
-\xbd\x72\xfa\x54\xce\x0b\x1b\x06\x9d\x1d\x7d\xb8\x74\x9f\x14\x79\
-\x25\xcd\x56\xe0\xcd\x27\x5f\xe6\xc6\x1f\x7e\xef\x4f\xca\x2b\xaf\
-\x3d\xf0\x53\xdb\xe1\x3e\x59\x0a\x9b\x86\x4c\x73\xe5\x65\xe5\x58\
-\xc3\x8b\x4f\xa6\x84\xa6\x2e\x2a\x42\x97\x14\x37\x3d\xde\x02\x66\
-\x2e\x2b\x8f\xad\x65\x0d\x71\xd4\xcd\xc6\xe7\x09\x53\x12\x29\x97\
-\x73\x05\x83\xb1\x21\x36\xed\x3a\x84\x1d\x69\x64\x68\xc8\x61\x7e\
-\xed\x14\x96\xcd\x9d\x47\x83\x37\x80\x2e\x62\x7f\xa4\x59\x78\x92\
-\xfb\x8a\x09\x71\x5d\xf6\x16\xcb\x2a\xfc\x78\x3d\xe1\x4f\xa6\x4b\
-\x4f\x71\x01\x47\xb5\x39\xd4\x72\x90\x8e\x42\x37\x85\x4a\xd0\x3d\
-\x6e\xa9\x60\x15\xa7\xda\x83\xf2\x90\x57\x26\x9b\x94\x38\x35\x6d\
-\xfa\x44\x11\x64\xd2\xfd\x05\x28\x0a\xb5\x5b\xd0\x77\x71\xe6\x41\
-\x9c\x7a\x11\x38\xf1\xfb\x5f\xfd\x86\x1f\xfd\xe4\x27\xb7\x28\xe2\
-\x94\x68\xef\x50\xdf\xd1\xc1\xa1\xc1\x32\x21\x1f\x07\xfc\x01\x09\
-\x80\xc2\x75\x62\xd1\x18\xfe\x40\x40\x12\x09\xc3\xc8\xa0\xaa\x79\
-\xca\x2b\x4a\xe4\x69\x12\x71\x45\x07\x06\x25\x3b\xd4\x75\x31\xca\
-\xee\x45\x51\x75\xd2\x99\x0c\x13\xa6\x4c\x91\xd6\x7f\xeb\x95\xb7\
-\xf9\xc9\xa5\xb7\x50\x22\x5a\xea\xb2\xc6\x1f\x1e\x7e\x1e\x39\x2d\
-\x36\x8c\xf0\xbb\x8f\x7c\xc8\x7f\x3f\xf5\x34\xff\xf9\x1f\xf7\x11\
-\x71\x05\x8b\x13\x62\x8e\xa7\xb8\x5b\xe2\x80\x83\x6a\xb3\xfb\xe0\
-\x5e\x8e\x25\x4f\x50\x32\xbd\x92\xca\x2a\xd1\x39\x12\xa1\x63\x4b\
-\xc0\xf3\x78\x5c\x92\x6c\x1d\x3d\x7a\x4c\x2a\x57\x22\x94\xc4\xce\
-\x0b\x2f\x12\x8c\xb6\x34\x52\x81\x55\x70\x08\x86\x7c\x52\x22\x13\
-\x65\xe5\xa4\xc6\x86\xa1\x6c\xca\x98\x28\xcb\xb7\xfd\x87\xd7\x5c\
-\xdb\xd2\xda\xfa\x92\xb8\xa1\xc0\x01\x21\x27\x89\x9b\x74\x76\x76\
-\xe2\x0f\x86\x29\x98\x05\x92\xf1\x21\x59\xe7\x5f\xb8\xe4\x42\x39\
-\x07\x20\x2e\xdb\x72\x48\x24\xe3\xec\xdc\xbd\x4d\xce\x16\xd4\xd6\
-\x8e\x29\x0a\x0f\x6e\x8d\xf2\xca\x0a\x59\x60\xad\x5f\xbe\x81\x5b\
-\xbf\xf0\x23\x7c\x05\x2f\x42\xaf\x2a\x4e\x89\x14\x47\xdf\x44\xbf\
-\xa0\xa5\xe3\x10\x2b\x77\xaf\xe5\xec\x0b\x2e\x60\xe7\xee\x9d\xb4\
-\x37\xb5\x71\xee\xc2\x73\x39\x6f\xfa\x99\xa8\x4e\x81\x9e\xfe\x38\
-\x87\x7a\x5a\x09\x97\x94\xf1\x6e\xd3\x16\x2e\xf9\xe2\x85\x38\x08\
-\xb9\x5e\x74\xa9\xa0\xaa\x52\x9c\x6f\x2c\xc8\xce\xd6\x9e\xdd\x07\
-\x24\x19\x12\x87\x29\x85\x67\x8a\xb6\x7f\x30\x24\x8e\xd4\xe5\xa4\
-\x27\x44\x22\x65\xb2\xdf\xd1\xdd\xd3\xc1\x98\x9a\xea\xaf\x9c\xb5\
-\xf0\xfa\x97\x4f\x4e\xe6\xae\x59\xff\xd4\x4a\x55\x55\x2f\x17\x2e\
-\x14\x4f\xc4\x29\x2b\x2d\x93\xd5\xa1\x50\x85\xc5\x61\x8a\x54\x2c\
-\x89\x63\x19\x34\x4e\x9a\xcc\xcc\x99\x33\x25\x19\x6a\x6e\x6e\x66\
-\x60\xa0\x5f\x76\x7e\x04\x70\x96\x95\x94\x4a\xc3\x88\xfa\x5b\xa4\
-\x3a\x31\x8e\x36\x34\x38\xc0\xeb\x2f\xaf\xe3\xca\x45\x97\xe3\x73\
-\x07\x58\x30\x63\x36\xf1\x58\x82\x35\x9b\xd6\x92\xb0\xb2\x78\x4a\
-\x75\x6a\x27\x8f\xa3\xac\x32\x84\xcb\xef\x22\x12\x08\xb1\x77\xe7\
-\x41\xf6\x6c\xda\x49\x6d\x65\x1d\x37\x7c\xff\x16\x14\xb7\x87\xa3\
-\x87\x9b\x59\xb7\xf1\x2d\xa6\x4e\x9b\x48\x59\x99\x0f\x7f\x40\x08\
-\x9f\xe2\x88\x9c\x8a\xc7\x2b\x4e\xac\xe6\x69\x6a\x3a\x2a\xa7\xde\
-\x05\x66\x09\xee\x2f\x52\xb7\xa8\x07\x84\x37\x08\xf4\xf7\x7a\x3d\
-\xb8\x3d\x6e\x21\xea\xfc\xfd\xac\x79\xd7\x5e\x2b\xf1\x65\x24\xcc\
-\x5e\x79\xe5\x0f\xa3\xab\x6a\x6b\xf6\xf6\xf5\xf7\x97\x89\x41\xa9\
-\xea\xea\x4a\x59\xf3\x8b\x7e\x9c\xc0\x05\xbf\xee\x92\xca\x50\x3a\
-\x95\xc2\x1b\x0c\x4a\x84\xf5\xf9\x03\x84\x23\xe1\xa2\x75\xc3\xa2\
-\x8d\x56\x2e\x41\x48\xaa\x07\x56\x81\xa3\x47\x8e\xc9\x07\x58\xf7\
-\xf6\x26\x1e\x7d\xe4\xcf\x3c\xf6\xc8\xe3\x5c\xf7\x95\xab\x29\x0d\
-\x47\x78\xe8\xb1\x3f\x30\x7a\xec\x68\xf2\x85\x8c\xe4\xf1\x9a\x66\
-\x30\x69\xea\x64\xa9\x3c\x27\xe2\x19\x8e\x1c\x6b\xa5\xfd\x78\x17\
-\x9f\xbb\x68\x29\x8b\xcf\xbb\x90\x87\x1f\x7a\x8c\xf1\x0d\xe3\x08\
-\xf8\xc4\x81\x4d\x93\x82\x93\x23\x93\x49\x17\x8f\xea\x96\x95\x14\
-\xa7\x48\x7c\xa5\x04\x03\x61\xe9\xf6\xe2\x3a\xd8\xb4\xa7\xd8\xd3\
-\x74\x1c\x19\xd6\xa6\x91\xa5\xac\x34\x32\xe4\x14\x32\x13\xa7\x4f\
-\xbf\x5a\x1e\xa4\xfe\xf4\xf9\x14\x60\xf9\xca\xff\xfa\x8e\xdb\xad\
-\x3f\xe0\x38\x4e\x50\xb8\x6b\x34\x1e\x23\x14\x0c\xe2\xd3\x5d\x32\
-\xde\x3d\x5e\x2f\x65\xe5\x95\xc4\x13\x51\xf9\xb3\x48\x2b\xe2\x43\
-\xe4\xec\x6e\x20\x80\xee\x76\x49\x37\x94\x99\x61\xb8\xa9\xf9\xc1\
-\x07\x3b\x79\xe0\xfe\xc7\x78\xf0\x81\x87\xf8\xc1\xed\x3f\x62\xa8\
-\xaf\x8f\x27\xff\xf2\x24\xde\x90\x4f\x8e\xb4\x67\x92\x51\x5c\xaa\
-\x68\xcf\xc5\x89\xc7\x63\x92\x5b\x14\xb3\x80\x42\x3a\x95\xe3\xfc\
-\x25\x4b\x58\xb4\xe8\x1c\x9e\x78\xfc\x31\x66\xcf\x9a\x41\x24\x1c\
-\x24\x67\x44\xa5\x76\x19\x1d\x1c\x94\x0b\x14\xc3\xde\x13\x1a\xa7\
-\x11\x0a\x89\xac\x20\xc6\xe8\x2c\x06\x87\xfa\xf8\xf8\xe3\xad\x92\
-\xb1\x8e\x1d\x3b\x26\x16\x0a\xb8\x6f\x3f\x73\xfe\x57\xfe\x72\x6a\
-\x7a\xfd\x1f\x06\x10\x7f\x7c\xf3\xcd\x3f\xf9\x55\x9f\x7a\x96\x86\
-\x7a\x4e\xa4\x24\x72\x4e\x7b\xc7\x89\x05\xfe\x80\xdf\x97\x4f\x67\
-\x18\x8c\x45\xa9\xaf\xaf\xc3\xe7\xf5\xca\xc3\xcb\x45\x5a\x2c\x8a\
-\x91\xe1\x7e\x80\x6d\xcb\xd0\x11\xbf\x0a\xe4\x15\xe9\xa7\xab\xbb\
-\x93\xcb\x97\xfd\x1b\xab\x56\xad\xe6\xea\x6b\xae\xe7\x07\xdf\xbb\
-\x05\x5b\xb7\x11\x93\x60\xe2\x7f\x05\x77\x0f\xfa\xbc\xc5\x0e\x70\
-\x2e\x87\x4f\x84\x82\xf0\x3a\xbf\x5f\x7a\x55\x65\x65\x05\xe9\x4c\
-\x92\x86\xfa\x46\x4a\x4b\x23\x52\x97\x1c\x8a\xf6\x49\x94\x17\x69\
-\x5a\xd3\x15\x46\x55\x8d\x96\x3a\x86\x38\xd5\x2e\x32\x96\xe3\x38\
-\xe9\x5c\x3e\xbf\xb5\xb7\xa7\xef\x83\x74\x3c\xb3\x29\x99\x1c\xfc\
-\xf0\x3b\xdf\xf9\x55\xf1\x1c\xd0\x29\xd7\xff\x05\xed\xfc\xf2\x67\
-\x50\xd8\x3b\xac\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-"
-
-qt_resource_name = b"\
-\x00\x0c\
-\x0b\x27\xd2\x7f\
-\x00\x74\
-\x00\x6f\x00\x75\x00\x78\x00\x69\x00\x61\x00\x6e\x00\x67\x00\x2e\x00\x69\x00\x63\x00\x6f\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x95\xd6\xfa\xdd\x04\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
+"""图标资源的按需加载
+
+资源不再以字节字面量的形式嵌在 Python 模块里，而是放在同目录的二进制
+资源文件 PopupClock.rcc 中。第一次需要图标时（创建托盘图标）才注册，
+Qt 会直接内存映射这个文件，Python 侧不保留任何数据副本。
+
+修改 PopupClock.qrc 后重新生成：
+
+    rcc -binary PopupClock.qrc -o PopupClock.rcc
+"""
+import os
+import sys
+
+from PyQt5.QtCore import QFile, QResource
+from PyQt5.QtGui import QIcon
+
+RCC_NAME = "PopupClock.rcc"
+
+_registered_path = None
+
+
+def resource_dirs():
+    """资源文件的查找目录：PyInstaller 解包目录优先，其次是本模块所在目录"""
+    dirs = []
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir:
+        dirs.append(bundle_dir)
+    dirs.append(os.path.dirname(os.path.abspath(__file__)))
+    return dirs
+
+
+def ensure_resources():
+    """首次调用时注册资源，之后直接返回；找不到资源文件时返回 False"""
+    global _registered_path
+    if _registered_path is not None:
+        return True
+    for directory in resource_dirs():
+        path = os.path.join(directory, RCC_NAME)
+        if os.path.exists(path) and QResource.registerResource(path):
+            _registered_path = path
+            return True
+    return False
+
+
+def release_resources():
+    global _registered_path
+    if _registered_path is not None:
+        QResource.unregisterResource(_registered_path)
+        _registered_path = None
+
+
+def icon(path):
+    """按资源路径（如 ":/touxiang.ico"）取图标，资源不可用时退回到磁盘上的同名文件"""
+    ensure_resources()
+    if QFile.exists(path):
+        return QIcon(path)
+    name = path.split('/')[-1]
+    for directory in resource_dirs():
+        candidate = os.path.join(directory, name)
+        if os.path.exists(candidate):
+            return QIcon(candidate)
+    return QIcon(path)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""调试模式下的性能计数
+
+绘制和节拍这几条热路径上只放一个判断：
+
+    if PERF.enabled:
+        ...
+
+关闭时（默认）不计时、不计数，代价只有一次属性读取。打开后每次绘制记下耗时，
+每次节拍定时器醒来计一次数；snapshot() 按两次调用之间的间隔折算出每秒次数，
+给调试模式的 HUD 每秒读一次。
+"""
+import ctypes
+import os
+import sys
+from collections import deque
+
+from display_latency import percentile
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块
+    resource = None
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    """Windows 的 PROCESS_MEMORY_COUNTERS"""
+    _fields_ = [('cb', ctypes.c_ulong), ('PageFaultCount', ctypes.c_ulong)] + [
+        (name, ctypes.c_size_t) for name in (
+            'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage',
+            'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+
+
+def windows_rss_kb():
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    # 伪句柄 -1，按指针宽度传，64 位下不能截成 int
+    process = ctypes.c_void_p(-1)
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.WorkingSetSize // 1024
+
+
+def rss_kb():
+    """当前常驻内存（KB）：Linux 读 /proc，Windows 取工作集，macOS 等退回峰值；都取不到时为 None"""
+    if sys.platform == 'win32':
+        return windows_rss_kb()
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class PerfCounters:
+    """按名字累计绘制次数和耗时，另计节拍唤醒次数"""
+
+    def __init__(self, history=120):
+        self.enabled = False
+        self.history = history
+        self.paints = {}  # 名字 -> [累计次数, 最近耗时（毫秒）的 deque]
+        self.wakeups = 0
+        self.last_snapshot = None  # (时刻, 绘制总数, 唤醒数)
+
+    def paint(self, name, seconds):
+        entry = self.paints.get(name)
+        if entry is None:
+            entry = self.paints[name] = [0, deque(maxlen=self.history)]
+        entry[0] += 1
+        entry[1].append(seconds * 1000.0)
+
+    def wakeup(self):
+        self.wakeups += 1
+
+    def reset(self):
+        self.paints.clear()
+        self.wakeups = 0
+        self.last_snapshot = None
+
+    def snapshot(self, now):
+        """now 为单调时钟（秒）；返回每秒绘制/唤醒次数和各部件最近一次、p95 的绘制耗时
+
+        第一次调用没有可比的上一次，速率为 None。
+        """
+        paints = sum(entry[0] for entry in self.paints.values())
+        rates = {'paints_per_s': None, 'wakeups_per_s': None}
+        if self.last_snapshot is not None:
+            then, last_paints, last_wakeups = self.last_snapshot
+            elapsed = now - then
+            if elapsed > 0:
+                rates = {'paints_per_s': (paints - last_paints) / elapsed,
+                         'wakeups_per_s': (self.wakeups - last_wakeups) / elapsed}
+        self.last_snapshot = (now, paints, self.wakeups)
+        rates['paint_ms'] = {name: (entry[1][-1], percentile(entry[1], 95))
+                             for name, entry in self.paints.items() if entry[1]}
+        return rates
+
+
+PERF = PerfCounters()
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""弹窗时间规则
+
+规则描述"在哪些时刻弹出"，写法类似 cron，字段依次为 秒 分 时 周：
+
+    0 0,30 * *            每个整点和半点
+    0 0 9-18 1-5          工作日 9 点到 18 点的整点
+    0 * 0-6 * suppress lead=0 trail=60
+                          每天 0 点到 7 点不弹出
+
+每个字段支持 *、a、a,b、a-b、*/n、a-b/n；周为 1-7（周一到周日，0 也表示周日），
+周的范围可以绕过周末，如 5-1 为周五到周一。
+规则命中的时刻 T 对应一个弹窗时段 [T - lead, T + trail)，默认前后各 30 秒，
+与原来 xx:59:30-xx:00:30、xx:29:30-xx:30:30 的弹窗时段一致。suppress 规则的
+时段从弹窗时段中扣除。
+
+所有规则编译成一周内按时间排序的边界表，查询"某时刻是否在弹窗时段内"、
+"下一个显示/隐藏边界在哪"都是一次二分查找，与规则数量无关。
+"""
+from bisect import bisect_right
+
+DAY = 24 * 60 * 60
+WEEK = 7 * DAY
+
+DEFAULT_LEAD = 30
+DEFAULT_TRAIL = 30
+# 与原有硬编码的弹窗时段相同
+DEFAULT_RULES = ("0 0,30 * *",)
+
+# 字段名、取值范围
+FIELDS = (('second', 0, 59), ('minute', 0, 59), ('hour', 0, 23), ('week', 1, 7))
+
+
+def week_seconds(day_of_week, hour, minute, second):
+    """一周内的秒数，周一 00:00:00 为 0；day_of_week 与 Qt 一致（1=周一 … 7=周日）"""
+    return (day_of_week - 1) * DAY + hour * 3600 + minute * 60 + second
+
+
+def parse_field(text, low, high, name):
+    """把一个 cron 字段展开成排好序的取值元组"""
+    values = set()
+    for part in str(text).replace(' ', '').split(','):
+        if not part:
+            raise ValueError("字段 %s 为空" % name)
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError("字段 %s 的步长必须大于 0" % name)
+        if part == '*':
+            start, stop = low, high
+        elif '-' in part:
+            start_text, stop_text = part.split('-', 1)
+            start, stop = int(start_text), int(stop_text)
+        else:
+            start = stop = int(part)
+        first = 0 if name == 'week' else low
+        if not (first <= start <= high and first <= stop <= high):
+            raise ValueError("字段 %s 的取值 %r 超出范围 %d-%d" % (name, part, first, high))
+        if name == 'week':
+            # 0 和 7 都表示周日；结束早于开始的范围绕过周末（5-1 为周五到周一，0-6 为整周）
+            start, stop = start or 7, stop or 7
+            days = list(range(start, 8)) + list(range(1, stop + 1)) if start > stop else range(start, stop + 1)
+            values.update(days[::step])
+            continue
+        if start > stop:
+            raise ValueError("字段 %s 的范围 %r 开始大于结束" % (name, part))
+        values.update(range(start, stop + 1, step))
+    return tuple(sorted(values))
+
+
+class ScheduleRule:
+    """一条已解析的规则"""
+
+    __slots__ = ('second', 'minute', 'hour', 'week', 'action', 'lead', 'trail')
+
+    def __init__(self, second='0', minute='0,30', hour='*', week='*', action='show',
+                 lead=DEFAULT_LEAD, trail=DEFAULT_TRAIL):
+        if action not in ('show', 'suppress'):
+            raise ValueError("未知的规则类型 %r" % (action,))
+        if lead < 0 or trail < 0 or lead + trail <= 0:
+            raise ValueError("弹窗时段长度必须大于 0")
+        fields = dict(zip(('second', 'minute', 'hour', 'week'), (second, minute, hour, week)))
+        for name, low, high in FIELDS:
+            setattr(self, name, parse_field(fields[name], low, high, name))
+        self.action = action
+        self.lead = int(lead)
+        self.trail = int(trail)
+
+    def instants(self):
+        """规则在一周内命中的所有时刻（周秒数）"""
+        day_offsets = [(week - 1) * DAY + hour * 3600 for week in self.week for hour in self.hour]
+        minute_offsets = [minute * 60 + second for minute in self.minute for second in self.second]
+        return [day + offset for day in day_offsets for offset in minute_offsets]
+
+    def intervals(self):
+        lead, trail = self.lead, self.trail
+        return [(instant - lead, instant + trail) for instant in self.instants()]
+
+
+def parse_rule(rule):
+    """接受 ScheduleRule、字典或 cron 风格的字符串"""
+    if isinstance(rule, ScheduleRule):
+        return rule
+    if isinstance(rule, dict):
+        return ScheduleRule(**rule)
+    parts = str(rule).split()
+    fields = [part for part in parts if '=' not in part and part not in ('show', 'suppress')]
+    if len(fields) != 4:
+        raise ValueError("规则 %r 需要 秒 分 时 周 四个字段" % (rule,))
+    options = {'action': 'suppress' if 'suppress' in parts else 'show'}
+    for part in parts:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            if key not in ('lead', 'trail'):
+                raise ValueError("规则 %r 中未知的选项 %r" % (rule, key))
+            options[key] = int(value)
+    return ScheduleRule(*fields, **options)
+
+
+def rules_from_settings(settings):
+    """从设置中取出规则：优先 schedule_rules 列表，其次设置窗口里的 秒/分/时/周 字段"""
+    rules = settings.get('schedule_rules')
+    if rules:
+        return [parse_rule(rule) for rule in rules]
+    fields = [settings.get('time_' + name, '').strip() for name in ('second', 'minute', 'hour', 'week')]
+    if not any(fields):
+        return [parse_rule(rule) for rule in DEFAULT_RULES]
+    # 没填的字段沿用默认规则
+    second, minute, hour, week = fields
+    return [ScheduleRule(second or '0', minute or '0,30', hour or '*', week or '*')]
+
+
+def merge_intervals(intervals):
+    """把一周内的区间（可能跨越周边界）合并成排好序、互不重叠的区间"""
+    wrapped = []
+    for start, end in intervals:
+        length = end - start
+        if length >= WEEK:
+            return [(0, WEEK)]
+        start %= WEEK
+        end = start + length
+        if end > WEEK:
+            wrapped.append((start, WEEK))
+            wrapped.append((0, end - WEEK))
+        else:
+            wrapped.append((start, end))
+    wrapped.sort()
+    merged = []
+    for start, end in wrapped:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def subtract_intervals(intervals, removed):
+    """有序区间相减，两边都已合并"""
+    result = []
+    index = 0
+    for start, end in intervals:
+        while index < len(removed) and removed[index][1] <= start:
+            index += 1
+        cursor = start
+        probe = index
+        while probe < len(removed) and removed[probe][0] < end:
+            cut_start, cut_end = removed[probe]
+            if cut_start > cursor:
+                result.append((cursor, cut_start))
+            cursor = max(cursor, cut_end)
+            probe += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+class PopupSchedule:
+    """编译后的弹窗时段索引
+
+    edges 是扁平的边界表 [开始0, 结束0, 开始1, 结束1, ...]，偶数下标是显示边界，
+    奇数下标是隐藏边界。跨越周日 24:00 的时段在表里拆成两段，查询时把
+    周边界上的这对假边界跳过。
+    """
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = [parse_rule(rule) for rule in rules]
+        shows = merge_intervals(interval for rule in self.rules if rule.action == 'show'
+                                for interval in rule.intervals())
+        suppressed = merge_intervals(interval for rule in self.rules if rule.action == 'suppress'
+                                     for interval in rule.intervals())
+        self.intervals = subtract_intervals(shows, suppressed)
+        self.edges = [edge for interval in self.intervals for edge in interval]
+        self.always = self.intervals == [(0, WEEK)]
+        # 首尾两段在周边界相接，实际上是同一个时段
+        self.wraps = (not self.always and len(self.intervals) > 1
+                      and self.edges[0] == 0 and self.edges[-1] == WEEK)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def contains(self, t):
+        """周秒数 t 是否处于弹窗时段内"""
+        return bisect_right(self.edges, t % WEEK) % 2 == 1
+
+    def window_end(self, t):
+        """t 所在弹窗时段的结束时刻（周秒数，可能大于 WEEK），不在时段内时返回 None"""
+        t %= WEEK
+        index = bisect_right(self.edges, t)
+        if index % 2 == 0:
+            return None
+        end = self.edges[index]
+        if self.wraps and end == WEEK:
+            end = WEEK + self.edges[1]
+        return end
+
+    def next_edge(self, t, kind=None):
+        """t 之后（不含 t）的下一个边界，返回 (距离秒数, 'show' 或 'hide')
+
+        kind 指定只找显示或隐藏边界；没有任何时段（或全天都在时段内）时返回 None。
+        """
+        if not self.edges or self.always:
+            return None
+        t %= WEEK
+        edges = self.edges
+        count = len(edges)
+        index = bisect_right(edges, t)
+        # 最多绕一圈；跳过周边界上的假边界和类型不符的边界
+        for step in range(count + 2):
+            position = (index + step) % count
+            edge = edges[position] + WEEK * ((index + step) // count)
+            if self.wraps and edges[position] in (0, WEEK) and position in (0, count - 1):
+                continue
+            edge_kind = 'show' if position % 2 == 0 else 'hide'
+            if kind is not None and edge_kind != kind:
+                continue
+            return edge - t, edge_kind
+        return None
+
+    def crossed(self, previous, t):
+        """(previous, t] 之间是否跨过了任何边界；t 小于 previous 时视为跨过了周边界"""
+        if not self.edges or self.always:
+            return False
+        previous %= WEEK
+        t %= WEEK
+        low = bisect_right(self.edges, previous)
+        high = bisect_right(self.edges, t)
+        if t >= previous:
+            return high != low
+        # 绕过周边界：分成 (previous, 周末] 和 [周初, t] 两段，周边界上的假边界不算
+        count = (len(self.edges) - low) + high
+        if self.wraps:
+            count -= 2
+        return count > 0
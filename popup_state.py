@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""弹窗的显示状态机
+
+四个状态，转换在这里一次性定义：
+
+    hidden --show--> entering --完成--> shown --hide--> exiting --完成--> hidden
+
+调用方只提出意图（show / hide / pin / unpin），不直接改状态。处于 hidden 或
+shown 时意图立即生效；过渡进行中到达的意图排队，只保留最后一个（先 hide 再
+show 相互抵消），等这次过渡结束后再处理，不会被丢掉，也不需要定时重试。
+pin 之后 hide 一律忽略，直到 unpin。
+
+过渡的开始和结束由窗口负责：进入 entering/exiting 时窗口启动对应的动画组，
+动画组停止（播完或被中途停止）时调用 transition_done()。每次状态变化发出
+state_changed(旧状态, 新状态) 和 state_left(旧状态, 停留秒数)，各状态累计的
+停留时间见 summary()。
+"""
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+HIDDEN = 'hidden'
+ENTERING = 'entering'
+SHOWN = 'shown'
+EXITING = 'exiting'
+STATES = (HIDDEN, ENTERING, SHOWN, EXITING)
+# 没有过渡在进行的状态，意图在这两个状态下立即生效
+SETTLED = (HIDDEN, SHOWN)
+
+SHOW = 'show'
+HIDE = 'hide'
+PIN = 'pin'
+UNPIN = 'unpin'
+INTENTS = (SHOW, HIDE, PIN, UNPIN)
+
+# (状态, 意图或 'done') -> 新状态
+TRANSITIONS = {
+    (HIDDEN, SHOW): ENTERING,
+    (ENTERING, 'done'): SHOWN,
+    (SHOWN, HIDE): EXITING,
+    (EXITING, 'done'): HIDDEN,
+}
+# 过渡状态对应的动画组名（TransitionMeter / on_transition_state 里的 name）
+TRANSITION_GROUPS = {ENTERING: 'enter', EXITING: 'exit'}
+# 兼容原来的 anim_state 整数：0 隐藏 1 显示 2 动画中
+ANIM_STATES = {HIDDEN: 0, SHOWN: 1, ENTERING: 2, EXITING: 2}
+STATE_NAMES = {HIDDEN: "隐藏", ENTERING: "进入", SHOWN: "显示", EXITING: "退出"}
+
+
+class PopupStateMachine(QObject):
+    """hidden / entering / shown / exiting 四态，意图排队合并"""
+    state_changed = pyqtSignal(str, str)  # 旧状态, 新状态
+    state_left = pyqtSignal(str, float)  # 离开的状态, 在其中停留的秒数
+
+    def __init__(self, clock=time.perf_counter, parent=None):
+        super().__init__(parent)
+        self.clock = clock  # 单调时钟（秒）
+        self.state = HIDDEN
+        self.pending = None  # 过渡中到达的最后一个 show/hide
+        self.pinned = False
+        self.closed = False  # close() 之后不再显示
+        self.entered_at = clock()
+        self.time_in_state = dict.fromkeys(STATES, 0.0)
+        self.stats = {'transitions': 0, 'queued': 0, 'coalesced': 0, 'ignored': 0}
+
+    @property
+    def anim_state(self):
+        return ANIM_STATES[self.state]
+
+    def request(self, intent):
+        """提出意图；过渡进行中时排队（只保留最后一个）"""
+        if intent not in INTENTS:
+            raise ValueError("未知的意图 %r" % (intent,))
+        if intent == PIN:
+            self.pinned = True
+            intent = SHOW
+        elif intent == UNPIN:
+            self.pinned = False
+            return
+        if (intent == SHOW and self.closed) or (intent == HIDE and self.pinned):
+            self.stats['ignored'] += 1
+            return
+        if self.state not in SETTLED:
+            self.stats['coalesced' if self.pending is not None else 'queued'] += 1
+            self.pending = intent
+            return
+        target = TRANSITIONS.get((self.state, intent))
+        if target is None:
+            return  # 已经处于该意图要求的状态
+        self.move_to(target)
+
+    def transition_done(self, group):
+        """名为 group 的动画组停止了；与当前过渡不符时（例如重建动画组时停掉的旧组）忽略"""
+        if TRANSITION_GROUPS.get(self.state) != group:
+            return
+        # 先取出排队的意图：状态变化的回调里可能又提出新的意图
+        pending, self.pending = self.pending, None
+        self.move_to(TRANSITIONS[(self.state, 'done')])
+        if pending is not None:
+            self.request(pending)
+
+    def close(self):
+        """退出前：取消固定，收起，此后不再显示"""
+        self.closed = True
+        self.pinned = False
+        self.request(HIDE)
+
+    def force(self, state):
+        """直接设为某个状态，不经过过渡（基准测试等构造特定场景时使用）"""
+        if state not in STATES:
+            raise ValueError("未知的状态 %r" % (state,))
+        self.pending = None
+        if state != self.state:
+            self.move_to(state)
+
+    def move_to(self, state):
+        old = self.state
+        now = self.clock()
+        spent = now - self.entered_at
+        self.time_in_state[old] += spent
+        self.entered_at = now
+        self.state = state
+        self.stats['transitions'] += 1
+        self.state_left.emit(old, spent)
+        self.state_changed.emit(old, state)
+
+    def summary(self):
+        """各状态累计停留的秒数（含当前状态到此刻为止）和意图统计"""
+        times = dict(self.time_in_state)
+        times[self.state] += self.clock() - self.entered_at
+        return {'state': self.state, 'seconds': times, 'stats': dict(self.stats)}
+
+    def report_text(self):
+        summary = self.summary()
+        seconds = summary['seconds']
+        return ("状态停留：" + "，".join("%s %.1f s" % (STATE_NAMES[state], seconds[state]) for state in STATES)
+                + "；转换 %(transitions)d 次，排队 %(queued)d，合并 %(coalesced)d，忽略 %(ignored)d" % self.stats)
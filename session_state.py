@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""会话状态：锁屏、空闲时暂停时钟
+
+提供者只负责报告当前会话处于 active / locked / idle 中的哪一种，
+并在变化时发出 state_changed。可用的提供者：
+
+    logind  Linux 下通过 D-Bus 监听 systemd-logind 的 Lock/Unlock 信号以及
+            LockedHint/IdleHint 属性（需要 PyQt5.QtDBus 和系统总线）
+    fake    只能手动切换状态，用于测试和基准
+    none    永远处于 active
+
+用环境变量 POPUPCLOCK_SESSION_PROVIDER 指定，默认在 Linux 上尝试 logind，
+不可用时退回 none。
+"""
+import os
+import platform
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+ACTIVE = 'active'
+LOCKED = 'locked'
+IDLE = 'idle'
+STATES = (ACTIVE, LOCKED, IDLE)
+
+PROVIDER_ENV = "POPUPCLOCK_SESSION_PROVIDER"
+
+try:
+    from PyQt5.QtDBus import QDBusConnection, QDBusInterface, QDBusMessage
+except ImportError:  # 部分发行版把 QtDBus 拆成了单独的包
+    QDBusConnection = QDBusInterface = None
+    QDBusMessage = object  # 只为下面的槽声明占位，此时 logind 提供者不会启动
+
+
+class SessionStateProvider(QObject):
+    """提供者基类：默认永远处于 active"""
+    state_changed = pyqtSignal(str)
+    name = 'none'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._state = ACTIVE
+
+    def start(self):
+        """开始监听，成功时返回 True"""
+        return True
+
+    def stop(self):
+        pass
+
+    def state(self):
+        return self._state
+
+    def set_state(self, state):
+        if state not in STATES:
+            raise ValueError("未知的会话状态 %r" % (state,))
+        if state != self._state:
+            self._state = state
+            self.state_changed.emit(state)
+
+
+class FakeSessionProvider(SessionStateProvider):
+    """手动切换状态的提供者"""
+    name = 'fake'
+
+
+class LogindSessionProvider(SessionStateProvider):
+    """systemd-logind：Lock/Unlock 信号加上 LockedHint/IdleHint 属性变化"""
+    name = 'logind'
+    SERVICE = 'org.freedesktop.login1'
+    MANAGER_PATH = '/org/freedesktop/login1'
+    MANAGER_INTERFACE = 'org.freedesktop.login1.Manager'
+    SESSION_INTERFACE = 'org.freedesktop.login1.Session'
+    PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.session_path = None
+        self._locked = False
+        self._idle = False
+
+    def start(self):
+        if QDBusConnection is None:
+            return False
+        bus = QDBusConnection.systemBus()
+        if not bus.isConnected():
+            return False
+        self.session_path = self.find_session(bus)
+        if self.session_path is None:
+            return False
+        connected = [
+            bus.connect(self.SERVICE, self.session_path, self.SESSION_INTERFACE, 'Lock', self.on_lock),
+            bus.connect(self.SERVICE, self.session_path, self.SESSION_INTERFACE, 'Unlock', self.on_unlock),
+            bus.connect(self.SERVICE, self.session_path, self.PROPERTIES_INTERFACE, 'PropertiesChanged',
+                        self.on_properties_changed),
+        ]
+        if not all(connected):
+            self.stop()
+            return False
+        properties = QDBusInterface(self.SERVICE, self.session_path, self.PROPERTIES_INTERFACE, bus)
+        self._locked = bool(self.read_property(properties, 'LockedHint'))
+        self._idle = bool(self.read_property(properties, 'IdleHint'))
+        self.update_state()
+        return True
+
+    def stop(self):
+        if QDBusConnection is None or self.session_path is None:
+            return
+        bus = QDBusConnection.systemBus()
+        bus.disconnect(self.SERVICE, self.session_path, self.SESSION_INTERFACE, 'Lock', self.on_lock)
+        bus.disconnect(self.SERVICE, self.session_path, self.SESSION_INTERFACE, 'Unlock', self.on_unlock)
+        bus.disconnect(self.SERVICE, self.session_path, self.PROPERTIES_INTERFACE, 'PropertiesChanged',
+                       self.on_properties_changed)
+        self.session_path = None
+
+    def find_session(self, bus):
+        """本进程所属会话的对象路径；信号里用的是真实路径，不能直接订阅 session/auto"""
+        manager = QDBusInterface(self.SERVICE, self.MANAGER_PATH, self.MANAGER_INTERFACE, bus)
+        for method, argument in (('GetSessionByPID', os.getpid()), ('GetSession', 'auto')):
+            reply = manager.call(method, argument)
+            if reply.type() == QDBusMessage.ReplyMessage and reply.arguments():
+                path = reply.arguments()[0]
+                return path.path() if hasattr(path, 'path') else str(path)
+        return None
+
+    def read_property(self, properties, name):
+        reply = properties.call('Get', self.SESSION_INTERFACE, name)
+        if reply.type() != QDBusMessage.ReplyMessage or not reply.arguments():
+            return None
+        value = reply.arguments()[0]
+        return value.variant() if hasattr(value, 'variant') else value
+
+    def update_state(self):
+        self.set_state(LOCKED if self._locked else IDLE if self._idle else ACTIVE)
+
+    @pyqtSlot()
+    def on_lock(self):
+        self._locked = True
+        self.update_state()
+
+    @pyqtSlot()
+    def on_unlock(self):
+        self._locked = False
+        self.update_state()
+
+    @pyqtSlot(QDBusMessage)
+    def on_properties_changed(self, message):
+        arguments = message.arguments()
+        if len(arguments) < 2 or arguments[0] != self.SESSION_INTERFACE:
+            return
+        changed = arguments[1]
+        if 'LockedHint' in changed:
+            self._locked = bool(changed['LockedHint'])
+        if 'IdleHint' in changed:
+            self._idle = bool(changed['IdleHint'])
+        self.update_state()
+
+
+PROVIDERS = {
+    'none': SessionStateProvider,
+    'fake': FakeSessionProvider,
+    'logind': LogindSessionProvider,
+}
+
+
+def create_provider(name=None, parent=None):
+    """按名称（或环境变量、平台默认）创建并启动提供者，启动失败时退回 none"""
+    name = name or os.environ.get(PROVIDER_ENV)
+    if name is None:
+        name = 'logind' if platform.system() == 'Linux' else 'none'
+    if name not in PROVIDERS:
+        raise ValueError("未知的会话状态提供者 %r，可选：%s" % (name, ', '.join(sorted(PROVIDERS))))
+    provider = PROVIDERS[name](parent)
+    if provider.start():
+        return provider
+    provider.deleteLater()
+    fallback = SessionStateProvider(parent)
+    fallback.start()
+    return fallback
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""设置的持久化存储
+
+启动时读取一次 JSON 文件，之后所有读取都走内存。写入先合并、去抖，
+停止变化一段时间后才把快照交给后台线程落盘；落盘写临时文件再 os.replace，
+中途崩溃或断电也不会留下写了一半的设置文件。
+
+文件格式：
+
+    {"version": 1, "settings": {...}}
+
+version 低于当前版本时按 MIGRATIONS 逐级升级。
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QStandardPaths, QTimer, pyqtSignal
+
+SCHEMA_VERSION = 1
+SETTINGS_ENV = "POPUPCLOCK_SETTINGS"
+
+DEFAULTS = {
+    'auto_start': False,
+    'animation_duration': 2000,
+    'stay_duration': 1500,
+    'drawer_animation': True,
+    'animation_mode': None,  # None 表示未设置，由命令行/环境变量或 classic 决定
+    'schedule_rules': [],
+    'time_second': '',
+    'time_minute': '',
+    'time_hour': '',
+    'time_week': '',
+    'dragged_pos': None,  # [x, y]
+    'drag_snap': True,  # 拖动时贴近屏幕边缘自动吸附
+    'snap_distance': 16,
+    'timing_mode': 'basic',  # basic 或 corrected，见 PopupClock.TIMING_MODES
+    'hand_render': None,  # None 表示未设置，由命令行/环境变量或 vector 决定
+    'hand_atlas_mb': 8,  # sprite 模式指针图集的内存上限
+}
+
+
+def migrate_v0(settings):
+    """版本 0：没有版本号的扁平字典，设置窗口曾用 move_speed/stay_time/animation_enabled 保存"""
+    renamed = {'move_speed': 'animation_duration', 'stay_time': 'stay_duration',
+               'animation_enabled': 'drawer_animation'}
+    migrated = {renamed.get(key, key): value for key, value in settings.items()}
+    if 'stay_time' in settings:
+        # stay_time 以秒为单位，stay_duration 是毫秒
+        try:
+            migrated['stay_duration'] = int(round(float(settings['stay_time']) * 1000))
+        except (TypeError, ValueError):
+            migrated.pop('stay_duration')
+    return migrated
+
+
+# 版本 n -> n+1 的升级函数
+MIGRATIONS = {0: migrate_v0}
+
+
+def default_path():
+    """设置文件位置：环境变量 POPUPCLOCK_SETTINGS 优先，否则放在系统配置目录下"""
+    path = os.environ.get(SETTINGS_ENV)
+    if path:
+        return path
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericConfigLocation)
+    if not base:
+        base = os.path.expanduser("~")
+    return os.path.join(base, "PopupClock", "settings.json")
+
+
+def write_atomic(path, text):
+    """写同目录下的临时文件，fsync 后替换目标文件"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.settings-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SettingsStore(QObject):
+    """内存中的设置字典 + 去抖的原子落盘
+
+    set/update 只在值确实变化时发出 changed(键, 新值)，调用方据此只重新配置
+    变化的部分。persist=False 时只存在内存里（基准测试等场景使用）。
+    """
+    changed = pyqtSignal(str, object)
+
+    def __init__(self, path=None, persist=True, debounce_ms=500, parent=None):
+        super().__init__(parent)
+        self.path = path or default_path()
+        self.persist = persist
+        self.values_ = dict(DEFAULTS)
+        self.stats = {'sets': 0, 'saves_requested': 0, 'writes': 0, 'write_ms': 0.0}
+        self.last_error = None
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(debounce_ms)
+        self._save_timer.timeout.connect(self.save)
+
+        self._lock = threading.Lock()
+        self._pending = None  # 等待后台线程写入的快照
+        self._writer = None
+
+        if persist:
+            self.load()
+
+    def load(self):
+        """读取设置文件；文件不存在或损坏时使用默认值"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.last_error = e
+            print("读取设置失败，使用默认值：%s" % e)
+            return
+        if not isinstance(data, dict):
+            return
+        if 'version' in data and isinstance(data.get('settings'), dict):
+            version, settings = data['version'], data['settings']
+        else:
+            version, settings = 0, data
+        while version < SCHEMA_VERSION:
+            settings = MIGRATIONS[version](settings)
+            version += 1
+        self.values_.update(settings)
+        if data.get('version') != SCHEMA_VERSION:
+            # 升级后的格式尽快写回
+            self.schedule_save()
+
+    def get(self, key, default=None):
+        return self.values_.get(key, default)
+
+    def values(self):
+        return dict(self.values_)
+
+    def set(self, key, value):
+        """设置单个值，值有变化时返回 True"""
+        return bool(self.update({key: value}))
+
+    def update(self, mapping):
+        """批量设置，返回实际变化的键；每个变化的键发出一次 changed"""
+        changed = [key for key, value in mapping.items() if self.values_.get(key) != value]
+        if not changed:
+            return []
+        self.stats['sets'] += 1
+        for key in changed:
+            self.values_[key] = mapping[key]
+        self.schedule_save()
+        for key in changed:
+            self.changed.emit(key, self.values_[key])
+        return changed
+
+    def schedule_save(self):
+        """（重新）开始去抖计时，连续修改只在最后一次之后写一次"""
+        if self.persist:
+            self.stats['saves_requested'] += 1
+            self._save_timer.start()
+
+    def snapshot(self):
+        return json.dumps({'version': SCHEMA_VERSION, 'settings': self.values_},
+                          ensure_ascii=False, indent=2, sort_keys=True)
+
+    def save(self):
+        """把当前快照交给后台线程写入；写入进行中时只保留最新的快照"""
+        if not self.persist:
+            return
+        self._save_timer.stop()
+        text = self.snapshot()
+        with self._lock:
+            self._pending = text
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._write_loop, name="settings-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                text, self._pending = self._pending, None
+                if text is None:
+                    self._writer = None
+                    return
+            start = time.perf_counter()
+            try:
+                write_atomic(self.path, text)
+            except OSError as e:
+                self.last_error = e
+                print("保存设置失败：%s" % e)
+                continue
+            self.stats['writes'] += 1
+            self.stats['write_ms'] += (time.perf_counter() - start) * 1000
+
+    def flush(self):
+        """立即写出尚未保存的修改并等待写入完成（退出前调用）"""
+        if not self.persist:
+            return
+        if self._save_timer.isActive():
+            self.save()
+        with self._lock:
+            writer = self._writer
+        if writer is not None:
+            writer.join()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""单实例与本地控制通道
+
+第一个启动的进程持有锁文件并在本地套接字上监听；之后再启动时只把命令
+交给它，收到回复就退出。这条路径只用到 QtCore/QtNetwork，不创建任何界面，
+也不加载界面相关的模块，登录脚本和热键程序可以直接这样控制时钟：
+
+    python PopupClock.py pop
+    python PopupClock.py toggle-always-show
+
+协议是一行 UTF-8 文本的命令，回复一行 "ok" 或 "error <原因>"。
+"""
+import getpass
+import os
+import sys
+import time
+
+from PyQt5.QtCore import QDir, QLockFile, QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+# show：弹出并保持显示；hide：收起；toggle-always-show：切换常显；
+# pop：像到点一样弹出一次，停留后自动收起；quit：退出
+COMMANDS = ('show', 'hide', 'toggle-always-show', 'pop', 'quit')
+# 没有带命令再次启动时发给已运行实例的命令
+DEFAULT_COMMAND = 'show'
+# 没有实例在运行时，这些命令不值得为它启动一个新的时钟
+EXIT_IF_NOT_RUNNING = ('hide', 'quit')
+
+# 指定实例名，可以同时运行互不干扰的多个时钟（基准测试也用它避开正在使用的时钟）
+INSTANCE_ENV = "POPUPCLOCK_INSTANCE"
+
+CONNECT_TIMEOUT_MS = 200
+REPLY_TIMEOUT_MS = 2000
+# 锁被占用但还连不上（另一个实例正在启动）时最多等待的时间
+STARTUP_WAIT_S = 3.0
+
+
+def instance_name():
+    """按用户区分的套接字名，不同用户各自有自己的时钟"""
+    if os.environ.get(INSTANCE_ENV):
+        return os.environ[INSTANCE_ENV]
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getuid()) if hasattr(os, 'getuid') else 'user'
+    return "PopupClock-%s" % ''.join(c if c.isalnum() else '_' for c in user)
+
+
+def lock_path():
+    return os.path.join(QDir.tempPath(), instance_name() + ".lock")
+
+
+def command_from_argv(argv):
+    """命令行里的命令（位置参数），没有时返回 None"""
+    for arg in argv[1:]:
+        if arg in COMMANDS:
+            return arg
+    return None
+
+
+def send_command(command, name=None, connect_timeout=CONNECT_TIMEOUT_MS):
+    """把命令发给正在运行的实例，返回回复文本；连不上时返回 None"""
+    socket = QLocalSocket()
+    socket.connectToServer(name or instance_name())
+    if not socket.waitForConnected(connect_timeout):
+        return None
+    socket.write((command + "\n").encode('utf-8'))
+    socket.waitForBytesWritten(REPLY_TIMEOUT_MS)
+    reply = b''
+    deadline = time.monotonic() + REPLY_TIMEOUT_MS / 1000.0
+    while not reply.endswith(b"\n") and time.monotonic() < deadline:
+        if not socket.waitForReadyRead(int(max(1, (deadline - time.monotonic()) * 1000))):
+            break
+        reply += bytes(socket.readAll())
+    socket.disconnectFromServer()
+    return reply.decode('utf-8', 'replace').strip() or "error 没有回复"
+
+
+def claim_or_forward(argv):
+    """成为主实例时返回持有的锁；已有实例时转交命令并退出进程"""
+    command = command_from_argv(argv) or DEFAULT_COMMAND
+    # 常见情况：实例已在运行，直接连上
+    reply = send_command(command)
+    if reply is None:
+        lock = QLockFile(lock_path())
+        lock.setStaleLockTime(0)  # 只按持有进程是否还活着判断锁是否失效
+        if lock.tryLock(0):
+            if command in EXIT_IF_NOT_RUNNING and command_from_argv(argv):
+                lock.unlock()
+                print("PopupClock 没有在运行")
+                sys.exit(1)
+            return lock
+        # 另一个实例持有锁但还没开始监听，等它启动完成
+        deadline = time.monotonic() + STARTUP_WAIT_S
+        while reply is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+            reply = send_command(command)
+        if reply is None:
+            print("PopupClock 实例没有响应")
+            sys.exit(1)
+    print(reply)
+    sys.exit(0 if reply == "ok" else 1)
+
+
+class ControlServer(QObject):
+    """主实例一侧：监听本地套接字，把收到的命令交给 handler，回复其返回值"""
+    command_received = pyqtSignal(str)
+
+    def __init__(self, handler, lock=None, name=None, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.lock = lock  # 进程存活期间一直持有
+        self.name = name or instance_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self):
+        # 上次异常退出可能留下了套接字文件；持有锁说明它已经没人用了
+        QLocalServer.removeServer(self.name)
+        if not self.server.listen(self.name):
+            print("控制通道监听失败：%s" % self.server.errorString())
+            return False
+        return True
+
+    def close(self):
+        self.server.close()
+        if self.lock is not None:
+            self.lock.unlock()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.buffer = b''
+            socket.readyRead.connect(lambda s=socket: self.on_ready_read(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def on_ready_read(self, socket):
+        socket.buffer += bytes(socket.readAll())
+        if b"\n" not in socket.buffer:
+            return
+        line, socket.buffer = socket.buffer.split(b"\n", 1)
+        command = line.decode('utf-8', 'replace').strip()
+        if command not in COMMANDS:
+            reply = "error 未知命令 %s" % command
+        else:
+            self.command_received.emit(command)
+            reply = self.handler(command) or "ok"
+        socket.write((reply + "\n").encode('utf-8'))
+        socket.flush()
@@ -0,0 +1,14 @@
+import os
+import sys
+
+# 测试直接导入仓库根目录下的模块
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """SettingsStore 的去抖定时器需要一个应用对象"""
+    return QCoreApplication.instance() or QCoreApplication([])
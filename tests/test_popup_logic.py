@@ -0,0 +1,197 @@
+"""时间规则、设置迁移和显示状态机这几块纯逻辑的测试"""
+import json
+
+import pytest
+
+import popup_state
+from popup_schedule import DAY, WEEK, PopupSchedule, parse_field, week_seconds
+from settings_store import SCHEMA_VERSION, SettingsStore, migrate_v0
+
+
+def week(text):
+    return parse_field(text, 1, 7, 'week')
+
+
+# ---- 周字段 ----
+
+@pytest.mark.parametrize('text, expected', [
+    ('0', (7,)),
+    ('7', (7,)),
+    ('0,7', (7,)),
+    ('0-6', (1, 2, 3, 4, 5, 6, 7)),
+    ('0-3', (1, 2, 3, 7)),
+    ('1-5', (1, 2, 3, 4, 5)),
+    ('*', (1, 2, 3, 4, 5, 6, 7)),
+    ('*/2', (1, 3, 5, 7)),
+])
+def test_week_field_sunday_is_zero_or_seven(text, expected):
+    assert week(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5-1', (1, 5, 6, 7)),  # 周五到周一
+    ('5-0', (5, 6, 7)),  # 周五到周日
+    ('6-2', (1, 2, 6, 7)),
+    ('5-1/2', (5, 7)),  # 步长沿着绕过周末后的顺序数
+])
+def test_week_range_wraps_past_end_of_week(text, expected):
+    assert week(text) == expected
+
+
+@pytest.mark.parametrize('text', ['8', '-1', '0-8'])
+def test_week_field_out_of_range(text):
+    with pytest.raises(ValueError):
+        week(text)
+
+
+def test_reversed_range_only_wraps_for_week():
+    with pytest.raises(ValueError):
+        parse_field('30-10', 0, 59, 'minute')
+
+
+def test_sunday_rule_lands_at_end_of_week():
+    schedule = PopupSchedule(["0 0 12 0 lead=0 trail=60"])
+    noon_sunday = week_seconds(7, 12, 0, 0)
+    assert schedule.intervals == [(noon_sunday, noon_sunday + 60)]
+
+
+# ---- 跨越周日 24:00 的时段 ----
+
+@pytest.fixture
+def midnight():
+    """周一 00:00:00 前后各 30 秒，时段跨过周边界"""
+    return PopupSchedule(["0 0 0 1"])
+
+
+def test_interval_split_at_week_boundary(midnight):
+    assert midnight.intervals == [(0, 30), (WEEK - 30, WEEK)]
+    assert midnight.wraps
+    assert midnight.contains(WEEK - 10) and midnight.contains(10)
+    assert not midnight.contains(WEEK - 31) and not midnight.contains(30)
+
+
+def test_next_edge_across_sunday_midnight(midnight):
+    assert midnight.next_edge(WEEK - 40) == (10, 'show')
+    # 周边界上的假边界被跳过，下一个是周一 00:00:30 收起
+    assert midnight.next_edge(WEEK - 10) == (40, 'hide')
+    assert midnight.next_edge(10) == (20, 'hide')
+    assert midnight.next_edge(40) == (WEEK - 70, 'show')
+    assert midnight.next_edge(WEEK - 40, kind='hide') == (70, 'hide')
+
+
+def test_crossed_across_sunday_midnight(midnight):
+    assert midnight.crossed(WEEK - 40, 10)  # 跨过显示边界
+    assert not midnight.crossed(WEEK - 10, 10)  # 只跨过周边界
+    assert midnight.crossed(WEEK - 10, 40)  # 跨过收起边界
+    assert not midnight.crossed(100, DAY)
+
+
+def test_window_end_follows_wrapped_interval(midnight):
+    assert midnight.window_end(WEEK - 10) == WEEK + 30
+    assert midnight.window_end(100) is None
+
+
+# ---- 设置迁移 ----
+
+def test_migrate_v0_renames_and_converts_units():
+    migrated = migrate_v0({'move_speed': 800, 'stay_time': 3, 'animation_enabled': False, 'time_hour': '9'})
+    assert migrated == {'animation_duration': 800, 'stay_duration': 3000, 'drawer_animation': False,
+                        'time_hour': '9'}
+
+
+def test_migrate_v0_drops_unusable_stay_time():
+    assert 'stay_duration' not in migrate_v0({'stay_time': 'abc'})
+
+
+def test_v0_file_loads_migrated_and_is_rewritten(qapp, tmp_path):
+    path = tmp_path / 'settings.json'
+    path.write_text(json.dumps({'move_speed': 700, 'stay_time': 2.5}), encoding='utf-8')
+    store = SettingsStore(str(path))
+    assert store.get('animation_duration') == 700
+    assert store.get('stay_duration') == 2500
+    store.flush()
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data['version'] == SCHEMA_VERSION
+    assert data['settings']['stay_duration'] == 2500
+    assert 'stay_time' not in data['settings']
+
+
+# ---- 显示状态机 ----
+
+@pytest.fixture
+def machine():
+    changes = []
+    m = popup_state.PopupStateMachine(clock=lambda: 0.0)
+    m.state_changed.connect(lambda old, new: changes.append((old, new)))
+    m.changes = changes
+    return m
+
+
+def test_normal_cycle(machine):
+    machine.request(popup_state.SHOW)
+    machine.transition_done('enter')
+    machine.request(popup_state.HIDE)
+    machine.transition_done('exit')
+    assert machine.changes == [('hidden', 'entering'), ('entering', 'shown'),
+                               ('shown', 'exiting'), ('exiting', 'hidden')]
+
+
+@pytest.mark.parametrize('state, intent', [
+    (popup_state.HIDDEN, popup_state.HIDE),
+    (popup_state.SHOWN, popup_state.SHOW),
+])
+def test_intent_for_current_state_is_a_no_op(machine, state, intent):
+    machine.force(state)
+    del machine.changes[:]
+    machine.request(intent)
+    assert machine.state == state and machine.changes == []
+
+
+@pytest.mark.parametrize('state, group', [
+    (popup_state.HIDDEN, 'enter'),
+    (popup_state.SHOWN, 'exit'),
+    (popup_state.ENTERING, 'exit'),  # 例如重建动画组时停掉的旧组
+    (popup_state.EXITING, 'enter'),
+])
+def test_mismatched_transition_done_is_ignored(machine, state, group):
+    machine.force(state)
+    machine.transition_done(group)
+    assert machine.state == state
+
+
+def test_settled_states_have_no_done_transition():
+    assert (popup_state.HIDDEN, 'done') not in popup_state.TRANSITIONS
+    assert (popup_state.SHOWN, 'done') not in popup_state.TRANSITIONS
+
+
+def test_unknown_intent_and_state_raise(machine):
+    with pytest.raises(ValueError):
+        machine.request('toggle')
+    with pytest.raises(ValueError):
+        machine.force('minimized')
+
+
+def test_intents_during_transition_coalesce(machine):
+    machine.request(popup_state.SHOW)
+    machine.request(popup_state.HIDE)
+    machine.request(popup_state.SHOW)  # 先 hide 再 show，相互抵消
+    machine.transition_done('enter')
+    assert machine.state == popup_state.SHOWN
+    assert machine.stats['queued'] == 1 and machine.stats['coalesced'] == 1
+
+
+def test_hide_ignored_while_pinned_until_unpin(machine):
+    machine.request(popup_state.PIN)
+    machine.transition_done('enter')
+    machine.request(popup_state.HIDE)
+    assert machine.state == popup_state.SHOWN
+    machine.request(popup_state.UNPIN)
+    machine.request(popup_state.HIDE)
+    assert machine.state == popup_state.EXITING
+
+
+def test_closed_machine_never_shows_again(machine):
+    machine.close()
+    machine.request(popup_state.SHOW)
+    machine.request(popup_state.PIN)
+    assert machine.state == popup_state.HIDDEN
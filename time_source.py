@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""时间源
+
+PopupClockClass 读取当前时间、设定定时器、推进过渡动画都经过时间源：
+
+    SystemTimeSource  真实时间，QTimer 和 Qt 自己的动画计时
+    VirtualClock      虚拟时间，不依赖事件循环，由调用方推进
+
+虚拟时钟自己维护一个按到期时刻排序的定时器队列，run_until() 每次直接跳到
+下一个到期的定时器；有过渡动画在运行时按 frame_ms 一帧一帧地推进动画的
+currentTime。整个过程不进入 Qt 事件循环（每一步只处理已经排队的事件），
+模拟一天只需要几秒，而且每次运行的结果完全相同，见 clock_sim.py。
+"""
+import heapq
+import itertools
+import time
+
+from PyQt5 import sip
+from PyQt5.QtCore import (QAbstractAnimation, QCoreApplication, QDateTime, QEvent, QEventLoop, QObject, QTimer,
+                          pyqtSignal)
+
+
+class SystemTimeSource:
+    """真实时间"""
+    virtual = False
+
+    def now(self):
+        return QDateTime.currentDateTime()
+
+    def wall_ms(self):
+        """墙上时间（epoch 毫秒，带小数）"""
+        return time.time() * 1000.0
+
+    def monotonic(self):
+        """单调时钟（秒）"""
+        return time.perf_counter()
+
+    def single_shot(self, msec, callback):
+        QTimer.singleShot(msec, callback)
+
+    def create_timer(self, parent=None):
+        return QTimer(parent)
+
+    def track_animation(self, group):
+        """动画由 Qt 按真实时间驱动，不需要登记"""
+
+    def spin_until(self, target_wall_ms, limit_ms):
+        """忙等到墙上时间到达 target_wall_ms；同时用单调时钟限制最长 limit_ms，系统时间被往回调也不会卡住"""
+        deadline = time.perf_counter() + limit_ms / 1000.0
+        while self.wall_ms() < target_wall_ms and time.perf_counter() < deadline:
+            pass
+
+
+class VirtualTimer(QObject):
+    """与 QTimer 接口相同（PopupClockClass 用到的部分），到期由 VirtualClock 触发"""
+    timeout = pyqtSignal()
+
+    def __init__(self, clock, parent=None):
+        super().__init__(parent)
+        self.clock = clock
+        self.single_shot = False
+        self.interval_ms = 0
+        self.entry = None
+
+    def setSingleShot(self, single_shot):
+        self.single_shot = single_shot
+
+    def isSingleShot(self):
+        return self.single_shot
+
+    def setTimerType(self, timer_type):
+        pass  # 虚拟时间里所有定时器都是精确的
+
+    def setInterval(self, msec):
+        self.interval_ms = msec
+
+    def interval(self):
+        return self.interval_ms
+
+    def start(self, msec=None):
+        if msec is not None:
+            self.interval_ms = msec
+        self.stop()
+        self.entry = self.clock.schedule(self.interval_ms, self.fire)
+
+    def stop(self):
+        if self.entry is not None:
+            self.clock.cancel(self.entry)
+            self.entry = None
+
+    def isActive(self):
+        return self.entry is not None
+
+    def remainingTime(self):
+        if self.entry is None:
+            return -1
+        return max(0, self.entry[0] - self.clock.elapsed_ms)
+
+    def fire(self):
+        self.entry = None
+        if not self.single_shot:
+            self.entry = self.clock.schedule(self.interval_ms, self.fire)
+        self.timeout.emit()
+
+
+class VirtualClock:
+    """可以快进的虚拟时钟
+
+    start 为起始的本地时间（QDateTime），elapsed_ms 为从起点走过的毫秒数。
+    """
+    virtual = True
+
+    def __init__(self, start=None, frame_ms=16):
+        self.start = start if start is not None else QDateTime.currentDateTime()
+        self.start_ms = self.start.toMSecsSinceEpoch()
+        self.frame_ms = frame_ms
+        self.elapsed_ms = 0
+        self.queue = []  # [到期时刻, 序号, 回调, 是否有效]
+        self.sequence = itertools.count()
+        self.animations = []
+        self.stats = {'timers': 0, 'frames': 0}
+
+    def now(self):
+        return QDateTime.fromMSecsSinceEpoch(self.start_ms + self.elapsed_ms)
+
+    def wall_ms(self):
+        return float(self.start_ms + self.elapsed_ms)
+
+    def monotonic(self):
+        return self.elapsed_ms / 1000.0
+
+    def schedule(self, msec, callback):
+        entry = [self.elapsed_ms + max(0, int(msec)), next(self.sequence), callback, True]
+        heapq.heappush(self.queue, entry)
+        return entry
+
+    @staticmethod
+    def cancel(entry):
+        entry[3] = False
+
+    def single_shot(self, msec, callback):
+        self.schedule(msec, callback)
+
+    def create_timer(self, parent=None):
+        return VirtualTimer(self, parent)
+
+    def track_animation(self, group):
+        self.animations.append(group)
+
+    def spin_until(self, target_wall_ms, limit_ms):
+        """虚拟的忙等：直接把时间拨到目标时刻（最多 limit_ms）"""
+        step = min(max(0.0, target_wall_ms - self.wall_ms()), limit_ms)
+        self.elapsed_ms += int(round(step))
+
+    def running_animations(self):
+        self.animations = [group for group in self.animations if not sip.isdeleted(group)]
+        return [group for group in self.animations if group.state() == QAbstractAnimation.Running]
+
+    def next_due(self):
+        while self.queue and not self.queue[0][3]:
+            heapq.heappop(self.queue)
+        return self.queue[0][0] if self.queue else None
+
+    def run_due(self):
+        """触发所有已到期的定时器，包括回调里新设的 0 毫秒定时器"""
+        while True:
+            due = self.next_due()
+            if due is None or due > self.elapsed_ms:
+                return
+            entry = heapq.heappop(self.queue)
+            self.stats['timers'] += 1
+            entry[2]()
+
+    def run_until(self, elapsed_ms):
+        """把虚拟时间推进到 elapsed_ms，沿途触发定时器、推进动画"""
+        self.run_due()
+        while self.elapsed_ms < elapsed_ms:
+            running = self.running_animations()
+            target = elapsed_ms
+            due = self.next_due()
+            if due is not None:
+                target = min(target, due)
+            if running:
+                target = min(target, self.elapsed_ms + self.frame_ms)
+            # 虚拟忙等可能已经把时间拨过了某些定时器的到期时刻
+            target = max(target, self.elapsed_ms)
+            step = target - self.elapsed_ms
+            self.elapsed_ms = target
+            for group in running:
+                # 推进过程中可能被别的回调停止或删除
+                if not sip.isdeleted(group) and group.state() == QAbstractAnimation.Running:
+                    group.setCurrentTime(group.currentTime() + step)
+            if running:
+                self.stats['frames'] += 1
+            self.run_due()
+            # 不进入事件循环，但要处理已经排队的事件：窗口移动/透明度变化产生的窗口系统事件、
+            # 排队调用（PyQt 断开已删除对象上的槽靠它）和 deleteLater，否则长时间模拟时会一直堆积
+            QCoreApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+            QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def advance(self, msec):
+        self.run_until(self.elapsed_ms + int(msec))